@@ -0,0 +1,5 @@
+"""Mark the 'benchmarks' directory as a package.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
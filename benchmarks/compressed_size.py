@@ -0,0 +1,190 @@
+"""Compare the compressed size of each output format on a fixed corpus.
+
+Run from the repository root::
+
+    python benchmarks/compressed_size.py
+
+The corpus is built from a fixed seed, so every run on every machine formats the
+same paths. There are three kinds:
+
+    * glyphs: TrueType-style quadratic outlines, degree elevated to cubics and
+      written at 3 digits, as font converters write them
+    * icons: rows of repeated rounded rectangles and circles with arcs, where
+      relative commands repeat wherever a shape repeats
+    * traces: smooth closed cubic outlines on integer coordinates, as tracers
+      like potrace write them
+
+Each path is formatted with each function and compressed alone, with zlib at
+level 9 and with brotli if it is installed. The total bytes for each are printed.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+import zlib
+from typing import TYPE_CHECKING, cast
+
+from svg_path_data import (
+    format_svgd_absolute,
+    format_svgd_compressed,
+    format_svgd_relative,
+    format_svgd_shortest,
+    get_svgd_from_cpts,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_SEED = 44
+
+_NUM_EACH = 200
+
+_RESOLUTIONS = (None, 2)
+
+_FORMATS: dict[str, Callable[[str, int | None], str]] = {
+    "absolute": format_svgd_absolute,
+    "relative": format_svgd_relative,
+    "shortest": format_svgd_shortest,
+    "compressed": format_svgd_compressed,
+}
+
+
+def _get_brotli_compress() -> Callable[[bytes], bytes] | None:
+    """Get the brotli compress function if brotli is installed.
+
+    :return: brotli.compress or None
+    """
+    try:
+        import brotli  # noqa: PLC0415  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None
+    compress = brotli.compress  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+    return cast("Callable[[bytes], bytes]", compress)
+
+
+def _make_glyph(rng: random.Random) -> str:
+    """Make a font glyph: quadratic contours written as elevated cubics.
+
+    :param rng: the source of randomness
+    :return: an SVG path data string with 1 to 3 contours
+    """
+    cpts: list[list[tuple[float, float]]] = []
+    for _ in range(rng.randint(1, 3)):
+        num_on = rng.randint(4, 14)
+        cx, cy = rng.randint(200, 800), rng.randint(200, 800)
+        pts: list[tuple[float, float]] = []
+        for i in range(num_on * 2):
+            angle = math.pi * i / num_on
+            radius = 300 * rng.uniform(0.5, 1)
+            pts.append(
+                (cx + int(radius * math.cos(angle)), cy + int(radius * math.sin(angle)))
+            )
+        on_curve, off_curve = pts[::2], pts[1::2]
+        for i, (p0, q) in enumerate(zip(on_curve, off_curve, strict=True)):
+            p3 = on_curve[(i + 1) % num_on]
+            if rng.random() < 0.2:
+                cpts.append([p0, p3])
+                continue
+            p1 = (p0[0] + 2 / 3 * (q[0] - p0[0]), p0[1] + 2 / 3 * (q[1] - p0[1]))
+            p2 = (p3[0] + 2 / 3 * (q[0] - p3[0]), p3[1] + 2 / 3 * (q[1] - p3[1]))
+            cpts.append([p0, p1, p2, p3])
+    return get_svgd_from_cpts(cpts, 3)
+
+
+def _make_icon(rng: random.Random) -> str:
+    """Make an icon: a grid of the same rounded rectangle or circle.
+
+    :param rng: the source of randomness
+    :return: an SVG path data string with one subpath per shape
+    """
+    size = rng.uniform(2, 6)
+    radius = size * rng.uniform(0.1, 0.4)
+    gap = size * rng.uniform(1.2, 2)
+    x0, y0 = rng.uniform(0, 4), rng.uniform(0, 4)
+    shapes: list[str] = []
+    is_circle = rng.random() < 0.5
+    for row in range(rng.randint(1, 4)):
+        for col in range(rng.randint(2, 6)):
+            x, y = x0 + col * gap, y0 + row * gap
+            if is_circle:
+                r = size / 2
+                shapes.append(
+                    f"M{x} {y + r}A{r} {r} 0 1 1 {x + size} {y + r}"
+                    + f"A{r} {r} 0 1 1 {x} {y + r}Z"
+                )
+                continue
+            far_x, far_y = x + size, y + size
+            shapes.append(
+                f"M{x + radius} {y}L{far_x - radius} {y}"
+                + f"A{radius} {radius} 0 0 1 {far_x} {y + radius}"
+                + f"L{far_x} {far_y - radius}"
+                + f"A{radius} {radius} 0 0 1 {far_x - radius} {far_y}"
+                + f"L{x + radius} {far_y}"
+                + f"A{radius} {radius} 0 0 1 {x} {far_y - radius}"
+                + f"L{x} {y + radius}"
+                + f"A{radius} {radius} 0 0 1 {x + radius} {y}Z"
+            )
+    return "".join(shapes)
+
+
+def _make_trace(rng: random.Random) -> str:
+    """Make a traced outline: a smooth closed curve on integer coordinates.
+
+    :param rng: the source of randomness
+    :return: an SVG path data string with one closed subpath of cubic curves
+    """
+    num_pts = rng.randint(6, 30)
+    cx, cy = rng.randint(100, 900), rng.randint(100, 900)
+    pts: list[tuple[float, float]] = []
+    for i in range(num_pts):
+        angle = 2 * math.pi * i / num_pts
+        radius = 80 * rng.uniform(0.6, 1)
+        pts.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
+    cpts: list[list[tuple[float, float]]] = []
+    for i, p0 in enumerate(pts):
+        before, p3, after = pts[i - 1], pts[(i + 1) % num_pts], pts[(i + 2) % num_pts]
+        p1 = (p0[0] + (p3[0] - before[0]) / 6, p0[1] + (p3[1] - before[1]) / 6)
+        p2 = (p3[0] - (after[0] - p0[0]) / 6, p3[1] - (after[1] - p0[1]) / 6)
+        cpts.append([p0, p1, p2, p3])
+    return get_svgd_from_cpts(cpts, 0)
+
+
+def get_corpus() -> list[str]:
+    """Get the benchmark paths.
+
+    :return: the same SVG path data strings on every call
+    """
+    rng = random.Random(_SEED)  # noqa: S311
+    makers = (_make_glyph, _make_icon, _make_trace)
+    return [make(rng) for make in makers for _ in range(_NUM_EACH)]
+
+
+def main() -> None:
+    """Print the raw and compressed bytes of each format at each resolution."""
+    corpus = get_corpus()
+    brotli_compress = _get_brotli_compress()
+    header = f"{'resolution':>10} {'format':>10} {'raw':>8} {'zlib':>8}"
+    if brotli_compress is not None:
+        header += f" {'brotli':>8}"
+    print(f"{len(corpus)} paths, {sum(map(len, corpus))} bytes")  # noqa: T201
+    print(header + f" {'seconds':>8}")  # noqa: T201
+    for resolution in _RESOLUTIONS:
+        for name, format_svgd in _FORMATS.items():
+            start = time.perf_counter()
+            svgds = [format_svgd(x, resolution) for x in corpus]
+            seconds = time.perf_counter() - start
+            encoded = [x.encode() for x in svgds]
+            line = f"{resolution!s:>10} {name:>10} {sum(map(len, encoded)):8}"
+            line += f" {sum(len(zlib.compress(x, 9)) for x in encoded):8}"
+            if brotli_compress is not None:
+                line += f" {sum(len(brotli_compress(x)) for x in encoded):8}"
+            print(f"{line} {seconds:8.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
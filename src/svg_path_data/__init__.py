@@ -4,26 +4,88 @@
 :created: 2025-07-02
 """
 
+from svg_path_data.cache import SvgdCache
+from svg_path_data.clip import clip_to_rect
+from svg_path_data.error_budget import ErrorBudget, ResolutionChoice
 from svg_path_data.float_string_conversion import (
     format_as_exponential,
     format_as_fixed_point,
     format_number,
 )
+from svg_path_data.frames import FrameSequence
+from svg_path_data.incremental import aiter_cpts_from_svgd
+from svg_path_data.parallel import format_svgd_many_threaded, format_svgd_parallel
+from svg_path_data.points import (
+    format_points,
+    get_points_from_svgd,
+    get_svgd_from_points,
+    parse_points,
+)
+from svg_path_data.polyline import FlatPath, flatten
+from svg_path_data.reorder import reorder_subpaths, reorder_svgd
+from svg_path_data.spatial import SegmentIndex
+from svg_path_data.string_ops import concat_svgd, is_valid_svgd, validate_svgd
 from svg_path_data.svg_data import (
+    RelativeOrAbsolute,
+    SvgdParser,
+    choose_resolution,
+    choose_resolution_for_cpts,
+    convert,
     format_svgd_absolute,
+    format_svgd_compressed,
     format_svgd_relative,
+    format_svgd_resolutions,
     format_svgd_shortest,
     get_cpts_from_svgd,
     get_svgd_from_cpts,
+    iter_cpts_from_svgd,
+    iter_subpaths,
+    write_svgd,
+)
+from svg_path_data.vertices_codes import (
+    get_svgd_from_vertices_codes,
+    get_vertices_codes_from_svgd,
 )
 
 __all__ = [
+    "ErrorBudget",
+    "FlatPath",
+    "FrameSequence",
+    "RelativeOrAbsolute",
+    "ResolutionChoice",
+    "SegmentIndex",
+    "SvgdCache",
+    "SvgdParser",
+    "aiter_cpts_from_svgd",
+    "choose_resolution",
+    "choose_resolution_for_cpts",
+    "clip_to_rect",
+    "concat_svgd",
+    "convert",
+    "flatten",
     "format_as_exponential",
     "format_as_fixed_point",
     "format_number",
+    "format_points",
     "format_svgd_absolute",
+    "format_svgd_compressed",
+    "format_svgd_many_threaded",
+    "format_svgd_parallel",
     "format_svgd_relative",
+    "format_svgd_resolutions",
     "format_svgd_shortest",
     "get_cpts_from_svgd",
+    "get_points_from_svgd",
     "get_svgd_from_cpts",
+    "get_svgd_from_points",
+    "get_svgd_from_vertices_codes",
+    "get_vertices_codes_from_svgd",
+    "is_valid_svgd",
+    "iter_cpts_from_svgd",
+    "iter_subpaths",
+    "parse_points",
+    "reorder_subpaths",
+    "reorder_svgd",
+    "validate_svgd",
+    "write_svgd",
 ]
@@ -0,0 +1,116 @@
+"""A uniform grid for spatial searches over points or bounding boxes.
+
+`SegmentIndex` registers segment bounding boxes in this grid, and subpath
+reordering registers end points. Both search rings of cells outward from a query
+point, so the grid sizing and the ring search live here.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_Bbox = tuple[float, float, float, float]
+_Cell = tuple[int, int]
+
+
+class UniformGrid:
+    """Square cells over a bounding box, about one cell per item.
+
+    The grid only maps points to cells. Callers keep their own dict of cell
+    contents. Points outside the box fall into the edge cells.
+    """
+
+    def __init__(self, bbox: _Bbox, count: int) -> None:
+        """Size a grid.
+
+        :param bbox: min_x, min_y, max_x, max_y of everything to index
+        :param count: the number of items to index
+        """
+        self.min_x, self.min_y, max_x, max_y = bbox
+        width = max_x - self.min_x
+        height = max_y - self.min_y
+        count = max(count, 1)
+        if width and height:
+            self.cell_size = math.sqrt(width * height / count)
+        else:
+            self.cell_size = (width or height or 1.0) / count
+        self.cols = max(math.ceil(width / self.cell_size), 1)
+        self.rows = max(math.ceil(height / self.cell_size), 1)
+
+    def get_cell(self, point: tuple[float, float]) -> _Cell:
+        """Get the grid cell of a point, clamped to the grid.
+
+        :param point: an xy point
+        :return: the column and row of the cell
+        """
+        col = (point[0] - self.min_x) / self.cell_size
+        row = (point[1] - self.min_y) / self.cell_size
+        col = min(max(col, 0), self.cols - 1)
+        row = min(max(row, 0), self.rows - 1)
+        return math.floor(col), math.floor(row)
+
+    def iter_cells(self, bbox: _Bbox) -> Iterator[_Cell]:
+        """Iterate over the grid cells a bounding box touches.
+
+        :param bbox: min_x, min_y, max_x, max_y
+        :return: None
+        :yield: the column and row of each cell
+        """
+        col_0, row_0 = self.get_cell((bbox[0], bbox[1]))
+        col_1, row_1 = self.get_cell((bbox[2], bbox[3]))
+        for col in range(col_0, col_1 + 1):
+            for row in range(row_0, row_1 + 1):
+                yield col, row
+
+    def iter_ring(self, col: int, row: int, ring: int) -> Iterator[_Cell]:
+        """Iterate over the cells at a Chebyshev distance from a cell.
+
+        :param col: the column of the center cell
+        :param row: the row of the center cell
+        :param ring: the distance in cells. Ring 0 is the center cell.
+        :return: None
+        :yield: each cell of the ring inside the grid
+        """
+        if ring == 0:
+            yield col, row
+            return
+        col_0, col_1 = max(col - ring, 0), min(col + ring, self.cols - 1)
+        row_0, row_1 = max(row - ring, 0), min(row + ring, self.rows - 1)
+        for r in {row - ring, row + ring} & {row_0, row_1}:
+            for c in range(col_0, col_1 + 1):
+                yield c, r
+        for c in {col - ring, col + ring} & {col_0, col_1}:
+            for r in range(max(row - ring + 1, 0), min(row + ring, self.rows)):
+                yield c, r
+
+    def get_unvisited_distance(
+        self, point: tuple[float, float], col: int, row: int, ring: int
+    ) -> float:
+        """Get the least distance from a point to any cell outside a ring.
+
+        :param point: the query point
+        :param col: the column of the center cell
+        :param row: the row of the center cell
+        :param ring: the last ring visited
+        :return: a lower bound on the distance to anything in an unvisited cell.
+            This is infinite once the rings cover the grid.
+        """
+        px, py = point
+        size = self.cell_size
+        bounds = [math.inf]
+        if col - ring > 0:
+            bounds.append(px - (self.min_x + (col - ring) * size))
+        if col + ring < self.cols - 1:
+            bounds.append(self.min_x + (col + ring + 1) * size - px)
+        if row - ring > 0:
+            bounds.append(py - (self.min_y + (row - ring) * size))
+        if row + ring < self.rows - 1:
+            bounds.append(self.min_y + (row + ring + 1) * size - py)
+        return min(bounds)
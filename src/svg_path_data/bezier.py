@@ -0,0 +1,271 @@
+"""Evaluate and measure Bezier curves given as lists of control points.
+
+Curves are lists of xy tuples in the format returned by `get_cpts_from_svgd`: two
+points for a line, three for a quadratic, four for a cubic. Everything here is
+pure Python and exact where a closed form is cheap (extrema, line distances).
+Nearest points and axis crossings are refined numerically on pieces of the curve
+that hold one answer, so they are as precise as floats allow.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import itertools as it
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Samples per curve before refining the nearest point. Enough to bracket the
+# nearest point on any quadratic or cubic a path editor will see.
+_NEAREST_SAMPLES = 16
+
+# Bisection steps. Each halves the interval, so 52 reaches float precision on
+# [0, 1].
+_BISECTION_STEPS = 52
+
+# Ternary search steps. Each keeps 2/3 of the interval, so 40 shrink the 1/8
+# bracket around the nearest sample to about 1e-8. Near the minimum, distance
+# changes with the square of the time offset, so distances as floats stop telling
+# times apart at about the square root of float precision, 1.5e-8.
+_TERNARY_STEPS = 40
+
+
+def get_point(cpts: Sequence[tuple[float, float]], time: float) -> tuple[float, float]:
+    """Evaluate a Bezier curve with de Casteljau's algorithm.
+
+    :param cpts: control points of a Bezier curve of any degree
+    :param time: the curve parameter, 0 at the first point and 1 at the last
+    :return: the point on the curve at time
+    """
+    pts: list[tuple[float, float]] = list(cpts)
+    while len(pts) > 1:
+        pts = [
+            (ax + (bx - ax) * time, ay + (by - ay) * time)
+            for (ax, ay), (bx, by) in it.pairwise(pts)
+        ]
+    return pts[0]
+
+
+def _get_value(values: Sequence[float], time: float) -> float:
+    """Evaluate one coordinate of a Bezier curve.
+
+    :param values: one coordinate of each control point
+    :param time: the curve parameter
+    :return: the coordinate at time
+    """
+    vals: list[float] = list(values)
+    while len(vals) > 1:
+        vals = [a + (b - a) * time for a, b in it.pairwise(vals)]
+    return vals[0]
+
+
+def get_extrema_times(values: Sequence[float]) -> list[float]:
+    """Get the times strictly between 0 and 1 where one coordinate turns around.
+
+    :param values: one coordinate of each control point of a line, quadratic, or
+        cubic Bezier curve
+    :return: sorted times where the derivative of that coordinate is zero
+    :raises ValueError: if the curve is of a higher degree than cubic
+    """
+    if len(values) == 2:
+        return []
+    if len(values) == 3:
+        p0, p1, p2 = values
+        denom = p0 - 2 * p1 + p2
+        roots = [(p0 - p1) / denom] if denom else []
+    elif len(values) == 4:
+        a, b, c = (y - x for x, y in it.pairwise(values))
+        roots = _solve_quadratic(a - 2 * b + c, 2 * (b - a), a)
+    else:
+        msg = "Only lines, quadratic, and cubic curves are supported."
+        raise ValueError(msg)
+    return sorted(t for t in roots if 0 < t < 1)
+
+
+def _solve_quadratic(a: float, b: float, c: float) -> list[float]:
+    """Get the real roots of a * t**2 + b * t + c.
+
+    :param a: the coefficient of t**2
+    :param b: the coefficient of t
+    :param c: the constant term
+    :return: the real roots. A degenerate equation has one or no roots.
+    """
+    if not a:
+        return [-c / b] if b else []
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return []
+    # avoid cancellation in -b + sqrt(d) when b is large
+    q = -0.5 * (b + math.copysign(math.sqrt(discriminant), b))
+    if not q:
+        return [0.0]
+    return [q / a, c / q]
+
+
+def get_bbox(
+    cpts: Sequence[tuple[float, float]],
+) -> tuple[float, float, float, float]:
+    """Get the tight bounding box of a Bezier curve.
+
+    :param cpts: control points of a line, quadratic, or cubic Bezier curve
+    :return: min_x, min_y, max_x, max_y of the curve (not of its control points)
+    """
+    xs = [x for x, _ in cpts]
+    ys = [y for _, y in cpts]
+    bbox_xs = [xs[0], xs[-1], *(_get_value(xs, t) for t in get_extrema_times(xs))]
+    bbox_ys = [ys[0], ys[-1], *(_get_value(ys, t) for t in get_extrema_times(ys))]
+    return min(bbox_xs), min(bbox_ys), max(bbox_xs), max(bbox_ys)
+
+
+def get_nearest_time(
+    cpts: Sequence[tuple[float, float]], point: tuple[float, float]
+) -> tuple[float, float]:
+    """Get the point on a Bezier curve nearest to a given point.
+
+    :param cpts: control points of a line, quadratic, or cubic Bezier curve
+    :param point: the point to measure from
+    :return: the curve time of the nearest point and its distance from point
+
+    Lines are solved exactly. Curves are sampled, and the nearest sample is
+    refined by a ternary search between its neighbors.
+    """
+    px, py = point
+
+    def dist(time: float) -> float:
+        x, y = get_point(cpts, time)
+        return math.hypot(x - px, y - py)
+
+    if len(cpts) == 2:
+        (ax, ay), (bx, by) = cpts
+        vx, vy = bx - ax, by - ay
+        length_sq = vx * vx + vy * vy
+        time = 0.0
+        if length_sq:
+            time = min(max(((px - ax) * vx + (py - ay) * vy) / length_sq, 0.0), 1.0)
+        return time, dist(time)
+
+    samples = [i / _NEAREST_SAMPLES for i in range(_NEAREST_SAMPLES + 1)]
+    best = min(range(len(samples)), key=lambda i: dist(samples[i]))
+    lo = samples[max(best - 1, 0)]
+    hi = samples[min(best + 1, _NEAREST_SAMPLES)]
+    for _ in range(_TERNARY_STEPS):
+        third = (hi - lo) / 3
+        if dist(lo + third) < dist(hi - third):
+            hi -= third
+        else:
+            lo += third
+    time = min(((lo + hi) / 2, 0.0, 1.0), key=dist)
+    return time, dist(time)
+
+
+def _find_time(values: Sequence[float], target: float, lo: float, hi: float) -> float:
+    """Find when a monotonic coordinate of a curve reaches a target value.
+
+    :param values: one coordinate of each control point
+    :param target: the value to reach
+    :param lo: the start of a time interval where the coordinate is monotonic
+    :param hi: the end of that interval
+    :return: the time in [lo, hi] when the coordinate is nearest target
+    """
+    is_increasing = _get_value(values, hi) >= _get_value(values, lo)
+    for _ in range(_BISECTION_STEPS):
+        mid = (lo + hi) / 2
+        if (_get_value(values, mid) < target) == is_increasing:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+
+def get_crossing_times(values: Sequence[float], target: float) -> list[float]:
+    """Get the times strictly between 0 and 1 when one coordinate crosses a value.
+
+    :param values: one coordinate of each control point of a line, quadratic, or
+        cubic Bezier curve
+    :param target: the value to cross, e.g., the x of a vertical line
+    :return: sorted times when the coordinate passes through target. A piece of
+        the curve that only touches target at an extremum has no crossing.
+    """
+    if len(values) == 2:
+        a, b = values
+        if min(a, b) < target < max(a, b):
+            return [(target - a) / (b - a)]
+        return []
+    times = [0.0, *get_extrema_times(values), 1.0]
+    crossings: list[float] = []
+    for lo, hi in it.pairwise(times):
+        v_lo, v_hi = _get_value(values, lo), _get_value(values, hi)
+        if min(v_lo, v_hi) < target < max(v_lo, v_hi):
+            crossings.append(_find_time(values, target, lo, hi))
+    return crossings
+
+
+def split(
+    cpts: Sequence[tuple[float, float]], time: float
+) -> tuple[list[tuple[float, float]], list[tuple[float, float]]]:
+    """Split a Bezier curve in two with de Casteljau's algorithm.
+
+    :param cpts: control points of a Bezier curve of any degree
+    :param time: where to split the curve
+    :return: control points of the curve from 0 to time and from time to 1
+    """
+    pts: list[tuple[float, float]] = list(cpts)
+    head = [pts[0]]
+    tail = [pts[-1]]
+    while len(pts) > 1:
+        pts = [
+            (ax + (bx - ax) * time, ay + (by - ay) * time)
+            for (ax, ay), (bx, by) in it.pairwise(pts)
+        ]
+        head.append(pts[0])
+        tail.append(pts[-1])
+    return head, tail[::-1]
+
+
+def get_piece(
+    cpts: Sequence[tuple[float, float]], start: float, stop: float
+) -> list[tuple[float, float]]:
+    """Get the control points of the part of a Bezier curve between two times.
+
+    :param cpts: control points of a Bezier curve of any degree
+    :param start: the time where the piece starts
+    :param stop: the time where the piece ends, greater than start
+    :return: control points of the piece
+    """
+    head = split(cpts, stop)[0] if stop < 1 else list(cpts)
+    if start <= 0:
+        return head
+    return split(head, start / stop)[1]
+
+
+def get_winding_crossings(
+    cpts: Sequence[tuple[float, float]], point: tuple[float, float]
+) -> int:
+    """Get the winding contribution of a curve around a point.
+
+    :param cpts: control points of a line, quadratic, or cubic Bezier curve
+    :param point: the point to wind around
+    :return: the signed number of times the curve crosses a ray from point
+        toward +x. Upward crossings count +1 and downward crossings -1.
+
+    Each y-monotonic piece of the curve covers the half-open y interval from its
+    lower end (included) to its upper end (excluded), so a ray through a vertex
+    shared by two pieces is counted once.
+    """
+    px, py = point
+    xs = [x for x, _ in cpts]
+    ys = [y for _, y in cpts]
+    times = [0.0, *get_extrema_times(ys), 1.0]
+    winding = 0
+    for lo, hi in it.pairwise(times):
+        y_lo, y_hi = _get_value(ys, lo), _get_value(ys, hi)
+        if y_lo == y_hi or not min(y_lo, y_hi) <= py < max(y_lo, y_hi):
+            continue
+        time = _find_time(ys, py, lo, hi)
+        if _get_value(xs, time) > px:
+            winding += 1 if y_hi > y_lo else -1
+    return winding
@@ -0,0 +1,367 @@
+"""Cache the results of path data conversions.
+
+Icons and glyphs are often converted many times with the same arguments. An
+`SvgdCache` wraps the conversion functions and stores each result under a hash of
+the function, the input, the resolution, and the library version, so results from
+an older version of this library are never reused.
+
+There are two tiers:
+
+* an in-memory LRU cache limited by entry count
+* an optional sqlite file limited by total size. The least recently used entries
+  are evicted first.
+
+    >>> cache = SvgdCache(maxsize=128)
+    >>> cache.format_svgd_shortest("M0 0L1 0L1 1Z")
+    'M0 0H1V1Z'
+    >>> cache.format_svgd_shortest("M0 0L1 0L1 1Z")
+    'M0 0H1V1Z'
+    >>> cache.cache_info().hits
+    1
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, NamedTuple
+
+from svg_path_data.svg_data import (
+    format_svgd_absolute,
+    format_svgd_relative,
+    format_svgd_shortest,
+    get_cpts_from_svgd,
+    get_svgd_from_cpts,
+)
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Callable, Iterable
+    from types import TracebackType
+
+    from svg_path_data.string_ops import SvgdBuffer
+
+
+def _get_version() -> str:
+    """Get the installed version of this library to separate cached results.
+
+    :return: the version string or "unknown" if the library is not installed
+    """
+    try:
+        return version("svg-path-data")
+    except PackageNotFoundError:  # pragma: no cover
+        return "unknown"
+
+
+_VERSION = _get_version()
+
+_Cpts = list[list[tuple[float, float]]]
+
+
+class CacheInfo(NamedTuple):
+    """Hit and miss statistics for an SvgdCache."""
+
+    hits: int
+    disk_hits: int
+    misses: int
+    currsize: int
+    disk_bytes: int
+
+
+def _hash_key(func_name: str, resolution: int | None, data: str | bytes) -> str:
+    """Hash the arguments of a conversion.
+
+    :param func_name: the name of the conversion function
+    :param resolution: the resolution argument
+    :param data: the input path data or serialized control points
+    :return: a hex digest that identifies the result
+    """
+    hasher = hashlib.sha256(f"{_VERSION}\0{func_name}\0{resolution}\0".encode())
+    hasher.update(data.encode() if isinstance(data, str) else data)
+    return hasher.hexdigest()
+
+
+class SvgdCache:
+    """Cache the results of the format_svgd_* and cpts conversion functions."""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        path: str | os.PathLike[str] | None = None,
+        max_disk_bytes: int = 2**26,
+    ) -> None:
+        """Create an empty in-memory cache and optionally open an on-disk cache.
+
+        :param maxsize: the maximum number of results held in memory
+        :param path: optionally, the path to a sqlite file for on-disk results. The
+            file is created if it does not exist and can be shared between runs.
+        :param max_disk_bytes: the maximum total size of on-disk results
+        """
+        self.maxsize = maxsize
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._db: sqlite3.Connection | None = None
+        self._disk_bytes = 0
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            _ = self._db.execute(
+                """CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY, value TEXT, size INTEGER, used INTEGER)"""
+            )
+            _ = self._db.execute(
+                "CREATE INDEX IF NOT EXISTS results_used ON results (used)"
+            )
+            self._db.commit()
+            self._disk_bytes = self._get_disk_bytes()
+
+    def __enter__(self) -> SvgdCache:  # noqa: PYI034
+        """Use the cache as a context manager to close the on-disk cache.
+
+        :return: self
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the on-disk cache."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the on-disk cache. The in-memory cache is still available."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def cache_info(self) -> CacheInfo:
+        """Get hit and miss statistics.
+
+        :return: memory hits, disk hits, misses, the number of results in memory,
+            and the total size of results on disk
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._disk_hits,
+                self._misses,
+                len(self._memory),
+                self._get_disk_bytes(),
+            )
+
+    def cache_clear(self) -> None:
+        """Remove all results from both tiers and reset the statistics."""
+        with self._lock:
+            self._memory.clear()
+            self._hits = self._disk_hits = self._misses = 0
+            if self._db is not None:
+                _ = self._db.execute("DELETE FROM results")
+                self._db.commit()
+            self._disk_bytes = 0
+
+    def _get_disk_bytes(self) -> int:
+        """Get the total size of on-disk results. Call with the lock held.
+
+        :return: the sum of the sizes of all on-disk results
+
+        This sums every row, so `_put` keeps a running total instead and only
+        `cache_info` and `__init__` call this.
+        """
+        if self._db is None:
+            return 0
+        row = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results")
+        return int(row.fetchone()[0])
+
+    def _get(self, key: str) -> str | None:
+        """Look up a result in memory, then on disk. Call with the lock held.
+
+        :param key: the hashed arguments
+        :return: the stored result or None
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self._hits += 1
+            return self._memory[key]
+        if self._db is not None:
+            row = self._db.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                _ = self._db.execute(
+                    "UPDATE results SET used = ? WHERE key = ?", (time.time_ns(), key)
+                )
+                self._db.commit()
+                self._disk_hits += 1
+                self._put_memory(key, row[0])
+                return row[0]
+        self._misses += 1
+        return None
+
+    def _put_memory(self, key: str, value: str) -> None:
+        """Store a result in memory and evict the oldest. Call with the lock held.
+
+        :param key: the hashed arguments
+        :param value: the result
+        """
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            _ = self._memory.popitem(last=False)
+
+    def _put(self, key: str, value: str) -> None:
+        """Store a result in both tiers. Call with the lock held.
+
+        :param key: the hashed arguments
+        :param value: the result
+        """
+        self._put_memory(key, value)
+        if self._db is None:
+            return
+        size = len(value) + len(key)
+        replaced = self._db.execute(
+            "SELECT size FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        _ = self._db.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+            (key, value, size, time.time_ns()),
+        )
+        self._disk_bytes += size - (0 if replaced is None else int(replaced[0]))
+        excess = self._disk_bytes - self.max_disk_bytes
+        if excess > 0:
+            rows = self._db.execute("SELECT key, size FROM results ORDER BY used")
+            evict: list[tuple[str]] = []
+            for old_key, old_size in rows:
+                if excess <= 0:
+                    break
+                evict.append((old_key,))
+                excess -= old_size
+                self._disk_bytes -= old_size
+            _ = self._db.executemany("DELETE FROM results WHERE key = ?", evict)
+        self._db.commit()
+
+    def _cached(
+        self,
+        func_name: str,
+        resolution: int | None,
+        data: str | bytes,
+        compute: Callable[[], str],
+    ) -> str:
+        """Get a result from the cache or compute and store it.
+
+        :param func_name: the name of the conversion function
+        :param resolution: the resolution argument
+        :param data: the input path data or serialized control points
+        :param compute: compute the result as a str
+        :return: the cached or computed result
+        """
+        key = _hash_key(func_name, resolution, data)
+        with self._lock:
+            value = self._get(key)
+        if value is not None:
+            return value
+        value = compute()
+        with self._lock:
+            self._put(key, value)
+        return value
+
+    def format_svgd_shortest(
+        self, svgd: str | SvgdBuffer, resolution: int | None = None
+    ) -> str:
+        """Cache `svg_path_data.format_svgd_shortest`.
+
+        :param svgd: an SVG path data string
+        :param resolution: optionally limit the resolution of the output
+        :return: a shortest SVG path data string
+        """
+        data = svgd if isinstance(svgd, str) else bytes(svgd)
+        return self._cached(
+            "format_svgd_shortest",
+            resolution,
+            data,
+            lambda: format_svgd_shortest(data, resolution),
+        )
+
+    def format_svgd_absolute(
+        self, svgd: str | SvgdBuffer, resolution: int | None = None
+    ) -> str:
+        """Cache `svg_path_data.format_svgd_absolute`.
+
+        :param svgd: an SVG path data string
+        :param resolution: optionally limit the resolution of the output
+        :return: an ABSOLUTE SVG path data string
+        """
+        data = svgd if isinstance(svgd, str) else bytes(svgd)
+        return self._cached(
+            "format_svgd_absolute",
+            resolution,
+            data,
+            lambda: format_svgd_absolute(data, resolution),
+        )
+
+    def format_svgd_relative(
+        self, svgd: str | SvgdBuffer, resolution: int | None = None
+    ) -> str:
+        """Cache `svg_path_data.format_svgd_relative`.
+
+        :param svgd: an SVG path data string
+        :param resolution: optionally limit the resolution of the output
+        :return: a RELATIVE SVG path data string
+        """
+        data = svgd if isinstance(svgd, str) else bytes(svgd)
+        return self._cached(
+            "format_svgd_relative",
+            resolution,
+            data,
+            lambda: format_svgd_relative(data, resolution),
+        )
+
+    def get_cpts_from_svgd(
+        self, svgd: str | SvgdBuffer, resolution: int | None = None
+    ) -> _Cpts:
+        """Cache `svg_path_data.get_cpts_from_svgd`.
+
+        :param svgd: an absolute or relative SVG path data string
+        :param resolution: optionally limit the resolution used to identify linear
+            curves and closed paths
+        :return: a new list of curves, each a list of xy tuples
+        """
+        data = svgd if isinstance(svgd, str) else bytes(svgd)
+        cpts_json = self._cached(
+            "get_cpts_from_svgd",
+            resolution,
+            data,
+            lambda: json.dumps(get_cpts_from_svgd(data, resolution)),
+        )
+        return [[(x, y) for x, y in curve] for curve in json.loads(cpts_json)]
+
+    def get_svgd_from_cpts(
+        self, cpts: Iterable[Iterable[Iterable[float]]], resolution: int | None = None
+    ) -> str:
+        """Cache `svg_path_data.get_svgd_from_cpts`.
+
+        :param cpts: a list of curves, each a list of xy control points
+        :param resolution: optionally limit the resolution of the output
+        :return: SVG path data string
+        """
+        floats = [[[float(x) for x in pt] for pt in curve] for curve in cpts]
+        return self._cached(
+            "get_svgd_from_cpts",
+            resolution,
+            json.dumps(floats),
+            lambda: get_svgd_from_cpts(floats, resolution),
+        )
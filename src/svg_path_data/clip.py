@@ -0,0 +1,273 @@
+"""Drop or clip the parts of a path outside a rectangle.
+
+A map tile or a zoomed view often shows a small part of a large path. Subpaths
+that cannot reach the view can be dropped before any output is formatted. The
+test is conservative: a Bezier curve lies inside the bounding box of its control
+points, and an arc lies within one diameter of its endpoints, so a subpath is
+only dropped when the box around all of its segment boxes misses the rectangle.
+
+Bounding boxes are computed for every segment in one pass, then merged per
+subpath. With `clip=True`, a subpath that straddles the rectangle is also cut
+where its lines and curves cross the rectangle edges. Curves are split at the
+crossing parameters, and only the pieces inside the rectangle are kept.
+
+    >>> clip_to_rect("M0 0H10V10H0ZM100 100H110", (-1, -1, 20, 20)).svgd
+    'M0 0H10V10H0Z'
+    >>> clip_to_rect("M0 5H20", (0, 0, 10, 10), clip=True).svgd
+    'M0 5H10'
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import itertools as it
+import math
+from typing import TYPE_CHECKING
+
+from svg_path_data.bezier import get_crossing_times, get_piece, get_point
+from svg_path_data.svg_data import PathCommands
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from svg_path_data.string_ops import SvgdBuffer
+    from svg_path_data.svg_data import PathCommand
+
+_Box = tuple[float, float, float, float]
+
+_CURVE_COMMANDS = {2: "L", 3: "Q", 4: "C"}
+
+
+def _get_arc_reach(start: tuple[float, float], arc_vals: Sequence[float]) -> float:
+    """Get the largest radius of an arc after scaling radii that are too small.
+
+    :param start: the current point where the arc starts
+    :param arc_vals: the seven values of an absolute arc command
+    :return: the larger radius of the ellipse the arc is drawn on, or 0 if either
+        radius is 0 and the arc is a straight line
+    """
+    rx, ry, rotation, _, _, x, y = arc_vals
+    rx, ry = abs(rx), abs(ry)
+    if not rx or not ry:
+        return 0
+    phi = math.radians(rotation)
+    dx, dy = (start[0] - x) / 2, (start[1] - y) / 2
+    x1p = math.cos(phi) * dx + math.sin(phi) * dy
+    y1p = -math.sin(phi) * dx + math.cos(phi) * dy
+    scale = (x1p / rx) ** 2 + (y1p / ry) ** 2
+    return max(rx, ry) * max(math.sqrt(scale), 1)
+
+
+def _get_segment_box(start: tuple[float, float], node: PathCommand) -> _Box:
+    """Get a box that contains one segment of a path.
+
+    :param start: the current point where the segment starts
+    :param node: a command other than a move
+    :return: (min_x, min_y, max_x, max_y) of the control points of a line or
+        curve. For an arc, the region within one diameter of both endpoints.
+    """
+    if node.cmd == "A":
+        x, y = node.abs_vals[-2:]
+        reach = 2 * _get_arc_reach(start, node.abs_vals)
+        if not reach:  # a straight line between the endpoints
+            return (
+                min(start[0], x),
+                min(start[1], y),
+                max(start[0], x),
+                max(start[1], y),
+            )
+        return (
+            max(start[0], x) - reach,
+            max(start[1], y) - reach,
+            min(start[0], x) + reach,
+            min(start[1], y) + reach,
+        )
+    xs = node.abs_vals[::2]
+    ys = node.abs_vals[1::2]
+    return (
+        min(start[0], *xs),
+        min(start[1], *ys),
+        max(start[0], *xs),
+        max(start[1], *ys),
+    )
+
+
+def _iter_segments(
+    cmds: Iterable[PathCommand],
+) -> Iterator[tuple[int, tuple[float, float], PathCommand]]:
+    """Iterate over the segments of a path with the subpath each belongs to.
+
+    :param cmds: path commands
+    :return: None
+    :yield: (subpath index, start point, command) for each command. Move
+        commands are yielded with the index of the subpath they start.
+    """
+    index = -1
+    current = (0.0, 0.0)
+    for node in cmds:
+        if node.cmd == "M" or index < 0:
+            index += 1
+        yield index, current, node
+        x, y = node.abs_vals[-2:]
+        current = (x, y)
+
+
+def _overlaps(box: _Box, rect: _Box) -> bool:
+    """Test whether two boxes share any point.
+
+    :param box: (min_x, min_y, max_x, max_y)
+    :param rect: (min_x, min_y, max_x, max_y)
+    :return: True if the boxes overlap or touch
+    """
+    return (
+        box[0] <= rect[2]
+        and rect[0] <= box[2]
+        and box[1] <= rect[3]
+        and rect[1] <= box[3]
+    )
+
+
+def _contains(rect: _Box, box: _Box) -> bool:
+    """Test whether a box is entirely inside a rectangle.
+
+    :param rect: (min_x, min_y, max_x, max_y)
+    :param box: (min_x, min_y, max_x, max_y)
+    :return: True if no point of box is outside rect
+    """
+    return (
+        rect[0] <= box[0]
+        and rect[1] <= box[1]
+        and box[2] <= rect[2]
+        and box[3] <= rect[3]
+    )
+
+
+def _iter_clipped_pieces(
+    cpts: Sequence[tuple[float, float]], rect: _Box
+) -> Iterator[list[tuple[float, float]]]:
+    """Split a line or Bezier curve where it crosses the edges of a rectangle.
+
+    :param cpts: control points of a line, quadratic, or cubic Bezier curve
+    :param rect: (min_x, min_y, max_x, max_y)
+    :return: None
+    :yield: control points of each piece inside rect. Each piece starts and ends
+        exactly on the edge it crosses.
+    """
+    xs = [x for x, _ in cpts]
+    ys = [y for _, y in cpts]
+    crossings: dict[float, tuple[int, float]] = {}
+    for axis, values in enumerate((xs, ys)):
+        for edge in (rect[axis], rect[axis + 2]):
+            crossings.update(
+                (t, (axis, edge)) for t in get_crossing_times(values, edge)
+            )
+    times = [0.0, *sorted(crossings), 1.0]
+    points = [cpts[0]]
+    for time in times[1:-1]:
+        point = list(get_point(cpts, time))
+        axis, edge = crossings[time]
+        point[axis] = edge
+        points.append((point[0], point[1]))
+    points.append(cpts[-1])
+    for i, (start, stop) in enumerate(it.pairwise(times)):
+        mid_x, mid_y = get_point(cpts, (start + stop) / 2)
+        if not (rect[0] <= mid_x <= rect[2] and rect[1] <= mid_y <= rect[3]):
+            continue
+        piece = get_piece(cpts, start, stop)
+        yield [points[i], *piece[1:-1], points[i + 1]]
+
+
+def _iter_clipped_commands(
+    segments: Iterable[tuple[int, tuple[float, float], PathCommand]],
+    boxes: Sequence[_Box],
+    rect: _Box,
+) -> Iterator[tuple[str, Sequence[float]]]:
+    """Cut the segments of straddling subpaths at the edges of a rectangle.
+
+    :param segments: (subpath index, start point, command) for each command of the
+        subpaths to clip
+    :param boxes: a box for each segment
+    :param rect: (min_x, min_y, max_x, max_y)
+    :return: None
+    :yield: (command, floats) pairs for `PathCommands.from_commands`. A move is
+        inserted wherever the kept pieces do not meet.
+    """
+    pen: tuple[float, float] | None = None
+    for (_, start, node), box in zip(segments, boxes, strict=True):
+        if node.cmd == "M" or not _overlaps(box, rect):
+            continue
+        if node.cmd == "A" or _contains(rect, box):
+            pieces: Iterable[tuple[str, Sequence[float]]] = [(node.cmd, node.abs_vals)]
+            starts = [start]
+        else:
+            clipped = list(_iter_clipped_pieces([start, *node.cpts[1:]], rect))
+            pieces = [
+                (_CURVE_COMMANDS[len(p)], list(it.chain(*p[1:]))) for p in clipped
+            ]
+            starts = [p[0] for p in clipped]
+        for piece_start, (cmd, vals) in zip(starts, pieces, strict=True):
+            if piece_start != pen:
+                yield "M", list(piece_start)
+            yield cmd, vals
+            pen = (vals[-2], vals[-1])
+
+
+def clip_to_rect(
+    svgd_or_commands: str | SvgdBuffer | PathCommands,
+    rect: tuple[float, float, float, float],
+    margin: float = 0,
+    *,
+    clip: bool = False,
+    resolution: int | None = None,
+) -> PathCommands:
+    """Drop the subpaths of a path that cannot be seen inside a rectangle.
+
+    :param svgd_or_commands: an SVG path data string, ascii SVG path data in a
+        bytes-like object, or a PathCommands instance
+    :param rect: (min_x, min_y, width, height), the same order as an SVG viewBox
+    :param margin: grow the rectangle by this much on every side, e.g., half the
+        stroke width
+    :param clip: also cut lines and curves that cross the edges of the rectangle
+        and drop the pieces outside. This changes the shape of a filled path, so
+        use it for stroked paths only. Arcs that cross an edge are kept whole.
+    :param resolution: optionally limit the resolution of the output
+    :return: the commands of the visible subpaths, ready for `svgd` or any other
+        output format
+    :raises ValueError: if width or height is negative
+    """
+    min_x, min_y, width, height = rect
+    if width < 0 or height < 0:
+        msg = f"Rect width and height cannot be negative, got {rect}."
+        raise ValueError(msg)
+    bounds = (min_x - margin, min_y - margin, min_x + width + margin)
+    bounds = (*bounds, min_y + height + margin)
+    if isinstance(svgd_or_commands, PathCommands):
+        cmds = svgd_or_commands
+    else:
+        cmds = PathCommands.from_svgd(svgd_or_commands, resolution)
+
+    segments = list(_iter_segments(cmds))
+    boxes = [
+        (*n.abs_vals, *n.abs_vals) if n.cmd == "M" else _get_segment_box(p, n)
+        for _, p, n in segments
+    ]
+    commands: list[tuple[str, Sequence[float]]] = []
+    for _, group in it.groupby(
+        zip(segments, boxes, strict=True), key=lambda x: x[0][0]
+    ):
+        subpath_segments, segment_boxes = zip(*group, strict=True)
+        subpath_box = (
+            min(b[0] for b in segment_boxes),
+            min(b[1] for b in segment_boxes),
+            max(b[2] for b in segment_boxes),
+            max(b[3] for b in segment_boxes),
+        )
+        if not _overlaps(subpath_box, bounds):
+            continue
+        if not clip or _contains(bounds, subpath_box):
+            commands.extend((n.cmd, n.abs_vals) for _, _, n in subpath_segments)
+            continue
+        commands.extend(_iter_clipped_commands(subpath_segments, segment_boxes, bounds))
+    return PathCommands.from_commands(commands, resolution)
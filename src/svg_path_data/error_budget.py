@@ -0,0 +1,127 @@
+"""Choose a resolution from a pixel-error budget.
+
+A resolution that is too high wastes bytes. One that is too low visibly moves the
+points of small icons. An `ErrorBudget` describes how large the path will be
+rendered and how far (in pixels) any point may move. The chosen resolution is the
+smallest one whose largest error stays within that budget.
+
+    >>> budget = ErrorBudget(render_size=24, max_pixel_error=0.1)
+    >>> def measure(resolution: int, limit: float) -> float:
+    ...     return get_rounding_error([0.1234, 20.5], resolution, limit)
+    >>> choice = choose_resolution_by(measure, 24 / 20.4, budget)
+    >>> choice.resolution
+    1
+    >>> round(choice.max_error, 4)
+    0.0234
+
+Errors are measured on the actual values, not estimated from the resolution, so
+integer coordinates get resolution 0 however small the budget.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+# Past this many digits after the decimal point, floats do not round-trip anyway.
+_MAX_RESOLUTION = 15
+
+
+@dataclasses.dataclass(frozen=True)
+class ErrorBudget:
+    """How far any point may move when the path is rendered.
+
+    :param render_size: the size in pixels of the larger side of the rendered
+        image
+    :param max_pixel_error: how far, in pixels, any coordinate may move
+    :param view_box: optionally, the (min_x, min_y, width, height) of the svg
+        viewBox. By default, use the bounding box of the path's control points.
+    """
+
+    render_size: float
+    max_pixel_error: float = 0.5
+    view_box: tuple[float, float, float, float] | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class ResolutionChoice:
+    """The chosen resolution and the largest rounding error it introduces.
+
+    :param resolution: the smallest resolution within the budget, or None if no
+        resolution up to 15 is within the budget
+    :param max_error: the largest coordinate error in user (path) units
+    :param max_pixel_error: the largest coordinate error in rendered pixels
+    """
+
+    resolution: int | None
+    max_error: float
+    max_pixel_error: float
+
+
+def get_pixels_per_unit(
+    budget: ErrorBudget, points: Iterable[tuple[float, float]]
+) -> float:
+    """Get the scale from user (path) units to rendered pixels.
+
+    :param budget: the render size and optional viewBox
+    :param points: the control points of the path, used if there is no viewBox
+    :return: pixels per user unit. If the viewBox or bounding box has no size,
+        there is no scale, and this is infinite, so every value must be exact.
+    """
+    if budget.view_box is not None:
+        width, height = budget.view_box[2:]
+    else:
+        points = list(points)
+        xs = [x for x, _ in points] or [0.0]
+        ys = [y for _, y in points] or [0.0]
+        width, height = max(xs) - min(xs), max(ys) - min(ys)
+    extent = max(width, height)
+    if extent <= 0:
+        return math.inf
+    return budget.render_size / extent
+
+
+def get_rounding_error(
+    values: Iterable[float], resolution: int, limit: float = math.inf
+) -> float:
+    """Get the largest change to any value when rounded to a resolution.
+
+    :param values: every number that will be formatted
+    :param resolution: the number of digits after the decimal point
+    :param limit: stop early once the error is greater than this
+    :return: the largest absolute difference between a value and its rounded
+        value, or the first difference greater than limit
+    """
+    worst = 0.0
+    for value in values:
+        worst = max(worst, abs(value - float(f"{value:.{resolution}f}")))
+        if worst > limit:
+            break
+    return worst
+
+
+def choose_resolution_by(
+    measure: Callable[[int, float], float], pixels_per_unit: float, budget: ErrorBudget
+) -> ResolutionChoice:
+    """Choose the smallest resolution with a measured error within the budget.
+
+    :param measure: a function (resolution, limit) -> the largest error in user
+        units at that resolution. It may stop early once the error passes limit.
+    :param pixels_per_unit: the scale from user (path) units to rendered pixels
+    :param budget: the largest allowed error in pixels
+    :return: the chosen resolution with the largest error it introduces
+    """
+    max_error = budget.max_pixel_error / pixels_per_unit
+    for resolution in range(_MAX_RESOLUTION + 1):
+        error = measure(resolution, max_error)
+        if error <= max_error:
+            pixel_error = error * pixels_per_unit if error else 0.0
+            return ResolutionChoice(resolution, error, pixel_error)
+    return ResolutionChoice(None, 0.0, 0.0)
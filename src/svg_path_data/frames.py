@@ -0,0 +1,398 @@
+"""Store the frames of an animated path as quantized deltas.
+
+A path morph sends the same path many times with the same commands and different
+values. `FrameSequence` parses every frame, checks that all frames share one
+structure (the command letters after every command is made absolute), and keeps
+each frame as integers at `resolution`. Consecutive frames usually differ little, so the
+encoded form stores the first frame and then only the change from each frame to
+the next, as zigzag varints compressed with zlib.
+
+    >>> frames = FrameSequence.from_svgds(["M0 0H10V10Z", "M0 0H12V12Z"], 1)
+    >>> frames.template
+    'MLLZ'
+    >>> list(frames.get_deltas()[1])
+    [0, 0, 20, 0, 20, 20]
+    >>> FrameSequence.decode(frames.encode()).get_svgd(1)
+    'M0 0H12V12Z'
+
+Commands are not simplified, so a frame where two lines are collinear or a line
+has zero length has the same structure as the frames around it. If a frame has a
+line or a lower-degree curve where other frames have a curve, that command is
+degree elevated to the highest degree of any frame, so the structure still
+matches. Frames with a different number of commands cannot share a structure.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import itertools as it
+import operator
+import zlib
+from array import array
+from typing import TYPE_CHECKING
+
+from svg_path_data.string_ops import iter_svgd_commands
+from svg_path_data.svg_data import PathCommands, RelativeOrAbsolute
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from svg_path_data.string_ops import SvgdBuffer
+
+# the number of absolute values for each command letter of a template
+_CMD_2_N = {"M": 2, "L": 2, "Q": 4, "C": 6, "A": 7, "Z": 0}
+
+# letters for lines and curves by degree
+_DEGREE_2_CMD = {1: "L", 2: "Q", 3: "C"}
+_CMD_2_DEGREE = {v: k for k, v in _DEGREE_2_CMD.items()}
+
+# the start of every encoded frame sequence, followed by the format version
+_MAGIC = b"SVGF"
+_VERSION = 1
+
+
+def _iter_absolute_commands(
+    svgd: str | SvgdBuffer,
+) -> Iterator[tuple[str, list[float]]]:
+    """Make every command absolute without merging, dropping, or reducing any.
+
+    :param svgd: an SVG path data string or ascii SVG path data in a bytes-like
+        object
+    :return: None
+    :yield: (command, absolute values) for each command. H and V become L, and
+        the shorthand S and T become C and Q with the implied control point.
+    """
+    x = y = 0.0
+    start = (0.0, 0.0)
+    prev_cmd, prev_vals = "", []
+    for cmd, vals in iter_svgd_commands(svgd):
+        upper = cmd.upper()
+        dx, dy = (0.0, 0.0) if cmd == upper else (x, y)
+        abs_vals: list[float]
+        if upper == "Z":
+            abs_vals = []
+        elif upper == "H":
+            upper, abs_vals = "L", [vals[0] + dx, y]
+        elif upper == "V":
+            upper, abs_vals = "L", [x, vals[0] + dy]
+        elif upper == "A":
+            abs_vals = [*vals[:5], vals[5] + dx, vals[6] + dy]
+        else:
+            abs_vals = [v + (dy if i % 2 else dx) for i, v in enumerate(vals)]
+        if upper in "ST":
+            upper = {"S": "C", "T": "Q"}[upper]
+            implied = (x, y)
+            if prev_cmd == upper:  # reflect the last control point of prev
+                implied = (2 * x - prev_vals[-4], 2 * y - prev_vals[-3])
+            abs_vals = [*implied, *abs_vals]
+        if upper == "M":
+            start = (abs_vals[0], abs_vals[1])
+        x, y = abs_vals[-2:] if abs_vals else start
+        prev_cmd, prev_vals = upper, abs_vals
+        yield upper, abs_vals
+
+
+def _elevate(start: Sequence[float], vals: Sequence[float], degree: int) -> list[float]:
+    """Raise the degree of a line or Bezier curve without changing its shape.
+
+    :param start: the current point where the curve starts
+    :param vals: the absolute values of a line or curve command after the start
+    :param degree: the degree of the result, at least the degree of the input
+    :return: the absolute values of the same curve as a curve of degree
+    """
+    pts = [(start[0], start[1]), *zip(vals[::2], vals[1::2], strict=True)]
+    while len(pts) <= degree:
+        n = len(pts)
+        pts = [
+            pts[0],
+            *(
+                (
+                    (i * ax + (n - i) * bx) / n,
+                    (i * ay + (n - i) * by) / n,
+                )
+                for i, ((ax, ay), (bx, by)) in enumerate(it.pairwise(pts), start=1)
+            ),
+            pts[-1],
+        ]
+    return list(it.chain.from_iterable(pts[1:]))
+
+
+def _get_template(frames: Sequence[Sequence[tuple[str, list[float]]]]) -> str:
+    """Find the command structure shared by every frame.
+
+    :param frames: the (command, absolute values) pairs of each frame
+    :return: one command letter per command, the highest degree of any frame for
+        lines and curves
+    :raises ValueError: if frames do not have the same commands
+    """
+    if not frames:
+        return ""
+    template: list[str] = []
+    for i, frame in enumerate(frames):
+        if len(frame) != len(frames[0]):
+            msg = (
+                f"Frame {i} has {len(frame)} commands. "
+                + f"Expected {len(frames[0])} like frame 0."
+            )
+            raise ValueError(msg)
+    for position, cmds in enumerate(zip(*frames, strict=True)):
+        letters = {cmd for cmd, _ in cmds}
+        if len(letters) == 1:
+            template.append(letters.pop())
+        elif letters <= set(_CMD_2_DEGREE):
+            template.append(max(letters, key=_CMD_2_DEGREE.__getitem__))
+        else:
+            msg = f"Frames have different commands at command {position}: {letters}."
+            raise ValueError(msg)
+    return "".join(template)
+
+
+def _iter_frame_values(
+    frame: Sequence[tuple[str, list[float]]], template: str
+) -> Iterator[float]:
+    """Iterate over the absolute values of a frame, elevated to the template.
+
+    :param frame: the (command, absolute values) pairs of one frame
+    :param template: the shared command letters of all frames
+    :return: None
+    :yield: every value of every command
+    """
+    current: Sequence[float] = (0.0, 0.0)
+    start = current
+    for (cmd, vals), target in zip(frame, template, strict=True):
+        if cmd != target:
+            values = _elevate(current, vals, _CMD_2_DEGREE[target])
+        else:
+            values = vals
+        yield from values
+        if cmd == "M":
+            start = values
+        current = values[-2:] if values else start
+
+
+def _zigzag(number: int) -> int:
+    """Map a signed integer to an unsigned integer with small magnitudes first.
+
+    :param number: any integer
+    :return: 0, 1, 2, 3, 4 ... for 0, -1, 1, -2, 2 ...
+    """
+    return number * 2 if number >= 0 else -number * 2 - 1
+
+
+def _unzigzag(number: int) -> int:
+    """Invert `_zigzag`.
+
+    :param number: a non-negative integer
+    :return: the signed integer that zigzags to number
+    """
+    return number // 2 if number % 2 == 0 else -(number + 1) // 2
+
+
+def _write_varints(out: bytearray, numbers: Iterable[int]) -> None:
+    """Write non-negative integers seven bits at a time, low bits first.
+
+    :param out: the buffer to extend
+    :param numbers: non-negative integers
+    """
+    for number in numbers:
+        rest = number
+        while rest > 0x7F:
+            out.append(rest & 0x7F | 0x80)
+            rest >>= 7
+        out.append(rest)
+
+
+def _read_varints(data: bytes, at: int, count: int) -> tuple[list[int], int]:
+    """Read integers written by `_write_varints`.
+
+    :param data: the buffer to read
+    :param at: the index of the first byte to read
+    :param count: the number of integers to read
+    :return: the integers and the index after the last byte read
+    :raises ValueError: if data ends before count integers
+    """
+    numbers: list[int] = []
+    for _ in range(count):
+        number = shift = 0
+        while True:
+            if at >= len(data):
+                msg = "Encoded frames end early."
+                raise ValueError(msg)
+            byte = data[at]
+            at += 1
+            number |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+        numbers.append(number)
+    return numbers, at
+
+
+class FrameSequence:
+    """Frames of one path with the same commands and quantized values.
+
+    :param template: one command letter (M, L, Q, C, A, or Z) per command
+    :param resolution: the number of decimal places kept
+    :param frames: the absolute values of each frame as integers, each value
+        times 10**resolution
+    """
+
+    def __init__(
+        self, template: str, resolution: int, frames: Iterable[Sequence[int]]
+    ) -> None:
+        """Store quantized frames.
+
+        :param template: one command letter (M, L, Q, C, A, or Z) per command
+        :param resolution: the number of decimal places kept
+        :param frames: the absolute values of each frame as integers, each value
+            times 10**resolution
+        :raises ValueError: if resolution is negative or if a frame does not have
+            one value for each value of the template
+        """
+        if resolution < 0:
+            msg = f"Resolution cannot be negative, got {resolution}."
+            raise ValueError(msg)
+        self.template = template
+        self.resolution = resolution
+        self.frames = [array("q", x) for x in frames]
+        num_vals = sum(_CMD_2_N[x] for x in template)
+        for i, frame in enumerate(self.frames):
+            if len(frame) != num_vals:
+                msg = f"Frame {i} has {len(frame)} values. Expected {num_vals}."
+                raise ValueError(msg)
+
+    @classmethod
+    def from_svgds(
+        cls,
+        svgds: Iterable[str | SvgdBuffer | PathCommands],
+        resolution: int,
+    ) -> FrameSequence:
+        """Parse the frames of an animated path.
+
+        :param svgds: an SVG path data string, ascii SVG path data in a bytes-like
+            object, or a PathCommands instance for each frame
+        :param resolution: the number of decimal places to keep
+        :return: the frames in order
+        :raises ValueError: if frames do not share one command structure
+
+        Each frame is parsed as written. A PathCommands instance is read from its
+        absolute SVG path data string, so it has the commands left after
+        `PathCommands` merged and dropped commands.
+        """
+        frames: list[list[tuple[str, list[float]]]] = []
+        for svgd in svgds:
+            if isinstance(svgd, PathCommands):
+                frame = _iter_absolute_commands(svgd.abs_svgd)
+            else:
+                frame = _iter_absolute_commands(svgd)
+            frames.append(list(frame))
+        template = _get_template(frames)
+        scale = 10**resolution
+        quantized = (
+            [round(x * scale) for x in _iter_frame_values(f, template)] for f in frames
+        )
+        return cls(template, resolution, quantized)
+
+    def __len__(self) -> int:
+        """Get the number of frames.
+
+        :return: the number of frames
+        """
+        return len(self.frames)
+
+    def get_deltas(self) -> list[array[int]]:
+        """Get the change in every quantized value from each frame to the next.
+
+        :return: the first frame, then for each later frame, that frame minus the
+            frame before it
+        """
+        deltas = self.frames[:1]
+        deltas.extend(
+            array("q", map(operator.sub, b, a)) for a, b in it.pairwise(self.frames)
+        )
+        return deltas
+
+    @classmethod
+    def from_deltas(
+        cls, template: str, resolution: int, deltas: Iterable[Sequence[int]]
+    ) -> FrameSequence:
+        """Rebuild frames from the output of `get_deltas`.
+
+        :param template: one command letter (M, L, Q, C, A, or Z) per command
+        :param resolution: the number of decimal places kept
+        :param deltas: the first frame, then the change to each later frame
+        :return: the frames in order
+        """
+        frames = it.accumulate(
+            (array("q", x) for x in deltas),
+            lambda a, b: array("q", map(operator.add, a, b)),
+        )
+        return cls(template, resolution, frames)
+
+    def get_values(self, index: int) -> list[float]:
+        """Get the absolute values of a frame.
+
+        :param index: the index of the frame
+        :return: every value of every command of the frame
+        """
+        scale = 10**self.resolution
+        return [x / scale for x in self.frames[index]]
+
+    def get_svgd(
+        self,
+        index: int,
+        relative_or_absolute: RelativeOrAbsolute = RelativeOrAbsolute.SHORTEST,
+    ) -> str:
+        """Get the SVG path data string of a frame.
+
+        :param index: the index of the frame
+        :param relative_or_absolute: the output format
+        :return: an SVG path data string for the frame
+        """
+        vals = iter(self.get_values(index))
+        commands = ((x, list(it.islice(vals, _CMD_2_N[x]))) for x in self.template)
+        cmds = PathCommands.from_commands(commands, self.resolution)
+        return "".join(cmds.iter_svgd(relative_or_absolute))
+
+    def encode(self) -> bytes:
+        """Encode the frames as compact bytes.
+
+        :return: a header, then the first frame and the change to each later frame
+            as zigzag varints, compressed with zlib
+        """
+        body = bytearray()
+        _write_varints(body, [self.resolution, len(self.template), len(self.frames)])
+        body.extend(self.template.encode("ascii"))
+        for delta in self.get_deltas():
+            _write_varints(body, map(_zigzag, delta))
+        return _MAGIC + bytes([_VERSION]) + zlib.compress(body, 9)
+
+    @classmethod
+    def decode(cls, data: bytes) -> FrameSequence:
+        """Decode the output of `encode`.
+
+        :param data: bytes from `encode`
+        :return: the encoded frames
+        :raises ValueError: if data is not encoded frames
+        """
+        header = _MAGIC + bytes([_VERSION])
+        if not data.startswith(header):
+            msg = "Data does not start with an encoded frame sequence header."
+            raise ValueError(msg)
+        try:
+            body = zlib.decompress(data[len(header) :])
+        except zlib.error as e:
+            msg = f"Encoded frames are corrupt: {e}"
+            raise ValueError(msg) from e
+        (resolution, template_len, num_frames), at = _read_varints(body, 0, 3)
+        template = body[at : at + template_len].decode("ascii", errors="replace")
+        if len(template) != template_len or set(template) - set(_CMD_2_N):
+            msg = f"Unknown commands in encoded template: {template}."
+            raise ValueError(msg)
+        num_vals = sum(_CMD_2_N[x] for x in template)
+        numbers, _ = _read_varints(body, at + template_len, num_vals * num_frames)
+        numbers = [_unzigzag(x) for x in numbers]
+        deltas = (numbers[i * num_vals : (i + 1) * num_vals] for i in range(num_frames))
+        return cls.from_deltas(template, resolution, deltas)
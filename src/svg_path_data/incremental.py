@@ -0,0 +1,81 @@
+"""Parse SVG path data from an asyncio stream as it arrives.
+
+These wrap `SvgdParser`, so each command or curve is available as soon as it is
+final. The time to the first command does not depend on the length of the path.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from svg_path_data.svg_data import SvgdParser
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+    from svg_path_data.svg_data import PathCommand
+
+# How many bytes to request from an asyncio.StreamReader at a time.
+_READ_SIZE = 2**16
+
+
+async def _aiter_chunks(
+    source: asyncio.StreamReader | AsyncIterable[str] | AsyncIterable[bytes],
+) -> AsyncIterator[str | bytes]:
+    """Read chunks from a stream reader or an async iterable.
+
+    :param source: an asyncio.StreamReader or an async iterable of chunks
+    :return: None
+    :yield: each chunk. A StreamReader is read in fixed-size chunks, not lines.
+    """
+    if isinstance(source, asyncio.StreamReader):
+        while chunk := await source.read(_READ_SIZE):
+            yield chunk
+        return
+    async for chunk in source:
+        yield chunk
+
+
+async def aiter_path_commands(
+    source: asyncio.StreamReader | AsyncIterable[str] | AsyncIterable[bytes],
+    resolution: int | None = None,
+) -> AsyncIterator[PathCommand]:
+    """Asynchronously parse path data from a stream as it arrives.
+
+    :param source: an asyncio.StreamReader or an async iterable of str or bytes
+        chunks of one SVG path data string
+    :param resolution: optionally limit the resolution used to identify linear
+        curves and closed paths
+    :return: None
+    :yield: each command once it is final
+    :raises ValueError: when the first invalid part of the path data is reached
+    """
+    parser = SvgdParser(resolution)
+    async for chunk in _aiter_chunks(source):
+        for cmd in parser.feed(chunk):
+            yield cmd
+    for cmd in parser.close():
+        yield cmd
+
+
+async def aiter_cpts_from_svgd(
+    source: asyncio.StreamReader | AsyncIterable[str] | AsyncIterable[bytes],
+    resolution: int | None = None,
+) -> AsyncIterator[list[tuple[float, float]]]:
+    """Asynchronously yield Bezier control points from a stream of path data.
+
+    :param source: an asyncio.StreamReader or an async iterable of str or bytes
+        chunks of one SVG path data string
+    :param resolution: optionally limit the resolution used to identify linear
+        curves and closed paths
+    :return: None
+    :yield: the same curves as `iter_cpts_from_svgd`, as the data arrives
+    :raises ValueError: when the first invalid part of the path data is reached
+    """
+    async for cmd in aiter_path_commands(source, resolution):
+        if cpts := cmd.cpts:
+            yield cpts
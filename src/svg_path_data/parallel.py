@@ -0,0 +1,219 @@
+"""Convert SVG path data in parallel.
+
+`format_svgd_parallel` splits one very large path and converts the pieces on a
+process pool. `format_svgd_many_threaded` converts many paths on a thread pool,
+which scales across cores on a free-threaded (no-GIL) build of Python.
+
+An absolute `M` command resets all relative state: the current point, the start of
+the subpath, and any implied control point for a `T` or `S` command. So a path can
+be split before each `M`, the pieces converted independently, and the results
+joined.
+
+Boundary handling:
+
+* A `Z` followed by anything other than `M` stays in the same piece, so the
+  implicit move after `Z` is handled as usual.
+* A subpath with nothing but moves stays at the end of the piece before it. The
+  serial result keeps redundant moves after the first drawing command, but a
+  piece would drop them if they came first.
+* Each piece of shortest output starts with `M`, following the same rule that
+  lets any two shortest paths be concatenated. The parallel result may be a few
+  characters longer than the serial result where a relative `m` would have been
+  shorter.
+* A piece of compressed output may start with `m`. Pieces are joined with
+  `concat_svgd`, which makes that move absolute.
+* In relative output, each piece after the first starts with an absolute `M`,
+  because its relative `m` would depend on the end of the previous piece.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import itertools as it
+import os
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from svg_path_data.string_ops import concat_svgd, svgd_join_commands, svgd_split
+from svg_path_data.svg_data import PathCommands, RelativeOrAbsolute
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from svg_path_data.string_ops import SvgdBuffer
+
+# Give each worker a few batches so that one slow batch does not idle the others.
+_BATCHES_PER_WORKER = 4
+
+_ABSOLUTE_MOVE = re.compile("M")
+
+
+def split_svgd_subpaths(svgd: str) -> list[str]:
+    """Split an SVG path data string before each absolute move command.
+
+    :param svgd: an SVG path data string
+    :return: substrings of svgd that join to svgd. Every substring after the first
+        starts with `M`.
+    """
+    starts = [m.start() for m in _ABSOLUTE_MOVE.finditer(svgd, 1)]
+    return [svgd[i:j] for i, j in it.pairwise([0, *starts, len(svgd)])]
+
+
+def _is_move_only(subpath: str) -> bool:
+    """Check if a subpath moves the current point without drawing anything.
+
+    :param subpath: a substring from `split_svgd_subpaths`
+    :return: True if every command is a move to one point
+    """
+    parts = svgd_split(subpath, validate=False)
+    cmds = [x for x in parts if x.isalpha()]
+    return all(x in "Mm" for x in cmds) and len(parts) == 3 * len(cmds)
+
+
+def _group_subpaths(subpaths: list[str], num_groups: int) -> list[str]:
+    """Join consecutive subpaths into about num_groups strings of similar length.
+
+    :param subpaths: substrings from `split_svgd_subpaths`
+    :param num_groups: the target number of groups
+    :return: joined subpaths in order
+    """
+    target = sum(map(len, subpaths)) / max(num_groups, 1)
+    groups: list[str] = []
+    group: list[str] = []
+    group_len = 0
+    for subpath in subpaths:
+        if groups and not group and _is_move_only(subpath):
+            groups[-1] += subpath
+            continue
+        group.append(subpath)
+        group_len += len(subpath)
+        if group_len >= target:
+            groups.append("".join(group))
+            group = []
+            group_len = 0
+    if group:
+        groups.append("".join(group))
+    return groups
+
+
+def _format_piece(
+    piece: str,
+    resolution: int | None,
+    relative_or_absolute: RelativeOrAbsolute,
+    is_first: bool,  # noqa: FBT001
+) -> str:
+    """Convert one piece of a split SVG path data string.
+
+    :param piece: an SVG path data string starting with a move command
+    :param resolution: optionally limit the resolution of the output
+    :param relative_or_absolute: the output format
+    :param is_first: True if this piece starts the full path
+    :return: the converted piece, ready to be joined to the converted pieces before
+        and after it
+    """
+    cmds = PathCommands.from_svgd(piece, resolution=resolution)
+    if relative_or_absolute == RelativeOrAbsolute.ABSOLUTE:
+        return cmds.abs_svgd
+    if relative_or_absolute == RelativeOrAbsolute.SHORTEST:
+        return cmds.svgd
+    if relative_or_absolute == RelativeOrAbsolute.COMPRESSED:
+        return "".join(cmds.iter_svgd(relative_or_absolute))
+    if is_first or all(x.cmd == "M" for x in cmds):
+        return cmds.rel_svgd
+    head, *tail = cmds
+    return svgd_join_commands(
+        head.get_svgd(RelativeOrAbsolute.ABSOLUTE),
+        *(x.get_svgd(RelativeOrAbsolute.RELATIVE) for x in tail),
+    )
+
+
+def format_svgd_parallel(
+    svgd: str,
+    resolution: int | None = None,
+    relative_or_absolute: RelativeOrAbsolute = RelativeOrAbsolute.SHORTEST,
+    *,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+) -> str:
+    """Convert a large SVG path data string by converting its subpaths in parallel.
+
+    :param svgd: an SVG path data string
+    :param resolution: optionally limit the resolution of the output
+    :param relative_or_absolute: the output format
+    :param executor: an optional executor to run conversions. By default, create a
+        ProcessPoolExecutor for this call.
+    :param max_workers: the number of workers for the default executor
+    :return: an SVG path data string equivalent to the result of the matching
+        `format_svgd_*` function
+    :raises ValueError: if the SVG path data string is not valid
+
+    Paths with only one subpath are converted in the calling process.
+    """
+    num_workers = max_workers or os.cpu_count() or 1
+    pieces = _group_subpaths(
+        split_svgd_subpaths(svgd), num_workers * _BATCHES_PER_WORKER
+    )
+    if len(pieces) < 2:
+        return _format_piece(svgd, resolution, relative_or_absolute, is_first=True)
+
+    args: Iterable[tuple[str, int | None, RelativeOrAbsolute, bool]] = zip(
+        pieces,
+        it.repeat(resolution),
+        it.repeat(relative_or_absolute),
+        (i == 0 for i in range(len(pieces))),
+    )
+    if executor is not None:
+        return concat_svgd(*executor.map(_format_piece, *zip(*args, strict=True)))
+    with ProcessPoolExecutor(max_workers=num_workers) as pool:
+        return concat_svgd(*pool.map(_format_piece, *zip(*args, strict=True)))
+
+
+def _format_svgd(
+    svgd: str | SvgdBuffer,
+    resolution: int | None,
+    relative_or_absolute: RelativeOrAbsolute,
+) -> str:
+    """Convert one SVG path data string.
+
+    :param svgd: an SVG path data string
+    :param resolution: optionally limit the resolution of the output
+    :param relative_or_absolute: the output format
+    :return: the converted string
+    """
+    cmds = PathCommands.from_svgd(svgd, resolution=resolution)
+    return "".join(cmds.iter_svgd(relative_or_absolute))
+
+
+def format_svgd_many_threaded(
+    svgds: Iterable[str | SvgdBuffer],
+    resolution: int | None = None,
+    relative_or_absolute: RelativeOrAbsolute = RelativeOrAbsolute.SHORTEST,
+    *,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+) -> list[str]:
+    """Convert many SVG path data strings on a thread pool.
+
+    :param svgds: SVG path data strings
+    :param resolution: optionally limit the resolution of the output
+    :param relative_or_absolute: the output format
+    :param executor: an optional executor to run conversions. By default, create a
+        ThreadPoolExecutor for this call.
+    :param max_workers: the number of threads for the default executor
+    :return: the converted strings in input order, each the same as the matching
+        `format_svgd_*` function would return
+    :raises ValueError: if any SVG path data string is not valid
+
+    Conversions share no mutable state, so threads do not wait on each other. With
+    the GIL, threads take turns and there is no speedup. On a free-threaded build,
+    throughput scales with the number of cores.
+    """
+    svgds = list(svgds)
+    args = (it.repeat(resolution, len(svgds)), it.repeat(relative_or_absolute))
+    if executor is not None:
+        return list(executor.map(_format_svgd, svgds, *args))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_format_svgd, svgds, *args))
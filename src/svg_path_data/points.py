@@ -0,0 +1,144 @@
+"""Convert polyline and polygon points attributes.
+
+A `<polyline>` or `<polygon>` points attribute uses the number grammar of SVG
+path data with no commands. These functions format and parse points with the
+same number formatting and separator rules as path data, but without creating a
+`PathCommand` for every point.
+
+    >>> format_points([(0, 0), (10.5, -2), (0.25, 0.5)])
+    '0 0 10.5-2 .25.5'
+    >>> parse_points("0,0 10.5,-2")
+    [(0.0, 0.0), (10.5, -2.0)]
+    >>> get_svgd_from_points("0 0 10 0 10 10", closed=True)
+    'M0 0 10 0 10 10Z'
+    >>> get_points_from_svgd("M0 0H10V10Z")
+    ('0 0 10 0 10 10', True)
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import itertools as it
+from typing import TYPE_CHECKING
+
+from svg_path_data.float_string_conversion import format_number
+from svg_path_data.string_ops import iter_svgd_commands, join_numbers, split_numbers
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from svg_path_data.string_ops import SvgdBuffer
+
+
+def _iter_numbers(
+    points: str | Iterable[Iterable[float]], resolution: int | None
+) -> Iterator[str]:
+    """Iterate over the formatted numbers of a list of points.
+
+    :param points: a points attribute or xy points
+    :param resolution: optionally limit the resolution of the output
+    :return: None
+    :yield: x0, y0, x1, y1, ... formatted
+    :raises ValueError: if points is a points attribute with an odd count of
+        numbers or anything other than numbers, whitespace, and commas
+    """
+    if isinstance(points, str):
+        numbers = split_numbers(points)
+        if len(numbers) % 2:
+            msg = f"Expected an even count of numbers, got {len(numbers)}."
+            raise ValueError(msg)
+        return (format_number(float(x), resolution) for x in numbers)
+    return (format_number(x, resolution) for x in it.chain.from_iterable(points))
+
+
+def format_points(
+    points: str | Iterable[Iterable[float]], resolution: int | None = None
+) -> str:
+    """Format a points attribute with as few characters as possible.
+
+    :param points: a points attribute or xy points
+    :param resolution: optionally limit the resolution of the output
+    :return: a points attribute for a polyline or polygon
+    :raises ValueError: if points is a string that is not a valid points attribute
+    """
+    return join_numbers(_iter_numbers(points, resolution))
+
+
+def parse_points(points: str) -> list[tuple[float, float]]:
+    """Parse a points attribute.
+
+    :param points: the points attribute of a polyline or polygon
+    :return: xy points
+    :raises ValueError: if points has an odd count of numbers or anything other
+        than numbers, whitespace, and commas
+    """
+    numbers = [float(x) for x in split_numbers(points)]
+    if len(numbers) % 2:
+        msg = f"Expected an even count of numbers, got {len(numbers)}."
+        raise ValueError(msg)
+    return list(zip(numbers[::2], numbers[1::2], strict=True))
+
+
+def get_svgd_from_points(
+    points: str | Iterable[Iterable[float]],
+    *,
+    closed: bool = False,
+    resolution: int | None = None,
+) -> str:
+    """Get the SVG path data string that draws a polyline or polygon.
+
+    :param points: a points attribute or xy points
+    :param closed: True for a polygon, False for a polyline
+    :param resolution: optionally limit the resolution of the output
+    :return: an absolute SVG path data string, a move then implicit lines. This
+        is not minimized. Use `format_svgd_shortest` for the shortest string.
+    :raises ValueError: if points is a string that is not a valid points attribute
+    """
+    numbers = join_numbers(_iter_numbers(points, resolution))
+    if not numbers:
+        return ""
+    return "M" + numbers + ("Z" if closed else "")
+
+
+def get_points_from_svgd(
+    svgd: str | SvgdBuffer, resolution: int | None = None
+) -> tuple[str, bool]:
+    """Get the points attribute of a path that is a polyline or polygon.
+
+    :param svgd: an SVG path data string with one subpath of lines
+    :param resolution: optionally limit the resolution of the output
+    :return: a points attribute and True if the path is closed, so the points are
+        a polygon, or False for a polyline
+    :raises ValueError: if svgd has curves, arcs, or more than one subpath
+    """
+    points: list[float] = []
+    start = (0.0, 0.0)
+    x = y = 0.0
+    closed = False
+    for cmd, vals in iter_svgd_commands(svgd):
+        if closed or (cmd in "Mm" and points):
+            msg = "A polyline or polygon has only one subpath."
+            raise ValueError(msg)
+        upper = cmd.upper()
+        if upper in "ML":
+            x, y = (vals[0] + x, vals[1] + y) if cmd in "ml" else vals
+        elif upper == "H":
+            x = vals[0] + x if cmd == "h" else vals[0]
+        elif upper == "V":
+            y = vals[0] + y if cmd == "v" else vals[0]
+        elif upper == "Z":
+            closed = True
+            x, y = start
+            continue
+        else:
+            msg = f"A polyline or polygon has only lines. Found '{cmd}'."
+            raise ValueError(msg)
+        if upper == "M":
+            start = (x, y)
+        points.extend((x, y))
+    if closed and len(points) > 2 and tuple(points[-2:]) == start:
+        del points[-2:]  # a polygon closes itself
+    xys = zip(points[::2], points[1::2], strict=True)
+    return format_points(xys, resolution), closed
@@ -0,0 +1,236 @@
+"""Flatten SVG path data to polylines within a tolerance.
+
+Each curve is split into as few straight segments as keep every point of the curve
+within `tolerance` of the polyline. For a Bezier curve of degree d, Wang's formula
+bounds the distance between the curve and a polyline of n uniform steps by
+
+    d (d - 1) / 8 * max |P[i] - 2 P[i + 1] + P[i + 2]| / n**2
+
+so n is chosen per curve from its control points alone. Arcs are split into equal
+angles with the sagitta of the larger radius within the tolerance.
+
+Points are evaluated with cached Bernstein weights for each (degree, steps) pair,
+and written to one flat buffer. A closed subpath ends with its first point.
+Subpaths with only a move command are dropped. Wrap the buffer with
+`numpy.frombuffer(result.coords).reshape(-1, 2)` for an (N, 2) view without
+copying.
+
+    >>> result = flatten("M0 0H10V10ZM20 0Q30 10 40 0", tolerance=1)
+    >>> list(result.coords[:8])
+    [0.0, 0.0, 10.0, 0.0, 10.0, 10.0, 0.0, 0.0]
+    >>> list(result.offsets), list(result.closed)
+    ([0, 4, 8], [1, 0])
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import functools as ft
+import itertools as it
+import math
+from array import array
+from typing import TYPE_CHECKING, NamedTuple
+
+from svg_path_data.svg_data import PathCommands
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from svg_path_data.string_ops import SvgdBuffer
+
+
+class FlatPath(NamedTuple):
+    """Polylines in flat buffers.
+
+    :param coords: every point of every polyline [x0, y0, x1, y1, ...]
+    :param offsets: the index (in points, not floats) where each polyline starts,
+        followed by the total number of points. Polyline i is points
+        offsets[i] to offsets[i + 1].
+    :param closed: 1 for each polyline that ends at its first point, whether
+        closed with a z command or with a line, curve, or arc that ends there,
+        else 0
+    """
+
+    coords: array[float]
+    offsets: array[int]
+    closed: array[int]
+
+
+@ft.lru_cache(maxsize=256)
+def _get_bernstein_weights(degree: int, steps: int) -> tuple[tuple[float, ...], ...]:
+    """Get the Bernstein basis at each step after the start of a curve.
+
+    :param degree: the degree of the curve
+    :param steps: the number of segments to split the curve into
+    :return: for each time 1/steps, 2/steps, ... 1, a weight per control point
+    """
+    weights: list[tuple[float, ...]] = []
+    for step in range(1, steps + 1):
+        time = step / steps
+        weights.append(
+            tuple(
+                math.comb(degree, i) * time**i * (1 - time) ** (degree - i)
+                for i in range(degree + 1)
+            )
+        )
+    return tuple(weights)
+
+
+def get_bezier_steps(cpts: Sequence[tuple[float, float]], tolerance: float) -> int:
+    """Get the number of uniform steps that keep a Bezier curve within tolerance.
+
+    :param cpts: control points of a Bezier curve
+    :param tolerance: the largest allowed distance between curve and polyline
+    :return: the number of straight segments (at least 1) from Wang's formula
+    """
+    degree = len(cpts) - 1
+    if degree < 2:
+        return 1
+    diffs = [(bx - ax, by - ay) for (ax, ay), (bx, by) in it.pairwise(cpts)]
+    most = max(
+        math.hypot(bx - ax, by - ay) for (ax, ay), (bx, by) in it.pairwise(diffs)
+    )
+    bound = degree * (degree - 1) / 8 * most
+    return max(math.ceil(math.sqrt(bound / tolerance)), 1)
+
+
+def _extend_bezier(
+    coords: array[float], cpts: Sequence[tuple[float, float]], tolerance: float
+) -> None:
+    """Add the points after the first of a flattened Bezier curve.
+
+    :param coords: the buffer to extend
+    :param cpts: control points of a Bezier curve
+    :param tolerance: the largest allowed distance between curve and polyline
+    """
+    steps = get_bezier_steps(cpts, tolerance)
+    if steps == 1:
+        coords.extend(cpts[-1])
+        return
+    xs = [x for x, _ in cpts]
+    ys = [y for _, y in cpts]
+    for weights in _get_bernstein_weights(len(cpts) - 1, steps):
+        coords.append(sum(w * x for w, x in zip(weights, xs, strict=True)))
+        coords.append(sum(w * y for w, y in zip(weights, ys, strict=True)))
+
+
+def _get_angle(ux: float, uy: float, vx: float, vy: float) -> float:
+    """Get the signed angle from vector u to vector v.
+
+    :param ux: x of u
+    :param uy: y of u
+    :param vx: x of v
+    :param vy: y of v
+    :return: the angle in radians, in [-pi, pi]
+    """
+    return math.atan2(ux * vy - uy * vx, ux * vx + uy * vy)
+
+
+def iter_arc_points(
+    start: tuple[float, float], arc_vals: Sequence[float], tolerance: float
+) -> Iterator[tuple[float, float]]:
+    """Flatten an SVG elliptical arc.
+
+    :param start: the current point where the arc starts
+    :param arc_vals: the seven values of an absolute arc command (rx, ry,
+        x-axis-rotation, large-arc-flag, sweep-flag, x, y)
+    :param tolerance: the largest allowed distance between arc and polyline
+    :return: None
+    :yield: each point after start, ending with (x, y)
+
+    Converts from endpoint to center parameterization as described in the SVG
+    implementation notes, including scaling radii that are too small.
+    """
+    rx, ry, rotation, large_arc, sweep, x, y = arc_vals
+    x0, y0 = start
+    rx, ry = abs(rx), abs(ry)
+    if not rx or not ry or (x0, y0) == (x, y):
+        yield x, y
+        return
+    phi = math.radians(rotation)
+    cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+    dx, dy = (x0 - x) / 2, (y0 - y) / 2
+    x1p = cos_phi * dx + sin_phi * dy
+    y1p = -sin_phi * dx + cos_phi * dy
+
+    scale = (x1p / rx) ** 2 + (y1p / ry) ** 2
+    if scale > 1:
+        rx, ry = rx * math.sqrt(scale), ry * math.sqrt(scale)
+    num = rx**2 * ry**2 - rx**2 * y1p**2 - ry**2 * x1p**2
+    den = rx**2 * y1p**2 + ry**2 * x1p**2
+    coef = math.sqrt(max(num / den, 0))
+    if bool(large_arc) == bool(sweep):
+        coef = -coef
+    cxp, cyp = coef * rx * y1p / ry, -coef * ry * x1p / rx
+    cx = cos_phi * cxp - sin_phi * cyp + (x0 + x) / 2
+    cy = sin_phi * cxp + cos_phi * cyp + (y0 + y) / 2
+
+    theta = _get_angle(1, 0, (x1p - cxp) / rx, (y1p - cyp) / ry)
+    delta = _get_angle(
+        (x1p - cxp) / rx, (y1p - cyp) / ry, (-x1p - cxp) / rx, (-y1p - cyp) / ry
+    )
+    if not sweep and delta > 0:
+        delta -= 2 * math.pi
+    elif sweep and delta < 0:
+        delta += 2 * math.pi
+
+    radius = max(rx, ry)
+    max_step = 2 * math.acos(max(1 - tolerance / radius, -1))
+    steps = max(math.ceil(abs(delta) / max_step), 1)
+    for step in range(1, steps):
+        angle = theta + delta * step / steps
+        ex, ey = rx * math.cos(angle), ry * math.sin(angle)
+        yield cos_phi * ex - sin_phi * ey + cx, sin_phi * ex + cos_phi * ey + cy
+    yield x, y
+
+
+def flatten(
+    svgd_or_commands: str | SvgdBuffer | PathCommands,
+    tolerance: float,
+    resolution: int | None = None,
+) -> FlatPath:
+    """Flatten every curve and arc in a path to polylines.
+
+    :param svgd_or_commands: an SVG path data string, ascii SVG path data in a
+        bytes-like object, or a PathCommands instance
+    :param tolerance: the largest allowed distance between any point of the path
+        and its polyline
+    :param resolution: optionally limit the resolution used to identify linear
+        curves and closed paths when parsing path data
+    :return: polylines as one flat coordinate buffer with an offset for the start
+        of each subpath
+    :raises ValueError: if tolerance is not positive
+    """
+    if not tolerance > 0:
+        msg = f"Tolerance must be positive, got {tolerance}."
+        raise ValueError(msg)
+    if isinstance(svgd_or_commands, PathCommands):
+        cmds = svgd_or_commands
+    else:
+        cmds = PathCommands.from_svgd(svgd_or_commands, resolution)
+
+    coords: array[float] = array("d")
+    offsets: array[int] = array("q")
+    closed: array[int] = array("B")
+    current = (0.0, 0.0)
+    for cmd in cmds:
+        if cmd.cmd == "M":
+            if offsets and len(coords) // 2 - offsets[-1] == 1:
+                _ = offsets.pop(), closed.pop(), coords.pop(), coords.pop()
+            offsets.append(len(coords) // 2)
+            closed.append(0)
+            coords.extend(cmd.abs_vals)
+        elif cmd.cmd == "A":
+            for point in iter_arc_points(current, cmd.abs_vals, tolerance):
+                coords.extend(point)
+        else:
+            _extend_bezier(coords, cmd.cpts, tolerance)
+        if cmd.cmd != "M" and cmd.does_close:
+            closed[-1] = 1
+        current = (coords[-2], coords[-1])
+    if offsets and len(coords) // 2 - offsets[-1] == 1:
+        _ = offsets.pop(), closed.pop(), coords.pop(), coords.pop()
+    offsets.append(len(coords) // 2)
+    return FlatPath(coords, offsets, closed)
@@ -0,0 +1,352 @@
+"""Reorder subpaths to shorten the moves between them.
+
+Paths from CAD and plotting tools often draw their subpaths in an arbitrary
+order. Every subpath that does not start where the last one ended needs a move
+command, and every move is pen-up travel for a plotter or laser cutter.
+
+`reorder_subpaths` builds a tour with a greedy nearest-neighbor search over a
+grid of subpath end points, then refines it with windowed local search. Where
+the fill rule allows, open subpaths may be drawn backward.
+
+    >>> reorder_svgd("M9 0H10M0 0H1M1 0H2", fill_rule=None)
+    'M0 0H2M9 0h1'
+
+Subpath order never changes a fill, but direction does. Reversing a subpath
+flips its winding number, so subpaths of a "nonzero" fill keep their direction.
+An "evenodd" fill depends only on parity, and an unfilled path (fill_rule None)
+has no fill at all, so those may reverse. Joining an open subpath to the next
+would change how a fill implicitly closes it, so `reorder_svgd` drops move
+commands between subpaths that meet only when the path is unfilled.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import itertools as it
+import math
+from typing import TYPE_CHECKING, Literal
+
+from svg_path_data._grid import UniformGrid
+from svg_path_data.svg_data import PathCommands, iter_subpaths
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from svg_path_data.string_ops import SvgdBuffer
+
+_Point = tuple[float, float]
+_Subpath = list[list[tuple[float, float]]]
+_Cell = tuple[int, int]
+
+# Local search tries to move or reverse runs of up to this many subpaths. A
+# greedy tour is mostly good with local defects, so a window keeps each pass
+# linear in the number of subpaths.
+_WINDOW = 16
+
+# Stop local search after this many passes, even if it is still improving.
+_MAX_PASSES = 8
+
+_CURVE_COMMANDS = {2: "L", 3: "Q", 4: "C"}
+
+
+def _get_distance(a: _Point, b: _Point | None) -> float:
+    """Get the distance between two points.
+
+    :param a: an xy point
+    :param b: an xy point or None for the end of the tour
+    :return: the distance from a to b or 0 if b is None
+    """
+    if b is None:
+        return 0.0
+    return math.hypot(b[0] - a[0], b[1] - a[1])
+
+
+def _reverse(subpath: _Subpath) -> _Subpath:
+    """Draw a subpath backward.
+
+    :param subpath: a list of curves, each a list of xy tuples
+    :return: the same curves in reverse order, each with reversed control points
+    """
+    return [curve[::-1] for curve in reversed(subpath)]
+
+
+def _check_fill_rule(fill_rule: Literal["nonzero", "evenodd"] | None) -> None:
+    """Raise a ValueError for an unknown fill rule.
+
+    :param fill_rule: "nonzero", "evenodd", or None for an unfilled path
+    :raises ValueError: if fill_rule is not one of those
+    """
+    if fill_rule not in {"nonzero", "evenodd", None}:
+        msg = (
+            f"Unknown fill rule {fill_rule!r}. "
+            + "Expected 'nonzero', 'evenodd', or None."
+        )
+        raise ValueError(msg)
+
+
+class _PointGrid:
+    """A uniform grid of points that supports nearest-point search and removal."""
+
+    def __init__(self, points: Sequence[_Point | None]) -> None:
+        """Index points, about one per cell.
+
+        :param points: xy points. None entries are never found.
+        """
+        self._points = points
+        present = [p for p in points if p is not None] or [(0.0, 0.0)]
+        bbox = (
+            min(x for x, _ in present),
+            min(y for _, y in present),
+            max(x for x, _ in present),
+            max(y for _, y in present),
+        )
+        self._grid = UniformGrid(bbox, len(present))
+        self._cells: dict[_Cell, list[int]] = {}
+        for i, point in enumerate(points):
+            if point is not None:
+                self._cells.setdefault(self._grid.get_cell(point), []).append(i)
+
+    def remove(self, index: int) -> None:
+        """Remove a point so it is never found again.
+
+        :param index: the index of the point
+        """
+        point = self._points[index]
+        if point is not None:
+            self._cells[self._grid.get_cell(point)].remove(index)
+
+    def get_nearest(self, point: _Point) -> int | None:
+        """Get the nearest remaining point.
+
+        :param point: an xy point
+        :return: the index of the nearest point, the lowest index among ties, or
+            None if no points remain
+
+        Search rings of cells outward from the point, and stop once every
+        unvisited cell is farther than the best point found.
+        """
+        best: tuple[float, int] | None = None
+        grid = self._grid
+        col, row = grid.get_cell(point)
+        for ring in range(max(grid.cols, grid.rows) + 1):
+            for cell in grid.iter_ring(col, row, ring):
+                for i in self._cells.get(cell, ()):
+                    candidate = self._points[i]
+                    if candidate is None:
+                        continue
+                    key = (_get_distance(point, candidate), i)
+                    if best is None or key < best:
+                        best = key
+            if best is not None and best[0] < grid.get_unvisited_distance(
+                point, col, row, ring
+            ):
+                break
+        return None if best is None else best[1]
+
+
+class _Tour:
+    """An order and direction for each subpath, from a start point."""
+
+    def __init__(
+        self, ends: Sequence[tuple[_Point, _Point]], start: _Point, *, reverse: bool
+    ) -> None:
+        """Build a tour by always drawing the nearest undrawn subpath next.
+
+        :param ends: the first and last point of each subpath
+        :param start: where the pen starts
+        :param reverse: whether open subpaths may be drawn backward
+        """
+        self._ends = ends
+        self._start = start
+        endpoints: list[_Point | None] = []
+        for first, last in ends:
+            endpoints.extend((first, last if reverse and first != last else None))
+        grid = _PointGrid(endpoints)
+        self.order: list[tuple[int, bool]] = []
+        current = start
+        while (nearest := grid.get_nearest(current)) is not None:
+            subpath, is_reversed = divmod(nearest, 2)
+            grid.remove(subpath * 2)
+            grid.remove(subpath * 2 + 1)
+            self.order.append((subpath, bool(is_reversed)))
+            current = self._get_last(len(self.order) - 1)
+
+    def _get_first(self, pos: int) -> _Point:
+        """Get where the subpath at a position starts.
+
+        :param pos: a position in the tour
+        :return: the first point drawn
+        """
+        subpath, is_reversed = self.order[pos]
+        return self._ends[subpath][is_reversed]
+
+    def _get_next(self, pos: int) -> _Point | None:
+        """Get where the subpath at a position starts, if there is one.
+
+        :param pos: a position in the tour or the end of the tour
+        :return: the first point drawn, or None at the end of the tour
+        """
+        if pos >= len(self.order):
+            return None
+        return self._get_first(pos)
+
+    def _get_last(self, pos: int) -> _Point:
+        """Get where the subpath at a position ends.
+
+        :param pos: a position in the tour, or -1 for the start point
+        :return: the last point drawn
+        """
+        if pos < 0:
+            return self._start
+        subpath, is_reversed = self.order[pos]
+        return self._ends[subpath][not is_reversed]
+
+    def two_opt(self) -> bool:
+        """Reverse the run of subpaths between two positions if that is shorter.
+
+        :return: True if any run was reversed
+        """
+        improved = False
+        count = len(self.order)
+        for i in range(count):
+            before = self._get_last(i - 1)
+            for j in range(i, min(i + _WINDOW, count)):
+                after = self._get_next(j + 1)
+                first, last = self._get_first(i), self._get_last(j)
+                old = _get_distance(before, first) + _get_distance(last, after)
+                new = _get_distance(before, last) + _get_distance(first, after)
+                if new < old:
+                    run = self.order[i : j + 1]
+                    self.order[i : j + 1] = [(s, not r) for s, r in reversed(run)]
+                    improved = True
+        return improved
+
+    def or_opt(self) -> bool:
+        """Move single subpaths to nearby positions where they shorten the tour.
+
+        :return: True if any subpath was moved
+        """
+        improved = False
+        for i in range(len(self.order)):
+            first, last = self._get_first(i), self._get_last(i)
+            before, after = self._get_last(i - 1), self._get_next(i + 1)
+            saved = (
+                _get_distance(before, first)
+                + _get_distance(last, after)
+                - _get_distance(before, after)
+            )
+            item = self.order.pop(i)
+            best: tuple[float, int] | None = None
+            stop = min(i + _WINDOW, len(self.order))
+            for pos in range(max(i - _WINDOW, 0), stop + 1):
+                prev, next_ = self._get_last(pos - 1), self._get_next(pos)
+                cost = (
+                    _get_distance(prev, first)
+                    + _get_distance(last, next_)
+                    - _get_distance(prev, next_)
+                )
+                if cost < saved and (best is None or cost < best[0]):
+                    best = (cost, pos)
+            self.order.insert(i if best is None else best[1], item)
+            improved = improved or (best is not None and best[1] != i)
+        return improved
+
+
+def get_travel_distance(
+    subpaths: Iterable[Sequence[Sequence[tuple[float, float]]]],
+    start: tuple[float, float] = (0.0, 0.0),
+) -> float:
+    """Get the total length of the moves between subpaths.
+
+    :param subpaths: for each subpath, the control points of each curve, as
+        yielded by `iter_subpaths`
+    :param start: where the pen starts
+    :return: the sum of the distances from the end of each subpath (or start) to
+        the start of the next
+    """
+    total = 0.0
+    current = start
+    for subpath in subpaths:
+        if not subpath:
+            continue
+        total += _get_distance(current, subpath[0][0])
+        current = subpath[-1][-1]
+    return total
+
+
+def reorder_subpaths(
+    subpaths: Iterable[Sequence[Sequence[tuple[float, float]]]],
+    fill_rule: Literal["nonzero", "evenodd"] | None = "nonzero",
+    start: tuple[float, float] = (0.0, 0.0),
+) -> list[_Subpath]:
+    """Reorder subpaths, and reverse them where allowed, to shorten pen-up travel.
+
+    :param subpaths: for each subpath, the control points of each curve, as
+        yielded by `iter_subpaths`
+    :param fill_rule: the SVG fill-rule of the path, or None for a path that is
+        only stroked. Subpaths are reversed only for "evenodd" or None.
+    :param start: where the pen starts
+    :return: the same subpaths in a new order, some perhaps reversed
+    :raises ValueError: if fill_rule is not "nonzero", "evenodd", or None
+
+    The tour is built greedily and then improved by reversing runs of subpaths
+    (2-opt) where reversing is allowed, else by moving single subpaths (or-opt).
+    A result is never longer than the input order.
+    """
+    _check_fill_rule(fill_rule)
+    input_: list[_Subpath] = [
+        [[(x, y) for x, y in c] for c in s] for s in subpaths if s
+    ]
+    if len(input_) < 2:
+        return input_
+    ends = [(s[0][0], s[-1][-1]) for s in input_]
+    tour = _Tour(ends, start, reverse=fill_rule != "nonzero")
+    improve = tour.or_opt if fill_rule == "nonzero" else tour.two_opt
+    for _ in range(_MAX_PASSES):
+        if not improve():
+            break
+    output = [_reverse(input_[i]) if r else input_[i] for i, r in tour.order]
+    if get_travel_distance(output, start) > get_travel_distance(input_, start):
+        return input_
+    return output
+
+
+def _iter_commands(
+    subpaths: Iterable[_Subpath], *, is_filled: bool
+) -> Iterator[tuple[str, list[float]]]:
+    """Iterate over the svg commands that draw a list of subpaths.
+
+    :param subpaths: a list of subpaths, each a list of curves
+    :param is_filled: keep a move command before every subpath
+    :return: None
+    :yield: (command, floats) pairs for `PathCommands.from_commands`
+    """
+    last: tuple[float, float] | None = None
+    for subpath in subpaths:
+        if is_filled or subpath[0][0] != last:
+            yield "M", list(subpath[0][0])
+        for curve in subpath:
+            yield _CURVE_COMMANDS[len(curve)], list(it.chain(*curve[1:]))
+        last = subpath[-1][-1]
+
+
+def reorder_svgd(
+    svgd: str | SvgdBuffer,
+    fill_rule: Literal["nonzero", "evenodd"] | None = "nonzero",
+    resolution: int | None = None,
+) -> str:
+    """Reorder the subpaths of an SVG path data string to shorten pen-up travel.
+
+    :param svgd: an SVG path data string or ascii SVG path data in a bytes-like
+        object
+    :param fill_rule: the SVG fill-rule of the path, or None for a path that is
+        only stroked
+    :param resolution: optionally limit the resolution of the output
+    :return: the shortest SVG path data string for the reordered subpaths
+    :raises ValueError: if svgd contains arc commands or fill_rule is unknown
+    """
+    subpaths = reorder_subpaths(iter_subpaths(svgd, resolution), fill_rule)
+    commands = _iter_commands(subpaths, is_filled=fill_rule is not None)
+    return PathCommands.from_commands(commands, resolution).svgd
@@ -0,0 +1,319 @@
+"""A spatial index over the segments of a path for hit testing.
+
+Scanning every segment of a large path for each mouse event is too slow for an
+interactive editor. `SegmentIndex` registers the tight bounding box of each
+segment in a uniform grid, so a query visits only the cells near the point or
+rectangle.
+
+    >>> index = SegmentIndex.from_svgd("M0 0H10V10H0ZM3 3H7V7H3Z")
+    >>> index.get_nearest_segment((5, -1)).segment
+    0
+    >>> index.get_segments_in_rect(6, 6, 8, 8)
+    [5, 6]
+    >>> index.contains((1, 1)), index.contains((5, 5))
+    (True, True)
+    >>> index.contains((5, 5), "evenodd")
+    False
+
+Segments are numbered in path order, as in `get_cpts_from_svgd`. Every subpath
+is implicitly closed for `contains` and `get_winding_number`, as SVG fills are.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Literal, NamedTuple
+
+from svg_path_data._grid import UniformGrid
+from svg_path_data.bezier import get_bbox, get_nearest_time, get_winding_crossings
+from svg_path_data.svg_data import PathCommands
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from svg_path_data.string_ops import SvgdBuffer
+
+_Bbox = tuple[float, float, float, float]
+_Cell = tuple[int, int]
+
+# The default max_distance for nearest-segment searches: no segment is too far.
+_NO_LIMIT = math.inf
+
+
+class NearestSegment(NamedTuple):
+    """The segment nearest a point.
+
+    :param segment: the index of the segment in path order
+    :param time: the curve time of the nearest point on the segment
+    :param distance: the distance from the query point to the segment
+    """
+
+    segment: int
+    time: float
+    distance: float
+
+
+def _get_bbox_distance(bbox: _Bbox, point: tuple[float, float]) -> float:
+    """Get the distance from a point to a bounding box.
+
+    :param bbox: min_x, min_y, max_x, max_y
+    :param point: an xy point
+    :return: 0 if the point is inside the box, else the distance to the box
+    """
+    min_x, min_y, max_x, max_y = bbox
+    px, py = point
+    dx = max(min_x - px, 0.0, px - max_x)
+    dy = max(min_y - py, 0.0, py - max_y)
+    return math.hypot(dx, dy)
+
+
+class SegmentIndex:
+    """A uniform grid over the tight bounding boxes of path segments.
+
+    The grid is sized so that there is about one cell per segment. Points and
+    segments outside the grid (after an edit) fall into the edge cells, so the
+    index stays correct as segments move, but queries slow down if many move far
+    away. Call `rebuild` to fit a new grid after large edits.
+    """
+
+    def __init__(
+        self, subpaths: Iterable[Iterable[Sequence[tuple[float, float]]]]
+    ) -> None:
+        """Index the segments of a path.
+
+        :param subpaths: for each subpath, the control points of each segment, as
+            yielded by `iter_subpaths`
+        """
+        self._segments: list[list[tuple[float, float]]] = []
+        self._subpath_of: list[int] = []
+        self._subpath_ranges: list[tuple[int, int]] = []
+        for subpath in subpaths:
+            start = len(self._segments)
+            self._segments.extend(list(c) for c in subpath)
+            stop = len(self._segments)
+            if stop > start:
+                self._subpath_of.extend([len(self._subpath_ranges)] * (stop - start))
+                self._subpath_ranges.append((start, stop))
+
+        self._bboxes: list[_Bbox] = []
+        self._closers: list[list[tuple[float, float]]] = []
+        self._grid = UniformGrid((0.0, 0.0, 0.0, 0.0), 1)
+        self._cells: dict[_Cell, list[int]] = {}
+        self._closer_cells: dict[_Cell, list[int]] = {}
+        self.rebuild()
+
+    @classmethod
+    def from_commands(cls, cmds: PathCommands) -> SegmentIndex:
+        """Index the segments of a PathCommands instance.
+
+        :param cmds: a linked list of path commands
+        :return: an index of every segment in cmds
+        :raises ValueError: if cmds contains arc commands
+        """
+        subpaths: list[list[list[tuple[float, float]]]] = []
+        for cmd in cmds:
+            if cmd.cmd == "M":
+                subpaths.append([])
+            elif cpts := cmd.cpts:
+                subpaths[-1].append(cpts)
+        return cls(subpaths)
+
+    @classmethod
+    def from_svgd(cls, svgd: str | SvgdBuffer) -> SegmentIndex:
+        """Index the segments of an SVG path data string.
+
+        :param svgd: an SVG path data string
+        :return: an index of every segment in svgd
+        :raises ValueError: if svgd contains arc commands
+        """
+        return cls.from_commands(PathCommands.from_svgd(svgd))
+
+    def __len__(self) -> int:
+        """Get the number of segments.
+
+        :return: the number of segments in the index
+        """
+        return len(self._segments)
+
+    def get_segment(self, index: int) -> list[tuple[float, float]]:
+        """Get the control points of a segment.
+
+        :param index: the index of the segment in path order
+        :return: the control points of the segment
+        """
+        return self._segments[index]
+
+    def rebuild(self) -> None:
+        """Fit a new grid to the current segments."""
+        self._bboxes = [get_bbox(c) for c in self._segments]
+        self._closers = [self._get_closer(i) for i in range(len(self._subpath_ranges))]
+        bboxes = self._bboxes or [(0.0, 0.0, 0.0, 0.0)]
+        bounds = (
+            min(b[0] for b in bboxes),
+            min(b[1] for b in bboxes),
+            max(b[2] for b in bboxes),
+            max(b[3] for b in bboxes),
+        )
+        self._grid = UniformGrid(bounds, len(bboxes))
+        self._cells = {}
+        self._closer_cells = {}
+        for i, bbox in enumerate(self._bboxes):
+            self._register(self._cells, i, bbox)
+        for i, closer in enumerate(self._closers):
+            self._register(self._closer_cells, i, get_bbox(closer))
+
+    def update_segment(self, index: int, cpts: Sequence[tuple[float, float]]) -> None:
+        """Replace the control points of one segment without rebuilding the grid.
+
+        :param index: the index of the segment in path order
+        :param cpts: the new control points of the segment
+
+        Only this segment and the implicit close of its subpath are updated. If
+        the end points move, update the neighboring segments as well.
+        """
+        self._unregister(self._cells, index, self._bboxes[index])
+        self._segments[index] = list(cpts)
+        self._bboxes[index] = get_bbox(self._segments[index])
+        self._register(self._cells, index, self._bboxes[index])
+
+        subpath = self._subpath_of[index]
+        self._unregister(self._closer_cells, subpath, get_bbox(self._closers[subpath]))
+        self._closers[subpath] = self._get_closer(subpath)
+        self._register(self._closer_cells, subpath, get_bbox(self._closers[subpath]))
+
+    def get_segments_in_rect(
+        self, min_x: float, min_y: float, max_x: float, max_y: float
+    ) -> list[int]:
+        """Get the segments whose tight bounding boxes intersect a rectangle.
+
+        :param min_x: the left side of the rectangle
+        :param min_y: the top side of the rectangle
+        :param max_x: the right side of the rectangle
+        :param max_y: the bottom side of the rectangle
+        :return: the sorted indices of segments with bounding boxes that touch or
+            overlap the rectangle
+        """
+        rect = (min_x, min_y, max_x, max_y)
+        found: set[int] = set()
+        for cell in self._grid.iter_cells(rect):
+            for i in self._cells.get(cell, ()):
+                bbox = self._bboxes[i]
+                is_in_x = bbox[0] <= max_x and min_x <= bbox[2]
+                if is_in_x and bbox[1] <= max_y and min_y <= bbox[3]:
+                    found.add(i)
+        return sorted(found)
+
+    def get_nearest_segment(
+        self, point: tuple[float, float], max_distance: float = _NO_LIMIT
+    ) -> NearestSegment | None:
+        """Get the segment nearest a point.
+
+        :param point: an xy point
+        :param max_distance: optionally ignore segments farther than this
+        :return: the nearest segment, the time of the nearest point on it, and the
+            distance, or None if there are no segments within max_distance
+
+        Search rings of cells outward from the point, and stop once every
+        unvisited cell is farther than the best segment found.
+        """
+        best: NearestSegment | None = None
+        best_distance = max_distance
+        seen: set[int] = set()
+        grid = self._grid
+        col, row = grid.get_cell(point)
+        for ring in range(max(grid.cols, grid.rows) + 1):
+            for cell in grid.iter_ring(col, row, ring):
+                for i in self._cells.get(cell, ()):
+                    if i in seen:
+                        continue
+                    seen.add(i)
+                    if _get_bbox_distance(self._bboxes[i], point) > best_distance:
+                        continue
+                    time, distance = get_nearest_time(self._segments[i], point)
+                    if distance <= best_distance and (
+                        best is None or (distance, i) < (best.distance, best.segment)
+                    ):
+                        best = NearestSegment(i, time, distance)
+                        best_distance = distance
+            if grid.get_unvisited_distance(point, col, row, ring) > best_distance:
+                break
+        return best
+
+    def get_winding_number(self, point: tuple[float, float]) -> int:
+        """Get the winding number of the path around a point.
+
+        :param point: an xy point
+        :return: the signed number of times the path, with every subpath closed,
+            winds around point
+        """
+        px, py = point
+        ray = (px, py, math.inf, py)
+        winding = 0
+        for cells, bboxes, curves in (
+            (self._cells, self._bboxes, self._segments),
+            (self._closer_cells, None, self._closers),
+        ):
+            found: set[int] = set()
+            for cell in self._grid.iter_cells(ray):
+                found.update(cells.get(cell, ()))
+            for i in found:
+                bbox = get_bbox(curves[i]) if bboxes is None else bboxes[i]
+                if bbox[1] <= py <= bbox[3] and bbox[2] > px:
+                    winding += get_winding_crossings(curves[i], point)
+        return winding
+
+    def contains(
+        self,
+        point: tuple[float, float],
+        fill_rule: Literal["nonzero", "evenodd"] = "nonzero",
+    ) -> bool:
+        """Check if a point is inside the filled path.
+
+        :param point: an xy point
+        :param fill_rule: the SVG fill-rule, "nonzero" (the SVG default) or
+            "evenodd"
+        :return: True if the point would be filled
+        :raises ValueError: if fill_rule is not "nonzero" or "evenodd"
+        """
+        winding = self.get_winding_number(point)
+        if fill_rule == "nonzero":
+            return winding != 0
+        if fill_rule == "evenodd":
+            return winding % 2 == 1
+        msg = f"Unknown fill rule {fill_rule!r}. Expected 'nonzero' or 'evenodd'."
+        raise ValueError(msg)
+
+    def _get_closer(self, subpath: int) -> list[tuple[float, float]]:
+        """Get the line that implicitly closes a subpath.
+
+        :param subpath: the index of the subpath
+        :return: a line from the end of the subpath to its start. This is zero
+            length if the subpath is already closed.
+        """
+        start, stop = self._subpath_ranges[subpath]
+        return [self._segments[stop - 1][-1], self._segments[start][0]]
+
+    def _register(self, cells: dict[_Cell, list[int]], index: int, bbox: _Bbox) -> None:
+        """Add an index to every cell its bounding box touches.
+
+        :param cells: the grid to add to
+        :param index: a segment or subpath index
+        :param bbox: the bounding box of the segment
+        """
+        for cell in self._grid.iter_cells(bbox):
+            cells.setdefault(cell, []).append(index)
+
+    def _unregister(
+        self, cells: dict[_Cell, list[int]], index: int, bbox: _Bbox
+    ) -> None:
+        """Remove an index from every cell its bounding box touches.
+
+        :param cells: the grid to remove from
+        :param index: a segment or subpath index
+        :param bbox: the bounding box the segment was registered with
+        """
+        for cell in self._grid.iter_cells(bbox):
+            cells[cell].remove(index)
@@ -9,19 +9,42 @@ from __future__ import annotations
 import dataclasses
 import itertools as it
 import re
+import zlib
+from array import array
 from operator import attrgetter
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, AnyStr, NoReturn
 
 from paragraphs import par
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    import mmap
+    from collections.abc import Iterable, Iterator
+    from typing import TypeAlias
+
+    # Anything that exposes ascii svg path data through the buffer protocol.
+    SvgdBuffer: TypeAlias = bytes | bytearray | memoryview | mmap.mmap
 
 # Match an svg path data string command or number.
 _COMMAND_OR_NUMBER = re.compile(
     r"([MmZzLlHhVvCcSsQqTtAa])|(-?\d*\.?\d+(?:[eE][-+]?\d+)?)"
 )
 
+# The same pattern without groups, so `findall` returns each token as one str.
+_TOKEN = re.compile(r"[MmZzLlHhVvCcSsQqTtAa]|-?\d*\.?\d+(?:[eE][-+]?\d+)?")
+
+# Match a number alone, e.g., in a polyline points attribute.
+_NUMBER = re.compile(r"-?\d*\.?\d+(?:[eE][-+]?\d+)?")
+_NOT_SEPARATOR = re.compile(r"[^\s,]")
+
+# The same patterns for bytes-like input. Bytes patterns will search an mmap or
+# memoryview in place.
+_COMMAND_OR_NUMBER_BYTES = re.compile(_COMMAND_OR_NUMBER.pattern.encode())
+_CONTENT = re.compile(r"\d|\w")
+
+# A number with a decimal point or an exponent ends before another decimal point.
+_ENDS_WITH_FRACTION_OR_EXPONENT = re.compile(r"[.eE][-+]?\d*$")
+_CONTENT_BYTES = re.compile(rb"\d|\w")
+
 # How many floats does each command take? For popping floats from a split SVG path
 # datastring.
 # fmt: off
@@ -33,6 +56,11 @@ _CMD_2_N = {
 
 _CMDS = "MmLlHhVvCcSsQqTtAaZz"
 
+# The large-arc and sweep flags are the 4th and 5th of the 7 arc parameters. Each
+# flag is one character, so a flag needs no separator from the number after it.
+_ARC_FLAG_INDICES = (3, 4)
+_FLAGS = ("0", "1", b"0", b"1")
+
 
 def _is_not_cmd(part: str) -> bool:
     """Check if a part is an SVG command.
@@ -43,10 +71,71 @@ def _is_not_cmd(part: str) -> bool:
     return part not in _CMDS
 
 
-def svgd_split(svgd: str) -> list[str]:
+class _ArcFlagSplitter:
+    """Split packed arc flags from the numbers after them.
+
+    The SVG grammar reads each arc flag as one character, so "A1 1 0 114 5" has
+    flags 1 and 1 and an x coordinate of 4. The number pattern would read "114" as
+    one number, so count the parameters of each arc command and peel the flags.
+    """
+
+    def __init__(self) -> None:
+        """Start outside of an arc command."""
+        self.in_arc = False
+        self._count = 0
+
+    def set_cmd(self, cmd: str) -> None:
+        """Start counting the parameters of a new command.
+
+        :param cmd: an svg command letter
+        """
+        self.in_arc = cmd in {"A", "a"}
+        self._count = 0
+
+    def split(self, num: AnyStr) -> list[AnyStr]:
+        """Split any packed flags from the start of a number in an arc command.
+
+        :param num: a matched number, e.g., "114" or "11.5"
+        :return: the flags and the number, e.g., ["1", "1", "4"] or ["1", "1", ".5"]
+        """
+        nums: list[AnyStr] = []
+        while (
+            self._count % 7 in _ARC_FLAG_INDICES and len(num) > 1 and num[:1] in _FLAGS
+        ):
+            nums.append(num[:1])
+            num = num[1:]
+            self._count += 1
+        nums.append(num)
+        self._count += 1
+        return nums
+
+
+def _split_arc_flags(parts: list[str]) -> list[str]:
+    """Split packed arc flags in a list of commands and numbers.
+
+    :param parts: command letters and matched numbers
+    :return: command letters and numbers with each arc flag a separate part
+    """
+    splitter = _ArcFlagSplitter()
+    split_parts: list[str] = []
+    for part in parts:
+        if part in _CMDS:
+            splitter.set_cmd(part)
+            split_parts.append(part)
+        elif splitter.in_arc:
+            split_parts.extend(splitter.split(part))
+        else:
+            split_parts.append(part)
+    return split_parts
+
+
+def svgd_split(svgd: str, *, validate: bool = True) -> list[str]:
     """Split an svg data string into commands and numbers. Validate the string.
 
     :param svgd: An svg path element d string
+    :param validate: if False, skip validation and split with one regex pass. Only
+        for trusted input, e.g., path data this package wrote. Invalid input may
+        raise a less helpful error later or give wrong results.
     :return: a list of all commands (single letters) and numbers
 
     The Validation is not exhastive. For instance, the `A` command takes seven number
@@ -54,54 +143,348 @@ def svgd_split(svgd: str) -> list[str]:
     (this is not checked). This function checks jut enough to make sure the functions
     in this package work correctly.
     """
+    if not validate:
+        parts = _TOKEN.findall(svgd)
+        if "A" in svgd or "a" in svgd:
+            parts = _split_arc_flags(parts)
+        return parts
     matches = _COMMAND_OR_NUMBER.findall(svgd)
     unmatched = re.sub(_COMMAND_OR_NUMBER, "", svgd).strip()
-    if missed_content := re.findall(r"\d|\w", unmatched):
-        msg = par(
-            f"""Invalid svg path data string. Unrecognized content
-            {" ... ".join(missed_content)!r} in input."""
-        )
-        raise ValueError(msg)
+    _validate_unmatched(_CONTENT.findall(unmatched))
     parts = [x for y in matches for x in y if x]
     if not parts:
         return []
+    if "A" in svgd or "a" in svgd:
+        parts = _split_arc_flags(parts)
 
     # validate the parts
     if parts[0] not in "Mm":
-        msg = par(
-            """Invalid svg path data string. SVG path data must start with a move
-            command (M or m)."""
-        )
-        raise ValueError(msg)
+        _raise_no_leading_move()
     at_part = 0
     while at_part < len(parts):
         cmd = parts[at_part]
         at_part += 1
 
-        needs_p = _CMD_2_N[cmd.lower()]
         given_p = sum(1 for _ in it.takewhile(_is_not_cmd, parts[at_part:]))
-        if needs_p == 0 and given_p != 0:
-            msg = par(
-                f"""Invalid svg path data string. Command {cmd} takes 0 float
-                parameters, got {given_p}."""
-            )
-            raise ValueError(msg)
-        if needs_p and (given_p % needs_p != 0):
-            msg = par(
-                f"""Invalid svg path data string. Command {cmd} takes (some multiple
-                of) {needs_p} float parameters, got {given_p}."""
-            )
-            raise ValueError(msg)
+        _validate_param_count(cmd, given_p)
         at_part += given_p
     return parts
 
 
-def _format_addition(current_cmd: str, addition: str) -> tuple[str, str]:
+def _validate_unmatched(missed_content: list[str]) -> None:
+    """Raise a ValueError if anything outside commands and numbers looks like content.
+
+    :param missed_content: digits or word characters not matched as commands or
+        numbers
+    :raises ValueError: if missed_content is not empty
+    """
+    if missed_content:
+        msg = par(
+            f"""Invalid svg path data string. Unrecognized content
+            {" ... ".join(missed_content)!r} in input."""
+        )
+        raise ValueError(msg)
+
+
+def _raise_no_leading_move() -> NoReturn:
+    """Raise a ValueError for path data that does not start with a move command.
+
+    :raises ValueError: always
+    """
+    msg = par(
+        """Invalid svg path data string. SVG path data must start with a move
+        command (M or m)."""
+    )
+    raise ValueError(msg)
+
+
+def _validate_param_count(cmd: str, given_p: int) -> None:
+    """Raise a ValueError if a command has the wrong number of float parameters.
+
+    :param cmd: an svg command letter
+    :param given_p: the number of float parameters following the command letter
+    :raises ValueError: if the command cannot take given_p parameters
+    """
+    needs_p = _CMD_2_N[cmd.lower()]
+    if needs_p == 0 and given_p != 0:
+        msg = par(
+            f"""Invalid svg path data string. Command {cmd} takes 0 float
+            parameters, got {given_p}."""
+        )
+        raise ValueError(msg)
+    if needs_p and (given_p == 0 or given_p % needs_p != 0):
+        msg = par(
+            f"""Invalid svg path data string. Command {cmd} takes (some multiple
+            of) {needs_p} float parameters, got {given_p}."""
+        )
+        raise ValueError(msg)
+
+
+class _CommandGrouper:
+    """Validate a stream of command letters and floats and group them into commands.
+
+    Each group is one command letter with exactly as many floats as that command
+    takes. Implicit repeats are made explicit, so "M0 0 1 1" is grouped as
+    ("M", [0, 0]), ("L", [1, 1]). Errors are raised as soon as they are known.
+    """
+
+    def __init__(self) -> None:
+        """Start before the first command."""
+        self._explicit_cmd = ""
+        self._cmd = ""
+        self._vals: list[float] = []
+        self._given_p = 0
+
+    def push(self, part: str | float) -> tuple[str, list[float]] | None:
+        """Add a command letter or a float to the stream.
+
+        :param part: a command letter or a float parameter
+        :return: a completed (command, floats) group or None
+        :raises ValueError: if the stream is not valid svg path data
+        """
+        if isinstance(part, str):
+            self._validate_group()
+            if not self._cmd and part not in "Mm":
+                _raise_no_leading_move()
+            self._explicit_cmd = self._cmd = part
+            self._given_p = 0
+            return (part, []) if part in "Zz" else None
+
+        if not self._cmd:
+            _raise_no_leading_move()
+        self._given_p += 1
+        needs_p = _CMD_2_N[self._cmd.lower()]
+        if needs_p == 0:
+            return None
+        self._vals.append(part)
+        if len(self._vals) < needs_p:
+            return None
+        group = (self._cmd, self._vals)
+        self._cmd = {"M": "L", "m": "l"}.get(self._cmd, self._cmd)
+        self._vals = []
+        return group
+
+    def close(self) -> None:
+        """Validate the final command.
+
+        :raises ValueError: if the final command has the wrong number of floats
+        """
+        self._validate_group()
+
+    def _validate_group(self) -> None:
+        """Validate the float count of the current explicit command.
+
+        :raises ValueError: if the current command has the wrong number of floats
+        """
+        if self._explicit_cmd:
+            _validate_param_count(self._explicit_cmd, self._given_p)
+
+
+def _iter_str_parts(
+    svgd: str, flags: _ArcFlagSplitter | None = None, *, validate: bool = True
+) -> Iterator[str | float]:
+    """Lazily iterate over the command letters and numbers in an svg data string.
+
+    :param svgd: an svg path data string
+    :param flags: optionally, an arc flag splitter to continue from a previous
+        chunk of the same path data
+    :param validate: if False, do not scan between matches for unmatched content
+    :return: None
+    :yield: command letters as str and numbers as float
+    :raises ValueError: if anything outside commands and numbers looks like content
+    """
+    flags = flags or _ArcFlagSplitter()
+    last_end = 0
+    for match in _COMMAND_OR_NUMBER.finditer(svgd):
+        if validate:
+            _validate_unmatched(_CONTENT.findall(svgd, last_end, match.start()))
+        last_end = match.end()
+        cmd, num = match.groups()
+        if cmd:
+            flags.set_cmd(cmd)
+            yield cmd
+        elif flags.in_arc:
+            yield from map(float, flags.split(num))
+        else:
+            yield float(num)
+    if validate:
+        _validate_unmatched(_CONTENT.findall(svgd, last_end))
+
+
+def _iter_buffer_parts(
+    data: SvgdBuffer, *, validate: bool = True
+) -> Iterator[str | float]:
+    """Lazily iterate over the command letters and numbers in bytes-like path data.
+
+    :param data: ascii svg path data in any object supporting the buffer protocol
+    :param validate: if False, do not scan between matches for unmatched content
+    :return: None
+    :yield: command letters as str and numbers as float
+    :raises ValueError: if anything outside commands and numbers looks like content
+    """
+    flags = _ArcFlagSplitter()
+    last_end = 0
+    for match in _COMMAND_OR_NUMBER_BYTES.finditer(data):
+        if validate:
+            gap = _CONTENT_BYTES.findall(data, last_end, match.start())
+            _validate_unmatched([x.decode() for x in gap])
+        last_end = match.end()
+        cmd, num = match.groups()
+        if cmd:
+            cmd_str = chr(cmd[0])
+            flags.set_cmd(cmd_str)
+            yield cmd_str
+        elif flags.in_arc:
+            yield from map(float, flags.split(num))
+        else:
+            yield float(num)
+    if validate:
+        gap = _CONTENT_BYTES.findall(data, last_end)
+        _validate_unmatched([x.decode() for x in gap])
+
+
+def iter_svgd_commands(
+    svgd: str | SvgdBuffer, *, validate: bool = True
+) -> Iterator[tuple[str, list[float]]]:
+    """Lazily split svg path data into commands. Validate as the data is read.
+
+    :param svgd: an svg path data string or ascii svg path data in any object
+        supporting the buffer protocol
+    :param validate: if False, do not scan for content that is not a command or a
+        number. Only for trusted input.
+    :return: None
+    :yield: (command letter, float parameters) for each command. Implicit command
+        repeats are made explicit, so each command has exactly the number of
+        floats it takes.
+    :raises ValueError: when the first invalid part of the data is reached
+    """
+    if isinstance(svgd, str):
+        parts = _iter_str_parts(svgd, validate=validate)
+    else:
+        parts = _iter_buffer_parts(svgd, validate=validate)
+    grouper = _CommandGrouper()
+    for part in parts:
+        group = grouper.push(part)
+        if group is not None:
+            yield group
+    grouper.close()
+
+
+def svgd_split_buffer(
+    data: SvgdBuffer, *, validate: bool = True
+) -> tuple[str, array[float]]:
+    """Split bytes-like svg path data into commands and floats. Validate the data.
+
+    :param data: ascii svg path data as bytes, bytearray, memoryview, or mmap
+    :param validate: if False, do not scan for content that is not a command or a
+        number. Only for trusted input.
+    :return: a str with one letter per command and an array of all float
+        parameters. Implicit command repeats are made explicit, so each command
+        letter takes exactly `_CMD_2_N` floats from the array.
+    :raises ValueError: if the data is not valid svg path data
+
+    The data is scanned in place, so an mmap of a large file is never loaded as
+    text, and numbers are stored in a float buffer instead of as str tokens.
+    """
+    cmds: list[str] = []
+    vals: array[float] = array("d")
+    for cmd, cmd_vals in iter_svgd_commands(data, validate=validate):
+        cmds.append(cmd)
+        vals.extend(cmd_vals)
+    return "".join(cmds), vals
+
+
+def validate_svgd(svgd: str | SvgdBuffer) -> None:
+    """Raise a ValueError if svg path data is not valid.
+
+    :param svgd: an svg path data string or ascii svg path data in any object
+        supporting the buffer protocol
+    :raises ValueError: at the first invalid part of the data, with the same
+        message `iter_svgd_commands` would raise
+
+    Makes one pass over the data and builds no command objects, so this is cheap
+    enough to check untrusted input before storing it.
+    """
+    for _ in iter_svgd_commands(svgd):
+        pass
+
+
+def is_valid_svgd(svgd: str | SvgdBuffer) -> bool:
+    """Check if svg path data is valid.
+
+    :param svgd: an svg path data string or ascii svg path data in any object
+        supporting the buffer protocol
+    :return: True if every function in this package can parse svgd
+    """
+    try:
+        validate_svgd(svgd)
+    except ValueError:
+        return False
+    return True
+
+
+class SvgdCommandSplitter:
+    """Split svg path data into commands as it arrives in chunks of text.
+
+    A chunk may end in the middle of a number, for instance "M0 0L1.5" followed by
+    "e-3 2". Any trailing run of number characters is held back until the next
+    chunk (or `close`) shows where the number ends.
+    """
+
+    def __init__(self) -> None:
+        """Start before the first command."""
+        self._grouper = _CommandGrouper()
+        self._flags = _ArcFlagSplitter()
+        self._pending = ""
+
+    def feed(self, text: str) -> list[tuple[str, list[float]]]:
+        """Split the next chunk of path data.
+
+        :param text: the next part of an svg path data string
+        :return: (command letter, float parameters) for each command completed
+            by this chunk, as `iter_svgd_commands` would yield them
+        :raises ValueError: as soon as an invalid part of the data is reached
+        """
+        text = self._pending + text
+        cut = len(text.rstrip("-+.0123456789eE"))
+        self._pending = text[cut:]
+        return self._split(text[:cut])
+
+    def close(self) -> list[tuple[str, list[float]]]:
+        """Split any held-back data and validate the final command.
+
+        :return: (command letter, float parameters) for each remaining command
+        :raises ValueError: if the data is not valid
+        """
+        groups = self._split(self._pending)
+        self._pending = ""
+        self._grouper.close()
+        return groups
+
+    def _split(self, text: str) -> list[tuple[str, list[float]]]:
+        """Split text that does not end in the middle of a number.
+
+        :param text: complete commands and numbers
+        :return: (command letter, float parameters) for each completed command
+        """
+        groups: list[tuple[str, list[float]]] = []
+        for part in _iter_str_parts(text, self._flags):
+            group = self._grouper.push(part)
+            if group is not None:
+                groups.append(group)
+        return groups
+
+
+def _format_addition(
+    current_cmd: str, addition: str, previous: str = ""
+) -> tuple[str, str]:
     """Format an addition command for joining.
 
     :param current_cmd: the last command in the existing SVG path data string
     :param addition: the command to add, E.g., "L10 10". This command is has
         presumably already been formatted by "svgd_join".
+    :param previous: the existing SVG path data string or any string ending with
+        the same number
     :return: the addition command:
         - minus the command letter if it is the same as last_cmd
         - with a leading space if needed
@@ -112,23 +495,110 @@ def _format_addition(current_cmd: str, addition: str) -> tuple[str, str]:
     addition = addition[1:]
     if not addition:
         return (current_cmd, "")
-    if addition[0] != "-" and current_cmd and current_cmd not in "Zz":
+    if current_cmd and current_cmd not in "Zz" and _needs_separator(previous, addition):
         addition = " " + addition
     return (current_cmd, addition)
 
 
+def iter_joined_commands(parts: Iterable[str]) -> Iterator[str]:
+    """Join SVG commands one at a time.
+
+    :param parts: full commands (e.g., "M0 0", "L1 1")
+    :return: None
+    :yield: fragments of the joined SVG path data string
+    """
+    current_cmd = ""
+    previous = ""
+    for addition in parts:
+        current_cmd, formatted = _format_addition(current_cmd, addition, previous)
+        previous = formatted or previous
+        yield formatted
+
+
 def svgd_join_commands(*parts: str) -> str:
     """Join SVG commands.
 
     :param parts: full commands (e.g., "M0 0", "L1 1")
     :return: joined SVG path data string
     """
-    cmd_list: list[str] = []
-    current_cmd = ""
-    for addition in parts:
-        current_cmd, formatted = _format_addition(current_cmd, addition)
-        cmd_list.append(formatted)
-    return "".join(cmd_list)
+    return "".join(iter_joined_commands(parts))
+
+
+def _needs_separator(prev: str, addition: str) -> bool:
+    """Check if a number needs a separator from the number before it.
+
+    :param prev: a string ending with the previous number
+    :param addition: a string starting with the next number
+    :return: False if the SVG path grammar can tell where the previous number ends.
+        A number ends before a "-", and a number with a decimal point or an
+        exponent ends before a ".", so "1.5.5" is 1.5 and .5.
+    """
+    if addition[0] == "-":
+        return False
+    if addition[0] == ".":
+        return _ENDS_WITH_FRACTION_OR_EXPONENT.search(prev) is None
+    return True
+
+
+def split_numbers(numbers: str) -> list[str]:
+    """Split a list of numbers, e.g., a polyline or polygon points attribute.
+
+    :param numbers: numbers separated by whitespace, commas, or nothing where the
+        number grammar of SVG path data allows
+    :return: each number as a string
+    :raises ValueError: if numbers contains anything other than numbers,
+        whitespace, and commas
+    """
+    if (junk := _NOT_SEPARATOR.search(_NUMBER.sub(" ", numbers))) is not None:
+        msg = f"Invalid number list. Unexpected '{junk.group()}' in '{numbers}'."
+        raise ValueError(msg)
+    return _NUMBER.findall(numbers)
+
+
+def join_numbers(numbers: Iterable[str]) -> str:
+    """Join numbers with as few separators as possible.
+
+    :param numbers: formatted numbers, e.g., from `format_number`
+    :return: the numbers joined by a space only where the SVG path grammar needs
+        one to tell where a number ends
+    """
+    joined: list[str] = []
+    prev = ""
+    for number in numbers:
+        if prev and _needs_separator(prev, number):
+            joined.append(" ")
+        joined.append(number)
+        prev = number
+    return "".join(joined)
+
+
+def _join_tokens(tokens: Iterable[str]) -> str:
+    """Join SVG command letters and numbers with as few separators as possible.
+
+    :param tokens: command letters and numbers with each arc flag a separate token,
+        e.g., from `svgd_split`
+    :return: joined SVG path data string
+    """
+    joined: list[str] = []
+    prev = ""
+    is_after_flag = False
+    in_arc = False
+    count = 0
+    for token in tokens:
+        if token in _CMDS:
+            in_arc = token in {"A", "a"}
+            count = 0
+            is_after_flag = False
+        else:
+            is_number_after_number = prev and prev not in _CMDS and not is_after_flag
+            if is_number_after_number and _needs_separator(prev, token):
+                joined.append(" ")
+            is_flag = in_arc and count % 7 in _ARC_FLAG_INDICES
+            is_after_flag = is_flag and token in _FLAGS
+            count += 1
+        joined.append(token)
+        prev = token
+    return "".join(joined)
 
 
 def svgd_join(*parts: str) -> str:
@@ -137,40 +607,99 @@ def svgd_join(*parts: str) -> str:
     :param parts: parts of an SVG path data string
     :return: joined SVG path data string
 
-    Svg datastrings don't need a lot of whitespace.
+    Svg datastrings don't need a lot of whitespace. Keep a separator only where the
+    SVG path grammar needs one to tell where a number ends.
     """
     joined = " ".join(parts)
-    joined = re.sub(r"\s+", " ", joined)
-    joined = re.sub(r" -", "-", joined)
-    return re.sub(r"\s*([A-Za-z])\s*", r"\1", joined)
+    tokens = [x for y in _COMMAND_OR_NUMBER.findall(joined) for x in y if x]
+    if "A" in joined or "a" in joined:
+        tokens = _split_arc_flags(tokens)
+    return _join_tokens(tokens)
+
+
+def _make_move_absolute(svgd: str) -> str:
+    """Replace a leading relative move with an absolute move.
+
+    :param svgd: svg path data starting with "m"
+    :return: the same path data starting with "M". The first point of a path is
+        absolute even after "m", so the values do not change, but numbers after
+        the first point are relative lines. Those get an explicit "l".
+    :raises ValueError: if the move does not have two numbers
+    """
+    tokens = _TOKEN.finditer(svgd, 1)
+    head = list(it.islice(tokens, 3))
+    if len(head) < 2 or not all(_is_not_cmd(x.group()) for x in head[:2]):
+        msg = f"Invalid svg path data. Expected two numbers after 'm' in '{svgd}'."
+        raise ValueError(msg)
+    move = "M" + join_numbers(x.group() for x in head[:2])
+    if len(head) == 2:
+        return move
+    if _is_not_cmd(head[2].group()):
+        return move + "l" + svgd[head[2].start() :]
+    return move + svgd[head[2].start() :]
+
+
+def concat_svgd(*svgds: str) -> str:
+    """Concatenate svg path data strings into one compound path.
+
+    :param svgds: svg path data strings, e.g., output from `format_svgd_shortest`
+    :return: one svg path data string that draws every input path
+    :raises ValueError: if any non-empty svgd does not start with a move command
+
+    Every path starts with a move, so nothing before a path changes what it draws,
+    except a leading "m", which would be relative to the end of the previous path.
+    Only the boundaries are fixed up, so the cost is one copy of the input. No
+    path is parsed or validated past its first few numbers.
+    """
+    parts: list[str] = []
+    for svgd in svgds:
+        stripped = svgd.strip(" \t\n\r\f,")
+        if not stripped:
+            continue
+        if stripped[0] not in "Mm":
+            _raise_no_leading_move()
+        if stripped[0] == "m" and parts:
+            stripped = _make_move_absolute(stripped)
+        parts.append(stripped)
+    return "".join(parts)
 
 
 @dataclasses.dataclass
 class _ShortestPathCandidate:
     """A candidate for the shortest SVG path data string.
 
-    This caches the current length of the string and the last command letter. Finding
-    the shortest path requires some optimization because there are giant paths
-    created by matplotlib and other svg-generating software.
+    This caches the current length of the string, the last command letter, and the
+    last formatted command. Finding the shortest path requires some optimization
+    because there are giant paths created by matplotlib and other svg-generating
+    software.
     """
 
     cmds: list[str]
     current_len: int
     current_cmd: str
+    previous: str
 
     def __init__(
-        self, cmds: list[str] | None = None, current_len: int = 0, current_cmd: str = ""
+        self,
+        cmds: list[str] | None = None,
+        current_len: int = 0,
+        current_cmd: str = "",
+        previous: str = "",
     ) -> None:
         """Create an empty candidate."""
         self.cmds = cmds or []
         self.current_len = current_len
         self.current_cmd = current_cmd
+        self.previous = previous
 
     def append(self, addition: str) -> None:
         """Append a command to the candidate."""
-        current_cmd, formatted = _format_addition(self.current_cmd, addition)
+        current_cmd, formatted = _format_addition(
+            self.current_cmd, addition, self.previous
+        )
         self.cmds.append(formatted)
         self.current_cmd = current_cmd
+        self.previous = formatted or self.previous
         self.current_len += len(formatted)
 
     def copy(self) -> _ShortestPathCandidate:
@@ -178,7 +707,9 @@ class _ShortestPathCandidate:
 
         :return: a copy of the candidate
         """
-        return _ShortestPathCandidate(self.cmds[:], self.current_len, self.current_cmd)
+        return _ShortestPathCandidate(
+            self.cmds[:], self.current_len, self.current_cmd, self.previous
+        )
 
     def tee(self, *additions: str) -> Iterator[_ShortestPathCandidate]:
         """Split the candidate into multiple candidates.
@@ -196,18 +727,46 @@ class _ShortestPathCandidate:
             yield copy
 
 
-def get_shortest_svgd(*formats: list[str] | list[str | None]) -> str:
-    """Get the shortest SVG path data string for a group of commands.
+class ShortestSvgdJoiner:
+    """Join commands into the shortest SVG path data string one at a time.
 
-    :param candidates: potential candidates for the shortest SVG path data string
-    :param cmds: an iterable of commands with the same command letter
-    :return: an SVG path data string for the group of commands
+    Each command is pushed in every format. Whenever only one candidate string
+    remains, its commands are final, and `state` holds everything needed to join
+    the commands after it. A joiner started from that state joins the rest of the
+    path exactly as this one would, so the result of joining a command from a
+    given state can be cached.
     """
-    candidates: list[_ShortestPathCandidate] = [_ShortestPathCandidate()]
 
-    for apps in zip(*formats, strict=True):
+    def __init__(self, state: tuple[str, str] = ("", "")) -> None:
+        """Start joining.
+
+        :param state: the `state` of a joiner to continue from
+        """
+        current_cmd, previous = state
+        self._candidates = [
+            _ShortestPathCandidate(current_cmd=current_cmd, previous=previous)
+        ]
+
+    @property
+    def state(self) -> tuple[str, str] | None:
+        """Get the state to resume from if all pushed commands are final.
+
+        :return: the last command letter and last formatted command, or None if
+            more than one candidate remains
+        """
+        if len(self._candidates) != 1:
+            return None
+        candidate = self._candidates[0]
+        return candidate.current_cmd, candidate.previous
+
+    def push(self, *apps: str | None) -> list[str]:
+        """Add one command.
+
+        :param apps: the command in each format. A None command is not a candidate.
+        :return: fragments that became final
+        """
         apps_ = [a for a in apps if a is not None]
-        candidates = list(it.chain(*(x.tee(*apps_) for x in candidates)))
+        candidates = list(it.chain(*(x.tee(*apps_) for x in self._candidates)))
         # The algorithm never backtracks, so we need only retain one candidate
         # with a last absolute command and one with a last relative command.
         candidates = [
@@ -218,5 +777,59 @@ def get_shortest_svgd(*formats: list[str] | list[str | None]) -> str:
         # discarded, because--at worst--one character would be needed to switch
         # to the other (relative or absolute) format.
         min_len = min(x.current_len for x in candidates)
-        candidates = [x for x in candidates if x.current_len == min_len]
-    return "".join(candidates[0].cmds)
+        self._candidates = [x for x in candidates if x.current_len == min_len]
+        if len(self._candidates) > 1:
+            return []
+        final = self._candidates[0].cmds[:]
+        self._candidates[0].cmds.clear()
+        return final
+
+    def close(self) -> list[str]:
+        """Finish joining.
+
+        :return: the remaining fragments of the shortest candidate
+        """
+        return self._candidates[0].cmds
+
+
+def iter_shortest_svgd(*formats: Iterable[str] | Iterable[str | None]) -> Iterator[str]:
+    """Get the shortest SVG path data string for a group of commands in fragments.
+
+    :param formats: for each format (e.g., absolute and relative), that format of
+        every command. A None command is not a candidate.
+    :return: None
+    :yield: fragments of the shortest SVG path data string. Whenever only one
+        candidate remains, its commands are final and are yielded.
+    """
+    joiner = ShortestSvgdJoiner()
+    for apps in zip(*formats, strict=True):
+        yield from joiner.push(*apps)
+    yield from joiner.close()
+
+
+def get_shortest_svgd(*formats: Iterable[str] | Iterable[str | None]) -> str:
+    """Get the shortest SVG path data string for a group of commands.
+
+    :param formats: for each format (e.g., absolute and relative), that format of
+        every command. A None command is not a candidate.
+    :return: an SVG path data string for the group of commands
+    """
+    return "".join(iter_shortest_svgd(*formats))
+
+
+def get_smallest_compressed(*candidates: str) -> str:
+    """Get the candidate SVG path data string that is smallest after compression.
+
+    :param candidates: equivalent SVG path data strings
+    :return: the candidate with the fewest bytes after deflate (gzip) compression,
+        the shortest among ties
+    :raises ValueError: if there are no candidates
+
+    Relative commands repeat where a shape repeats anywhere in the path, and
+    absolute commands repeat where shapes align, so which string is smallest
+    compressed depends on the path, not on which string is shortest.
+    """
+    if not candidates:
+        msg = "At least one candidate is required."
+        raise ValueError(msg)
+    return min(candidates, key=lambda x: (len(zlib.compress(x.encode(), 9)), len(x)))
@@ -8,6 +8,15 @@ The functions you may need:
 `get_cpts_from_svgd(svgd: str) -> list[list[tuple[float, float]]`
     - Convert an SVG path data string to a list of lists of Bezier control points.
 
+`iter_cpts_from_svgd(svgd: str) -> Iterator[list[tuple[float, float]]]`
+    - Lazily yield Bezier control points as an SVG path data string is parsed.
+
+`iter_subpaths(svgd: str) -> Iterator[list[list[tuple[float, float]]]]`
+    - Lazily yield the Bezier control points of each subpath.
+
+`SvgdParser.feed(chunk: str | bytes) -> list[PathCommand]`
+    - Parse an SVG path data string pushed one chunk at a time.
+
 `format_svgd_absolute(svgd: str) -> str`
     - Convert an SVG path data string to a relative one.
 
@@ -17,34 +26,75 @@ The functions you may need:
 `format_svgd_shortest(svgd: str) -> str`
     - Convert an SVG path data string to the shortest form.
 
+`format_svgd_compressed(svgd: str) -> str`
+    - Convert an SVG path data string to a form that compresses well.
+
+`format_svgd_resolutions(svgd: str, resolutions: Iterable[int | None]) -> dict`
+    - Format an SVG path data string at several resolutions.
+
+`convert(svgd: str, outputs: Iterable[str]) -> ConvertedSvgd`
+    - Parse an SVG path data string once and get several of the above.
+
+Thread safety:
+
+* The module-level functions share no mutable state. Any number of threads can
+  call them at once, with or without the GIL.
+* A finished `PathCommands` instance can be read (iterated, formatted, pickled)
+  from several threads at once. Each lazily computed value is built completely
+  before it is stored, and threads that race to compute it compute equal values.
+* Building or changing one instance (`PathCommand.append`, `SvgdParser.feed`,
+  `PathCommands.replace`) from several threads at once is not safe.
+
 :author: Shay Hill
 :created: 2025-06-18
 """
 
 from __future__ import annotations
 
+import codecs
+import dataclasses
 import enum
-import functools as ft
+import io
 import itertools as it
+import math
+import weakref
+from array import array
 from string import ascii_lowercase
-from typing import TYPE_CHECKING, Any, Literal, TypeVar
-
+from typing import IO, TYPE_CHECKING, Any, Literal, TypeVar, cast
+
+from svg_path_data.error_budget import (
+    ErrorBudget,
+    ResolutionChoice,
+    choose_resolution_by,
+    get_pixels_per_unit,
+    get_rounding_error,
+)
 from svg_path_data.float_string_conversion import format_number
 from svg_path_data.string_ops import (
-    get_shortest_svgd,
+    ShortestSvgdJoiner,
+    SvgdCommandSplitter,
+    get_smallest_compressed,
+    iter_joined_commands,
+    iter_shortest_svgd,
+    iter_svgd_commands,
     svgd_join,
-    svgd_join_commands,
     svgd_split,
+    svgd_split_buffer,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable, Iterator, Sequence
 
+    from svg_path_data.string_ops import SvgdBuffer
+
 _T = TypeVar("_T")
 
 # number of points in a linear command (L, H, V, Z)
 _N_LINEAR = 4
 
+# Collect fragments into writes of about this many characters.
+_WRITE_BUFFER_SIZE = 2**16
+
 
 class RelativeOrAbsolute(str, enum.Enum):
     """Enum to indicate whether a path is relative or absolute or a combination."""
@@ -52,6 +102,7 @@ class RelativeOrAbsolute(str, enum.Enum):
     RELATIVE = "relative"
     ABSOLUTE = "absolute"
     SHORTEST = "shortest"
+    COMPRESSED = "compressed"
 
 
 def _comp_iterables(a_iter: Iterable[Any], b_iter: Iterable[Any]) -> bool:
@@ -103,6 +154,23 @@ def _take_n_floats(parts: list[str], n: int) -> Iterable[float]:
     return map(float, (parts.pop() for _ in range(n)))
 
 
+def _iter_buffer_commands(
+    cmds: str, vals: array[float]
+) -> Iterator[tuple[str, array[float]]]:
+    """Pair each command from `svgd_split_buffer` with its float parameters.
+
+    :param cmds: one letter per command, implicit repeats made explicit
+    :param vals: all float parameters for all commands
+    :return: None
+    :yield: (command, float parameters) for each command
+    """
+    at_val = 0
+    for cmd in cmds:
+        num_args = _CMD_2_N[cmd.lower()]
+        yield cmd, vals[at_val : at_val + num_args]
+        at_val += num_args
+
+
 def _is_monotonic(seq: Sequence[float]) -> bool:
     """Check if a list is monotonic (entirely non-increasing or non-decreasing)."""
     increasing = decreasing = True
@@ -114,20 +182,18 @@ def _is_monotonic(seq: Sequence[float]) -> bool:
     return increasing or decreasing
 
 
-def _is_linear(
-    pts: list[tuple[float, float]], formatter: Callable[[str | float], str]
-) -> bool:
+def _is_linear(pts: list[tuple[float, float]], snap: Callable[[float], float]) -> bool:
     """Check if a set of points is linear.
 
     :param pts: a list of tuples of the x and y coordinates of the points
-    :param formatter: a function to format numbers to strings. This effectively
-        rounds the results to provide an epsilon.
+    :param snap: a function to round numbers to the output resolution. This
+        provides an epsilon.
     :return: True if the points are linear, False otherwise
     """
     if len(pts) < 3:
         return True
-    xs = [float(formatter(x)) for x, _ in pts]
-    ys = [float(formatter(y)) for _, y in pts]
+    xs = [snap(x) for x, _ in pts]
+    ys = [snap(y) for _, y in pts]
     if not (_is_monotonic(xs) and _is_monotonic(ys)):
         return False
     vx = float(xs[-1]) - float(xs[0])
@@ -137,17 +203,55 @@ def _is_linear(
     for x, y in zip(xs[1:-1], ys[1:-1], strict=True):
         xt = (float(x) - float(xs[0])) / vx
         yt = (float(y) - float(ys[0])) / vy
-        if formatter(yt) != formatter(xt):
+        if snap(yt) != snap(xt):
             return False
     return True
 
 
+def _get_quadratic_cpt(
+    pts: list[tuple[float, float]], snap: Callable[[float], float]
+) -> tuple[float, float] | None:
+    """Get the control point of the quadratic a cubic was degree elevated from.
+
+    :param pts: the four control points of a cubic Bezier curve
+    :param snap: a function to round numbers to the output resolution. This
+        provides an epsilon.
+    :return: the control point of the equivalent quadratic curve or None if the
+        cubic is not a quadratic at the output resolution
+
+    A quadratic with control point q elevates to a cubic with control points
+    p0 + 2/3 (q - p0) and p3 + 2/3 (q - p3). Recover q from each end and average.
+
+    Accept q only if the quadratic as it will be written (with rounded points)
+    elevates to handles that format the same as the cubic's own handles. The
+    written quadratic is then the written cubic at the output resolution.
+    """
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = pts
+    qx = (3 * x1 - x0 + 3 * x2 - x3) / 4
+    qy = (3 * y1 - y0 + 3 * y2 - y3) / 4
+    sqx, sqy = snap(qx), snap(qy)
+    for (ex, ey), hx, hy in (((x0, y0), x1, y1), ((x3, y3), x2, y2)):
+        sex, sey = snap(ex), snap(ey)
+        for elevated, handle in (
+            (sex + 2 * (sqx - sex) / 3, hx),
+            (sey + 2 * (sqy - sey) / 3, hy),
+        ):
+            if snap(elevated) != snap(handle) and not math.isclose(
+                elevated, handle, abs_tol=1e-9
+            ):
+                return None
+    return qx, qy
+
+
 class PathCommand:
     """A command with points.
 
     The str properties strip out unnecessary commands and points.
     """
 
+    # the state, text, and state after of the last `join_shortest`
+    __joined: tuple[tuple[str, str, bool], str, tuple[str, str]] | None = None
+
     def __init__(
         self,
         cmd: str | None,
@@ -168,6 +272,11 @@ class PathCommand:
         self.__abs_vals: list[float] = []
         self.__rel_strs: list[str] = []
         self.__abs_strs: list[str] = []
+        self.__current_point_str: tuple[str, str] | None = None
+        self.__implied_cpt_str: tuple[str, str] | None = None
+        self.__written_vals: list[float] | None = None
+        self.__str_cmd: str | None = None
+        self.__svgd: dict[RelativeOrAbsolute, str] = {}
 
         if cmd and cmd[0] in ascii_lowercase:
             self.__rel_vals = list(vals)
@@ -178,22 +287,37 @@ class PathCommand:
 
         # update values inherited from the previous command
         self.prev = prev
+        self._skipped_move: PathCommand | None = None
         if self.cmd == "M" and prev and prev.cmd == "M":
             self.prev = prev.prev  # skip redundant move commands
-        self.next: PathCommand | None = None
+            # prev is still reached through next, which is a weak reference
+            self._skipped_move = prev
+        self.__next: weakref.ref[PathCommand] | None = None
+
+        self.__prev_is_current = self.prev is prev
+        self.__is_first = self.prev is None
 
         if prev:
             prev.next = self
             self.resolution = resolution or prev.resolution
             self._current_point = prev.abs_vals[-2], prev.abs_vals[-1]
-            self._current_point_str = prev.abs_strs[-2], prev.abs_strs[-1]
 
         else:
             self.resolution = resolution
             self._current_point = 0.0, 0.0
-            self._current_point_str = "0", "0"
 
-        # expand shorthand
+        self._expand_shorthand()
+
+        # identify linear curves
+        if self.cmd in "QC" and _is_linear(self.cpts, self.snap):
+            self.cmd = "L"
+            self.__abs_vals = self.__abs_vals[-2:]
+            self.__rel_vals = []
+
+        self.path_open = self._get_path_open()
+
+    def _expand_shorthand(self) -> None:
+        """Replace T, S, H, and V commands with the Q, C, or L they imply."""
         if self.cmd in "TS":
             self.__abs_vals = [*self._implied_cpt, *self.abs_vals]
             self.__rel_vals = []
@@ -207,14 +331,6 @@ class PathCommand:
             self.__rel_vals = []
             self.cmd = "L"
 
-        # identify linear curves
-        if self.cmd in "QC" and _is_linear(self.cpts, self.format_number):
-            self.cmd = "L"
-            self.__abs_vals = self.__abs_vals[-2:]
-            self.__rel_vals = []
-
-        self.path_open = self._get_path_open()
-
     @classmethod
     def append(
         cls,
@@ -235,10 +351,7 @@ class PathCommand:
             return instance
         # If the previous command was closed by an (arguably unnecessary) Z, insert a
         # move command to the current point.
-        if (
-            instance.cmd != "M"
-            and prev.get_svgd(RelativeOrAbsolute.ABSOLUTE)[-1] == "Z"
-        ):
+        if instance.cmd != "M" and prev.does_close:
             prev = cls("m", [0, 0], prev, resolution)
             instance = cls(cmd, vals, prev, resolution)
 
@@ -247,16 +360,42 @@ class PathCommand:
         if (
             instance.cmd == "L"
             and prev.cmd == "L"
-            and _is_linear([*prev.cpts, instance.cpts[1]], instance.format_number)
+            and _is_linear([*prev.cpts, instance.cpts[1]], instance.snap)
         ):
-            # skip previous L command
-            return cls(cmd, vals, prev.prev, resolution)
-        if all(x == "0" for x in instance._rel_strs):
-            # zero-length command; remove it from the linked list
-            prev.next = instance.next
-            return prev
+            # skip previous L command. Use absolute values, because relative values
+            # are relative to the end of the skipped command.
+            return cls(instance.cmd, instance.abs_vals, prev.prev, resolution)
+        if instance.is_zero_length:
+            # zero-length command; remove it from the linked list. The end points
+            # format the same, but keep the exact end point of the removed command
+            # so later relative values do not drift.
+            end = instance.abs_vals[-2:]
+            vals = (*prev.abs_vals[:-2], *end)
+            return cls(prev.cmd, vals, prev.prev, resolution or prev.resolution)
         return instance
 
+    @property
+    def next(self) -> PathCommand | None:
+        """Get the next command in the linked list.
+
+        :return: the next command or None if this is the last command
+
+        The link is weak, so the linked list has no reference cycles and is freed
+        by reference counting alone. A linked list is kept alive through its last
+        command and the prev links.
+        """
+        if self.__next is None:
+            return None
+        return self.__next()
+
+    @next.setter  # noqa: A003
+    def next(self, value: PathCommand | None) -> None:
+        """Set the next command in the linked list.
+
+        :param value: the next command or None
+        """
+        self.__next = None if value is None else weakref.ref(value)
+
     def __repr__(self) -> str:
         """Get the SVG command and points for this command.
 
@@ -272,6 +411,35 @@ class PathCommand:
         """
         return format_number(number, self.resolution)
 
+    def snap(self, number: float) -> float:
+        """Round a number to the resolution of the formatted output.
+
+        :param number: the number to round
+        :return: the value of the formatted number
+
+        Two numbers snap to the same float if and only if they format to the same
+        string, so comparisons between snapped values match comparisons between
+        output strings. Without a resolution, formatting does not change a value, so
+        this does not format at all.
+
+        `format_number` only strips characters from this fixed-point string, so
+        the value is the same without the cost of minimizing the string.
+        """
+        if self.resolution is None:
+            return number
+        return float(f"{number:.{self.resolution}f}")
+
+    @property
+    def is_zero_length(self) -> bool:
+        """Check if this command will not move the current point at all.
+
+        :return: True if every formatted relative value would be "0"
+        """
+        return all(
+            self.snap(a) == self.snap(c)
+            for a, c in zip(self.abs_vals, self._extended_current_point, strict=True)
+        )
+
     @property
     def _n(self) -> int:
         """Get the number of float values in this command.
@@ -321,6 +489,21 @@ class PathCommand:
         else:
             yield from it.islice(it.cycle(self._current_point), self._n)
 
+    @property
+    def _current_point_str(self) -> tuple[str, str]:
+        """Get the current point as strings.
+
+        :return: the x and y coordinates of the last point in the previous command
+            as strings. Reuse the strings of the previous command where possible.
+        """
+        if self.__current_point_str is None:
+            if self.prev is not None and self.__prev_is_current:
+                x, y = self.prev.abs_strs[-2:]
+            else:
+                x, y = map(self.format_number, self._current_point)
+            self.__current_point_str = x, y
+        return self.__current_point_str
+
     @property
     def _extended_current_point_str(self) -> Iterator[str]:
         """Extend the current point strings over all values in the command.
@@ -332,7 +515,9 @@ class PathCommand:
         if self.cmd == "A":
             yield from ("0", "0", "0", "0", "0", *self._current_point_str)
         else:
-            yield from it.islice(it.cycle(self._current_point_str), self._n)
+            yield from it.islice(
+                it.cycle(self._current_point_str), len(self.written_vals)
+            )
 
     @property
     def _implied_cpt(self) -> tuple[float, float]:
@@ -356,15 +541,60 @@ class PathCommand:
             return cur_x + tan_x, cur_y + tan_y
         return self._current_point
 
-    @ft.cached_property
+    @property
     def implied_cpt_str(self) -> tuple[str, str]:
         """Get the implied control point as a string.
 
         :return: the implied control point as a string. For comparison with Q or C
         point strings to determine if a T or S shortcut command can be used.
+
+        A T or S in the output reflects the previous command as written, so this
+        uses the written degree and values of both commands.
+        """
+        if self.__implied_cpt_str is None:
+            implied_cpt = self._current_point
+            prev = self.prev
+            if (
+                prev
+                and prev.written_cmd in "QC"
+                and prev.written_cmd == self.written_cmd
+            ):
+                x0, y0, x1, y1 = prev.written_vals[-4:]
+                cur_x, cur_y = self._current_point
+                implied_cpt = cur_x + x1 - x0, cur_y + y1 - y0
+            x, y = map(self.format_number, implied_cpt)
+            self.__implied_cpt_str = x, y
+        return self.__implied_cpt_str
+
+    @property
+    def written_vals(self) -> list[float]:
+        """Get the absolute values of the points as they will be written.
+
+        :return: the values of the quadratic a degree-elevated cubic was elevated
+            from, else the absolute values of the points
+
+        The command itself keeps the values it was given, so T and S commands
+        after it expand against the curve as written in the input.
+        """
+        if self.__written_vals is None:
+            qcpt = None
+            if self.cmd == "C":
+                qcpt = _get_quadratic_cpt(self.cpts, self.snap)
+            if qcpt is None:
+                self.__written_vals = self.abs_vals
+            else:
+                self.__written_vals = [*qcpt, *self.abs_vals[-2:]]
+        return self.__written_vals
+
+    @property
+    def written_cmd(self) -> str:
+        """Get the command as it will be written, before any shorthand.
+
+        :return: "Q" if this is a degree-elevated cubic, else the command
         """
-        x, y = map(self.format_number, self._implied_cpt)
-        return x, y
+        if self.cmd == "C" and len(self.written_vals) == 4:
+            return "Q"
+        return self.cmd
 
     @property
     def abs_vals(self) -> list[float]:
@@ -384,13 +614,13 @@ class PathCommand:
 
     @property
     def abs_strs(self) -> list[str]:
-        """Get the relative values of the points as strings.
+        """Get the absolute values of the points as strings.
 
-        :return: the relative values of the points as strings
+        :return: the absolute values of the points as they will be written
         """
         if self.__abs_strs:
             return self.__abs_strs
-        self.__abs_strs = [self.format_number(x) for x in self.abs_vals]
+        self.__abs_strs = [self.format_number(x) for x in self.written_vals]
         return self.__abs_strs
 
     @property
@@ -415,8 +645,8 @@ class PathCommand:
         """
         if self.__rel_strs:
             return self.__rel_strs
-        if self.prev is None:
-            self.__rel_strs = [self.format_number(x) for x in self.abs_vals]
+        if self.__is_first:
+            self.__rel_strs = [self.format_number(x) for x in self.written_vals]
             return self.__rel_strs
         self.__rel_strs = [
             self.format_number(float(a) - float(c))
@@ -426,10 +656,19 @@ class PathCommand:
         ]
         return self.__rel_strs
 
-    @ft.cached_property
+    @property
     def _str_cmd(self) -> str:
         """Get the SVG command for this command as it will be used in the SVG data.
 
+        :return: the SVG command (e.g. "M", "L", "Q", "C", "V", "H", ...)
+        """
+        if self.__str_cmd is None:
+            self.__str_cmd = self._get_str_cmd()
+        return self.__str_cmd
+
+    def _get_str_cmd(self) -> str:
+        """Get the SVG command for this command as it will be used in the SVG data.
+
         :return: the SVG command (e.g. "M", "L", "Q", "C", "V", "H", ...)
 
         If a path command can be shortened, return the shorthand SVG command.
@@ -437,10 +676,9 @@ class PathCommand:
         :param cmd: the command to check
         :return: the input cmd.cmd or a shorthand replacement ("H", "V", "T", "S", "Z")
         """
-        if self.cmd in "QC" and _comp_iterables(
-            self.abs_strs[:2], self.implied_cpt_str
-        ):
-            return "T" if self.cmd == "Q" else "S"
+        cmd = self.written_cmd
+        if cmd in "QC" and _comp_iterables(self.abs_strs[:2], self.implied_cpt_str):
+            return "T" if cmd == "Q" else "S"
         if self.cmd == "L":
             if self.does_close:
                 return "Z"
@@ -448,7 +686,7 @@ class PathCommand:
                 return "V"
             if self.abs_strs[1] == self._current_point_str[1]:
                 return "H"
-        return self.cmd
+        return cmd
 
     @property
     def cpts(self) -> list[tuple[float, float]]:
@@ -477,17 +715,21 @@ class PathCommand:
         :return: an iterator over the points as strings
         :raises ValueError: if the relative_or_absolute value is unknown
         """
-        if relative_or_absolute == RelativeOrAbsolute.ABSOLUTE:
-            strs = self.abs_strs
-        elif relative_or_absolute == RelativeOrAbsolute.RELATIVE:
-            strs = self._rel_strs
-        else:
+        if relative_or_absolute not in {
+            RelativeOrAbsolute.ABSOLUTE,
+            RelativeOrAbsolute.RELATIVE,
+        }:
             msg = f"Unknown relative_or_absolute value: {relative_or_absolute}"
             raise ValueError(msg)
 
         if self._str_cmd == "Z":
             return
 
+        if relative_or_absolute == RelativeOrAbsolute.ABSOLUTE:
+            strs = self.abs_strs
+        else:
+            strs = self._rel_strs
+
         if self._str_cmd == "V":
             yield strs[1]
         elif self._str_cmd == "H":
@@ -505,19 +747,236 @@ class PathCommand:
 
         :param relative_or_absolute: whether to return relative or absolute coordinates
         :return: the SVG command and points as a string
+        :raises ValueError: if relative_or_absolute is COMPRESSED. Compression is
+            measured over a whole path, not a single command.
+
+        A command never changes after it is created, so the string is cached.
+        Formatting a path again after an edit only formats the new commands.
         """
+        svgd = self.__svgd.get(relative_or_absolute)
+        if svgd is not None:
+            return svgd
+        if relative_or_absolute == RelativeOrAbsolute.COMPRESSED:
+            msg = "Cannot format a single command for compression. Use PathCommands."
+            raise ValueError(msg)
         if relative_or_absolute == RelativeOrAbsolute.RELATIVE:
             str_cmd = self._str_cmd.lower()
-            return svgd_join(str_cmd, *self._iter_str_pts(relative_or_absolute))
-        if relative_or_absolute == RelativeOrAbsolute.ABSOLUTE:
+            svgd = svgd_join(str_cmd, *self._iter_str_pts(relative_or_absolute))
+        elif relative_or_absolute == RelativeOrAbsolute.ABSOLUTE:
             str_cmd = self._str_cmd
-            return svgd_join(str_cmd, *self._iter_str_pts(relative_or_absolute))
-        if relative_or_absolute == RelativeOrAbsolute.SHORTEST:
+            svgd = svgd_join(str_cmd, *self._iter_str_pts(relative_or_absolute))
+        else:
             relative = self.get_svgd(relative_or_absolute.RELATIVE)
             absolute = self.get_svgd(relative_or_absolute.ABSOLUTE)
-        if len(relative) < len(absolute):
-            return relative
-        return absolute
+            svgd = relative if len(relative) < len(absolute) else absolute
+        self.__svgd[relative_or_absolute] = svgd
+        return svgd
+
+    def join_shortest(
+        self, state: tuple[str, str], *, is_first: bool
+    ) -> tuple[str, tuple[str, str]] | None:
+        """Join this command to the shortest SVG path data string before it.
+
+        :param state: the `state` of a `ShortestSvgdJoiner` after the commands
+            before this one
+        :param is_first: True if this command starts the path, so it cannot be
+            relative
+        :return: the text this command adds and the state after it, or None if the
+            shortest format is not yet known after this command
+
+        The result is cached for the last state, so joining a path again after an
+        edit only joins the commands near the edit.
+        """
+        key = (*state, is_first)
+        if self.__joined is not None and self.__joined[0] == key:
+            return self.__joined[1:]
+        joiner = ShortestSvgdJoiner(state)
+        relative = None if is_first else self.get_svgd(RelativeOrAbsolute.RELATIVE)
+        fragments = joiner.push(self.get_svgd(RelativeOrAbsolute.ABSOLUTE), relative)
+        state_after = joiner.state
+        if state_after is None:
+            return None
+        text = "".join(fragments)
+        self.__joined = (key, text, state_after)
+        return text, state_after
+
+    def is_disjoint(self, point: Sequence[float]) -> bool:
+        """Check if a point is not the end of this command.
+
+        :param point: the first control point of a following curve
+        :return: True if a move command is needed before a curve starting at point
+        """
+        return (
+            not _comp_iterables(  # try to short circuit before any rounding
+                self.abs_vals[-2:], point
+            )
+            and not _comp_iterables(
+                map(self.snap, self.abs_vals[-2:]), map(self.snap, point)
+            )
+        )
+
+
+def _append_svgd_command(
+    node: PathCommand | None,
+    cmd: str,
+    vals: Iterable[float],
+    resolution: int | None = None,
+) -> PathCommand:
+    """Append one command from an svg path data string to the linked list.
+
+    :param node: the last command in the linked list or None to start a new list
+    :param cmd: the svg command letter. Implicit repeats must already be explicit.
+    :param vals: the float parameters of the command
+    :param resolution: the resolution of the new list. Ignored if node is not None.
+    :return: the new last command in the linked list
+    """
+    if node is None:
+        return PathCommand.append(cmd, vals, resolution=resolution)
+    if cmd in "Zz":  # close with a line if not already closed
+        if node.does_close:
+            return node
+        return PathCommand.append("L", node.path_open, node)
+    return PathCommand.append(cmd, vals, node)
+
+
+class _PathCommandBuilder:
+    """Append commands one at a time and release each command once it is final.
+
+    `PathCommand.append` may replace or remove the last command in the linked list
+    (merging collinear lines, removing zero-length commands, skipping redundant
+    moves), but it never changes the command before that. So every command before
+    the last is final and can be released to the caller.
+
+    To keep memory constant, a released command keeps a link to the command before
+    it, but that command loses its own link backward.
+    """
+
+    def __init__(self, resolution: int | None = None) -> None:
+        """Start an empty linked list.
+
+        :param resolution: optionally limit the resolution of the output
+        """
+        self._resolution = resolution
+        self._last: PathCommand | None = None
+        self._released: PathCommand | None = None
+
+    def push(self, cmd: str, vals: Iterable[float]) -> list[PathCommand]:
+        """Append one command from an svg path data string.
+
+        :param cmd: the svg command letter. Implicit repeats must already be
+            explicit.
+        :param vals: the float parameters of the command
+        :return: commands that became final, in path order
+        """
+        self._last = _append_svgd_command(self._last, cmd, vals, self._resolution)
+        return self._release(self._last.prev)
+
+    def close(self) -> list[PathCommand]:
+        """Release all remaining commands.
+
+        :return: commands not yet released, in path order
+        """
+        return self._release(self._last)
+
+    def _release(self, node: PathCommand | None) -> list[PathCommand]:
+        """Release node and any unreleased commands before it.
+
+        :param node: the last final command
+        :return: newly released commands, in path order
+        """
+        released: list[PathCommand] = []
+        while node is not None and node is not self._released:
+            released.append(node)
+            node = node.prev
+        if not released:
+            return []
+        self._released = released[0]
+        for node_ in released:
+            if node_.prev is not None:
+                node_.prev.prev = None
+        return released[::-1]
+
+
+def _iter_path_commands(
+    svgd: str | SvgdBuffer, resolution: int | None = None
+) -> Iterator[PathCommand]:
+    """Lazily create and yield each final command in an svg path data string.
+
+    :param svgd: an svg path data string or ascii svg path data in a buffer
+    :param resolution: optionally limit the resolution of the output
+    :return: None
+    :yield: each command in the linked list once it is final
+    """
+    builder = _PathCommandBuilder(resolution)
+    for cmd, vals in iter_svgd_commands(svgd):
+        yield from builder.push(cmd, vals)
+    yield from builder.close()
+
+
+class SvgdParser:
+    """Parse svg path data pushed one chunk at a time.
+
+    Each `PathCommand` is returned as soon as it is final, so the first commands of
+    a long path are available before the rest of the path arrives. Chunks may split
+    numbers, and bytes chunks may split multi-byte characters.
+
+        >>> parser = SvgdParser()
+        >>> [x.cmd + " ".join(x.abs_strs) for x in parser.feed("M0 0L1")]
+        []
+        >>> [x.cmd + " ".join(x.abs_strs) for x in parser.feed("0 0L10 10 20 30")]
+        ['M0 0', 'L10 0']
+        >>> [x.cmd + " ".join(x.abs_strs) for x in parser.close()]
+        ['L10 10', 'L20 30']
+
+    The last command is held until the next command shows whether the two will be
+    merged.
+    """
+
+    def __init__(self, resolution: int | None = None, encoding: str = "utf-8") -> None:
+        """Start parsing a new path.
+
+        :param resolution: optionally limit the resolution used to identify linear
+            curves and closed paths
+        :param encoding: the encoding of bytes chunks
+        """
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._splitter = SvgdCommandSplitter()
+        self._builder = _PathCommandBuilder(resolution)
+        self._is_closed = False
+
+    def feed(self, chunk: str | bytes | bytearray | memoryview) -> list[PathCommand]:
+        """Parse the next chunk of path data.
+
+        :param chunk: the next part of an svg path data string
+        :return: commands that became final, in path order. Use `PathCommand.cpts`
+            for control points.
+        :raises ValueError: as soon as an invalid part of the data is reached or if
+            the parser is already closed
+        """
+        if self._is_closed:
+            msg = "Cannot feed a closed SvgdParser."
+            raise ValueError(msg)
+        text = chunk if isinstance(chunk, str) else self._decoder.decode(chunk)
+        released: list[PathCommand] = []
+        for cmd, vals in self._splitter.feed(text):
+            released.extend(self._builder.push(cmd, vals))
+        return released
+
+    def close(self) -> list[PathCommand]:
+        """Parse any held-back data and finish the path.
+
+        :return: all remaining commands, in path order
+        :raises ValueError: if the data is not valid
+        """
+        if self._is_closed:
+            return []
+        self._is_closed = True
+        groups = self._splitter.feed(self._decoder.decode(b"", final=True))
+        groups.extend(self._splitter.close())
+        released: list[PathCommand] = []
+        for cmd, vals in groups:
+            released.extend(self._builder.push(cmd, vals))
+        return released + self._builder.close()
 
 
 class PathCommands:
@@ -530,11 +989,65 @@ class PathCommands:
     def __init__(self, cmd: PathCommand) -> None:
         """Create a linked list of commands.
 
-        :param cmd: the first command in the linked list
+        :param cmd: any command in the linked list, usually the last
+        """
+        self.head, self.tail = self._find_ends(cmd)
+
+    @staticmethod
+    def _find_ends(cmd: PathCommand) -> tuple[PathCommand, PathCommand]:
+        """Find the first and last commands in a linked list.
+
+        :param cmd: any command in the linked list
+        :return: the first and last commands
+
+        The first command is found from the last, because a move that skipped a
+        redundant move is still reached through the next link of that move.
+        """
+        tail = cmd
+        while tail.next is not None:
+            tail = tail.next
+        head = tail
+        while head.prev is not None:
+            head = head.prev
+        return head, tail
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get a flat representation of the linked list for pickling and copying.
+
+        :return: the resolution, one letter per command, and the absolute values
+            of all commands in one float array
+
+        Pickling the commands themselves would recurse through every prev link.
+        """
+        cmds = list(self)
+        vals: array[float] = array("d")
+        for cmd in cmds:
+            vals.extend(cmd.abs_vals)
+        return {
+            "resolution": self.head.resolution,
+            "cmds": "".join(x.cmd for x in cmds),
+            "vals": vals,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Rebuild the linked list from the output of `__getstate__`.
+
+        :param state: the output of `__getstate__`
+
+        The commands are already normalized, so they are linked directly instead of
+        appended.
         """
-        while cmd.prev is not None:
-            cmd = cmd.prev
-        self.head = cmd
+        vals: array[float] = state["vals"]
+        node: PathCommand | None = None
+        at_val = 0
+        for cmd in state["cmds"]:
+            num_vals = _CMD_2_N[cmd.lower()]
+            cmd_vals = vals[at_val : at_val + num_vals]
+            node = PathCommand(cmd, cmd_vals, node, state["resolution"])
+            at_val += num_vals
+        if node is None:
+            node = PathCommand("M", [0, 0], resolution=state["resolution"])
+        self.head, self.tail = self._find_ends(node)
 
     def __iter__(self) -> Iterator[PathCommand]:
         """Iterate over the commands in the linked list.
@@ -562,62 +1075,174 @@ class PathCommands:
 
         node = PathCommand.append("M", formatted_cpts[0][0], resolution=resolution)
         for curve in formatted_cpts:
-            curve_0_strs = map(node.format_number, curve[0])
-            is_disjoint = (  # try to short circuit before any string conversions
-                not _comp_iterables(node.abs_vals[-2:], curve[0])
-                and not _comp_iterables(node.abs_strs[-2:], curve_0_strs)
-            )
-            if is_disjoint:
+            if node.is_disjoint(curve[0]):
                 node = PathCommand.append("M", curve[0], node)
             node = PathCommand.append(None, it.chain(*curve[1:]), node)
 
         return cls(node)
 
     @classmethod
-    def from_svgd(cls, svgd: str, resolution: int | None = None) -> PathCommands:
+    def from_svgd(
+        cls,
+        svgd: str | SvgdBuffer,
+        resolution: int | None = None,
+        *,
+        validate: bool = True,
+    ) -> PathCommands:
         """Create a linked list of commands from an SVG path data string.
 
-        :param svgd: an ABSOLUTE SVG path data string
+        :param svgd: an SVG path data string or ascii SVG path data in a bytes,
+            bytearray, memoryview, or mmap object
+        :param validate: if False, skip validation. Only for trusted input, e.g.,
+            path data this package wrote.
         :return: the first command in the linked list
         :raises ValueError: if the SVG data string contains arc commands
         """
-        parts = svgd_split(svgd)[::-1]  # e.g., ["M", "0", "0", "H", "1", "V", "2"]
+        if not isinstance(svgd, str):
+            cmds, vals = svgd_split_buffer(svgd, validate=validate)
+            return cls.from_commands(_iter_buffer_commands(cmds, vals), resolution)
+
+        # e.g., ["M", "0", "0", "H", "1", "V", "2"], reversed to pop from the end
+        parts = svgd_split(svgd, validate=validate)
+        parts.reverse()
         if not parts:
             return cls(PathCommand("M", [0, 0], resolution=resolution))
 
         cmd_str = parts.pop()
-        node = PathCommand.append(
-            cmd_str, _take_n_floats(parts, 2), resolution=resolution
-        )
+        node = _append_svgd_command(None, cmd_str, _take_n_floats(parts, 2), resolution)
         while parts:
             cmd_str = {"m": "l", "M": "L"}.get(cmd_str, cmd_str)
             if parts[-1].lower() in _CMD_2_N:
                 cmd_str = parts.pop()
             num_args = _CMD_2_N[cmd_str.lower()]
-            nums = list(_take_n_floats(parts, num_args))
-            if cmd_str in "Zz":  # close with a line if not already closed
-                if node.does_close:
-                    continue
-                node = PathCommand.append("L", node.path_open, node)
-            else:
-                node = PathCommand.append(cmd_str, nums, node)
+            node = _append_svgd_command(node, cmd_str, _take_n_floats(parts, num_args))
         return cls(node)
 
-    def _get_svgd(self, relative_or_absolute: RelativeOrAbsolute) -> str:
-        """Get the SVG path data string for the commands in the linked list.
+    @classmethod
+    def from_commands(
+        cls,
+        cmds: Iterable[tuple[str, Sequence[float]]],
+        resolution: int | None = None,
+    ) -> PathCommands:
+        """Create a linked list of commands from (command, floats) pairs.
+
+        :param cmds: svg commands with exactly the number of floats each command
+            takes, e.g., [("M", [0, 0]), ("l", [1, 1]), ("Z", [])]. Implicit
+            repeats must already be explicit.
+        :param resolution: optionally limit the resolution of the output
+        :return: an instance of PathCommands linked list
+        """
+        node: PathCommand | None = None
+        for cmd, vals in cmds:
+            node = _append_svgd_command(node, cmd, vals, resolution)
+        if node is None:
+            return cls(PathCommand("M", [0, 0], resolution=resolution))
+        return cls(node)
+
+    def iter_svgd(
+        self, relative_or_absolute: RelativeOrAbsolute = RelativeOrAbsolute.SHORTEST
+    ) -> Iterator[str]:
+        """Get the SVG path data string for the commands in fragments.
 
         :param relative_or_absolute: whether to return relative or absolute coordinates
-        :return: an SVG path data string
+        :return: None
+        :yield: fragments of the SVG path data string as they are formatted
         """
         if all(x.cmd == "M" for x in self):
-            return ""
+            return
+        if relative_or_absolute == RelativeOrAbsolute.COMPRESSED:
+            yield self._get_compressed_svgd()
+            return
         if relative_or_absolute != RelativeOrAbsolute.SHORTEST:
-            return svgd_join_commands(*(x.get_svgd(relative_or_absolute) for x in self))
+            yield from iter_joined_commands(
+                x.get_svgd(relative_or_absolute) for x in self
+            )
+            return
 
+        joiner: ShortestSvgdJoiner | None = None
+        state = ("", "")
+        for node in self:
+            is_first = node is self.head
+            if joiner is None:
+                joined = node.join_shortest(state, is_first=is_first)
+                if joined is not None:
+                    text, state = joined
+                    yield text
+                    continue
+                joiner = ShortestSvgdJoiner(state)
+            relative = None if is_first else node.get_svgd(RelativeOrAbsolute.RELATIVE)
+            yield from joiner.push(node.get_svgd(RelativeOrAbsolute.ABSOLUTE), relative)
+            if (state_after := joiner.state) is not None:
+                state = state_after
+                joiner = None
+        if joiner is not None:
+            yield from joiner.close()
+
+    def _get_compressed_svgd(self) -> str:
+        """Get the SVG path data string that is smallest after compression.
+
+        :return: the absolute, relative, or shortest SVG path data string, or the
+            relative string after an absolute first move, whichever is smallest
+            after deflate compression
+
+        Each command is formatted once each way, and all four strings are joined
+        from those fragments. The relative string may start with "m", which
+        `concat_svgd` makes absolute when joining paths.
+        """
         absolutes = [x.get_svgd(RelativeOrAbsolute.ABSOLUTE) for x in self]
-        skip_1st = it.islice(self, 1, None)
-        relatives = [None, *(x.get_svgd(RelativeOrAbsolute.RELATIVE) for x in skip_1st)]
-        return get_shortest_svgd(absolutes, relatives)
+        relatives = [x.get_svgd(RelativeOrAbsolute.RELATIVE) for x in self]
+        return get_smallest_compressed(
+            "".join(iter_joined_commands(absolutes)),
+            "".join(iter_joined_commands(relatives)),
+            "".join(iter_joined_commands([absolutes[0], *relatives[1:]])),
+            "".join(iter_shortest_svgd(absolutes, [None, *relatives[1:]])),
+        )
+
+    def _get_svgd(self, relative_or_absolute: RelativeOrAbsolute) -> str:
+        """Get the SVG path data string for the commands in the linked list.
+
+        :param relative_or_absolute: whether to return relative or absolute coordinates
+        :return: an SVG path data string
+        """
+        return "".join(self.iter_svgd(relative_or_absolute))
+
+    def write(
+        self,
+        fp: IO[str] | IO[bytes],
+        relative_or_absolute: RelativeOrAbsolute = RelativeOrAbsolute.SHORTEST,
+    ) -> None:
+        """Write the SVG path data string to a text or binary stream.
+
+        :param fp: a text stream (e.g., io.StringIO or a file opened in text mode)
+            or a binary stream (e.g., io.BytesIO or a file opened in binary mode)
+        :param relative_or_absolute: whether to write relative or absolute
+            coordinates
+
+        Fragments are written as they are formatted, so the full string is never
+        held in memory.
+        """
+        is_binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or (
+            "b" in getattr(fp, "mode", "")
+        )
+        buffer: list[str] = []
+        buffer_len = 0
+
+        def flush() -> None:
+            """Write and clear the buffer."""
+            if is_binary:
+                _ = cast("IO[bytes]", fp).write("".join(buffer).encode())
+            else:
+                _ = cast("IO[str]", fp).write("".join(buffer))
+            buffer.clear()
+
+        for fragment in self.iter_svgd(relative_or_absolute):
+            buffer.append(fragment)
+            buffer_len += len(fragment)
+            if buffer_len >= _WRITE_BUFFER_SIZE:
+                flush()
+                buffer_len = 0
+        if buffer:
+            flush()
 
     @property
     def svgd(self) -> str:
@@ -653,51 +1278,580 @@ class PathCommands:
         per_cmd = (x.cpts for x in self)
         return [x for x in per_cmd if x]
 
+    def _iter_segments(
+        self, *, reverse: bool = False
+    ) -> Iterator[tuple[PathCommand, PathCommand]]:
+        """Iterate over the segments of the path.
+
+        :param reverse: walk back from the tail instead of forward from the head
+        :return: None
+        :yield: the command before each segment and the command that draws it
+        """
+        if not reverse:
+            yield from ((a, b) for a, b in it.pairwise(self) if b.cmd != "M")
+            return
+        node = self.tail
+        while (prev := node.prev) is not None:
+            if node.cmd != "M":
+                yield prev, node
+            node = prev
+
+    def _find_segment(self, index: int) -> tuple[PathCommand, PathCommand] | None:
+        """Walk to a segment by its index.
+
+        :param index: the index of a segment. Negative indices count back from the
+            tail, so only the commands between the segment and the nearer end of
+            the path are visited.
+        :return: the command before the segment and the command that draws it or
+            None if there is no segment at index
+        """
+        if index < 0:
+            segments = self._iter_segments(reverse=True)
+            index = -index - 1
+        else:
+            segments = self._iter_segments()
+        return next(it.islice(segments, index, None), None)
+
+    def _get_segment(self, index: int) -> tuple[PathCommand, PathCommand]:
+        """Get a segment by its index.
+
+        :param index: the index of a segment. Move commands are not segments, so
+            segment i is curve i of `cpts` when the path has no arcs.
+        :return: the command before the segment and the command that draws it
+        :raises IndexError: if there is no segment at index
+        """
+        segment = self._find_segment(index)
+        if segment is None:
+            num_segments = sum(1 for _ in self._iter_segments())
+            msg = f"Segment index {index} out of range for {num_segments} segments."
+            raise IndexError(msg)
+        return segment
+
+    def _get_new_commands(
+        self, before: PathCommand, cpts: Iterable[Iterable[float]]
+    ) -> list[tuple[str | None, list[float]]]:
+        """Get the commands that draw a curve after a command.
+
+        :param before: the command the curve will follow
+        :param cpts: the xy control points of a line or Bezier curve
+        :return: (command, floats) pairs, with a move command first if the curve
+            does not start where before ends
+        :raises ValueError: if cpts is not a line, quadratic, or cubic
+        """
+        curve = [(x, y) for x, y in cpts]
+        if not 2 <= len(curve) <= _N_LINEAR:
+            msg = f"Expected 2 to {_N_LINEAR} control points, got {len(curve)}."
+            raise ValueError(msg)
+        commands: list[tuple[str | None, list[float]]] = []
+        if before.is_disjoint(curve[0]):
+            commands.append(("M", list(curve[0])))
+        commands.append((None, list(it.chain(*curve[1:]))))
+        return commands
+
+    def _push(
+        self, node: PathCommand | None, cmd: str | None, vals: Iterable[float]
+    ) -> PathCommand:
+        """Append a command while editing, dropping a move that would be redundant.
+
+        :param node: the last command so far
+        :param cmd: the svg command letter or None to infer it from vals
+        :param vals: the float parameters of the command
+        :return: the new last command
+        """
+        resolution = self.head.resolution
+        while cmd == "M" and node is not None and node.cmd == "M":
+            node = node.prev
+        node = PathCommand.append(cmd, vals, node, resolution)
+        if node.prev is None:
+            self.head = node
+        return node
+
+    def _relink(
+        self,
+        before: PathCommand,
+        commands: Iterable[tuple[str | None, list[float]]],
+        after: PathCommand | None,
+    ) -> None:
+        """Replace the commands between two commands.
+
+        :param before: the last command to keep before the change
+        :param commands: (command, floats) pairs to append after before
+        :param after: the first command to keep after the change, or None to end
+            the path with the new commands
+
+        The commands from after onward are appended again one at a time, because
+        the relative values, shorthand commands, and closing of each depend on the
+        command before it. Once an appended command is the same as the old command
+        with the same start point and subpath start, the old commands after it are
+        linked to it unchanged, and their cached strings are still valid.
+        """
+        node = before
+        for cmd, vals in commands:
+            node = self._push(node, cmd, vals)
+        while after is not None:
+            following = after.next
+            old_start = None if after.prev is None else after.prev.abs_vals[-2:]
+            node = self._push(node, after.cmd, after.abs_vals)
+            if (
+                following is not None
+                and after.cmd != "M"
+                and node.cmd == after.cmd
+                and node.abs_vals == after.abs_vals
+                and node.path_open == after.path_open
+                and node.prev is not None
+                and node.prev.abs_vals[-2:] == old_start
+            ):
+                following.prev = node
+                node.next = following
+                return
+            after = following
+        if node.cmd == "M" and node.prev is not None:
+            node = node.prev  # drop a move that ends the path
+            node.next = None
+        self.tail = node
+
+    def replace(self, index: int, cpts: Iterable[Iterable[float]]) -> None:
+        """Replace one segment of the path with a line or Bezier curve.
+
+        :param index: the index of the segment to replace. Move commands are not
+            segments, so segment i is curve i of `cpts` when the path has no arcs.
+        :param cpts: the xy control points of the new segment. If the first point
+            is not the end of the previous segment, a move is inserted before it.
+        :raises IndexError: if there is no segment at index
+        :raises ValueError: if cpts is not a line, quadratic, or cubic
+
+        The following segment keeps its absolute values and starts where the new
+        segment ends. Only the new segment and the commands that depend on it are
+        created again, so formatting the path after an edit takes time in
+        proportion to the edit, not to the size of the path.
+        """
+        before, segment = self._get_segment(index)
+        commands = self._get_new_commands(before, cpts)
+        self._relink(before, commands, segment.next)
+
+    def insert(self, index: int, cpts: Iterable[Iterable[float]]) -> None:
+        """Insert a line or Bezier curve before a segment of the path.
+
+        :param index: the new segment will have this index. An index past the last
+            segment appends to the end of the path.
+        :param cpts: the xy control points of the new segment. If the first point
+            is not the end of the previous segment, a move is inserted before it.
+        :raises ValueError: if cpts is not a line, quadratic, or cubic
+
+        The segment formerly at index keeps its absolute values and starts where
+        the new segment ends.
+        """
+        segment = self._find_segment(index)
+        if segment is None and index < 0:  # before the first segment, if any
+            segment = self._find_segment(0)
+        before, after = segment or (self.tail, None)
+        self._relink(before, self._get_new_commands(before, cpts), after)
+
+    def delete(self, index: int) -> None:
+        """Delete one segment of the path.
+
+        :param index: the index of the segment to delete
+        :raises IndexError: if there is no segment at index
 
-def format_svgd_relative(svgd: str, resolution: int | None = None) -> str:
+        The following segment keeps its absolute values and starts where the
+        deleted segment started.
+        """
+        before, segment = self._get_segment(index)
+        self._relink(before, [], segment.next)
+
+
+def _get_distance_to_segment(
+    pt: tuple[float, float], seg_a: tuple[float, float], seg_b: tuple[float, float]
+) -> float:
+    """Get the distance from a point to a line segment.
+
+    :param pt: the point
+    :param seg_a: one end of the segment
+    :param seg_b: the other end of the segment
+    :return: the distance from pt to the nearest point on the segment
+    """
+    (px, py), (ax, ay), (bx, by) = pt, seg_a, seg_b
+    vx, vy = bx - ax, by - ay
+    length_sq = vx * vx + vy * vy
+    time = 0.0
+    if length_sq:
+        time = min(max(((px - ax) * vx + (py - ay) * vy) / length_sq, 0.0), 1.0)
+    return math.hypot(px - (ax + time * vx), py - (ay + time * vy))
+
+
+def _get_run_error(run: list[tuple[float, float]]) -> float:
+    """Get the largest distance from a replaced point to the line replacing it.
+
+    :param run: the start of a straight line, every control point it replaces,
+        and its end
+    :return: the largest distance from a replaced point to the line
+    """
+    return max(
+        (_get_distance_to_segment(p, run[0], run[-1]) for p in run[1:-1]), default=0.0
+    )
+
+
+def _get_linearization_error(
+    nodes: Iterable[PathCommand], snap: Callable[[float], float]
+) -> float:
+    """Get how far points move when curves are straightened and lines merged.
+
+    :param nodes: commands built without a resolution
+    :param snap: round a number to the candidate resolution
+    :return: the largest distance from a dropped control point to the line that
+        replaces it
+
+    Follows the rules of `PathCommand.__init__` and `PathCommand.append`: a curve
+    becomes a line if its control points are linear at the resolution, and a
+    line is merged into the line before it if the three points are linear.
+    """
+    worst = 0.0
+    run: list[tuple[float, float]] = []
+    for node in nodes:
+        if node.cmd not in "LQC" or (
+            node.cmd != "L" and not _is_linear(node.cpts, snap)
+        ):
+            worst = max(worst, _get_run_error(run))
+            run = []
+            continue
+        cpts = node.cpts
+        if len(run) > 1 and _is_linear([run[0], run[-1], cpts[-1]], snap):
+            run.extend(cpts[1:])
+            continue
+        worst = max(worst, _get_run_error(run))
+        run = cpts
+    return max(worst, _get_run_error(run))
+
+
+def _choose_resolution_for_commands(
+    cmds: PathCommands, budget: ErrorBudget
+) -> ResolutionChoice:
+    """Choose the smallest resolution that keeps output errors within a budget.
+
+    :param cmds: commands built without a resolution
+    :param budget: the render size, the largest allowed error in pixels, and an
+        optional viewBox
+    :return: the chosen resolution and the largest error it introduces
+    """
+    values: list[float] = []
+    points: list[tuple[float, float]] = []
+    for cmd in cmds:
+        values.extend(cmd.abs_vals)
+        coords = cmd.abs_vals[-2:] if cmd.cmd == "A" else cmd.abs_vals
+        points.extend(_chunk_pairs(coords))
+
+    def measure(resolution: int, limit: float) -> float:
+        rounding = get_rounding_error(values, resolution, limit)
+        if rounding > limit:
+            return rounding
+        snap = PathCommand("M", [0, 0], resolution=resolution).snap
+        return rounding + _get_linearization_error(cmds, snap)
+
+    return choose_resolution_by(measure, get_pixels_per_unit(budget, points), budget)
+
+
+def choose_resolution(svgd: str | SvgdBuffer, budget: ErrorBudget) -> ResolutionChoice:
+    """Choose the smallest resolution that keeps output errors within a budget.
+
+    :param svgd: an SVG path data string
+    :param budget: the render size, the largest allowed error in pixels, and an
+        optional viewBox. Without a viewBox, use the bounding box of the control
+        points (arc endpoints only).
+    :return: the chosen resolution and the largest error it introduces: the
+        largest change to any coordinate plus the largest distance from a control
+        point dropped by straightening curves and merging lines
+    """
+    return _choose_resolution_for_commands(PathCommands.from_svgd(svgd), budget)
+
+
+def choose_resolution_for_cpts(
+    cpts: Iterable[Iterable[Iterable[float]]], budget: ErrorBudget
+) -> ResolutionChoice:
+    """Choose the smallest resolution that keeps output errors within a budget.
+
+    :param cpts: a list of curves, each a list of xy control points
+    :param budget: the render size, the largest allowed error in pixels, and an
+        optional viewBox. Without a viewBox, use the bounding box of the control
+        points.
+    :return: the chosen resolution and the largest error it introduces
+    """
+    return _choose_resolution_for_commands(PathCommands.from_cpts(cpts), budget)
+
+
+def _resolve_resolution(
+    svgd: str | SvgdBuffer, resolution: int | ErrorBudget | None, *, validate: bool
+) -> int | None:
+    """Choose a resolution for an SVG path data string if given an ErrorBudget.
+
+    :param svgd: an SVG path data string
+    :param resolution: a resolution, an ErrorBudget, or None
+    :param validate: whether to validate svgd when choosing a resolution
+    :return: the resolution to format svgd at
+    """
+    if isinstance(resolution, ErrorBudget):
+        cmds = PathCommands.from_svgd(svgd, validate=validate)
+        return _choose_resolution_for_commands(cmds, resolution).resolution
+    return resolution
+
+
+def format_svgd_relative(
+    svgd: str | SvgdBuffer,
+    resolution: int | ErrorBudget | None = None,
+    *,
+    validate: bool = True,
+) -> str:
     """Convert an absolute SVG path data string to a relative one.
 
     :param svgd: an ABSOLUTE SVG path data string
+    :param resolution: optionally limit the resolution of the output. Pass an
+        ErrorBudget to choose the smallest resolution within the budget.
+    :param validate: if False, skip validation. Only for trusted input.
     :return: a RELATIVE SVG path data string
     """
-    return PathCommands.from_svgd(svgd, resolution=resolution).rel_svgd
+    resolution = _resolve_resolution(svgd, resolution, validate=validate)
+    return PathCommands.from_svgd(svgd, resolution, validate=validate).rel_svgd
 
 
-def format_svgd_absolute(svgd: str, resolution: int | None = None) -> str:
+def format_svgd_absolute(
+    svgd: str | SvgdBuffer,
+    resolution: int | ErrorBudget | None = None,
+    *,
+    validate: bool = True,
+) -> str:
     """Convert a relative SVG path data string to an absolute one.
 
     :param svgd: a RELATIVE SVG path data stming
+    :param resolution: optionally limit the resolution of the output. Pass an
+        ErrorBudget to choose the smallest resolution within the budget.
+    :param validate: if False, skip validation. Only for trusted input.
     :return: an ABSOLUTE SVG path data string
     """
-    return PathCommands.from_svgd(svgd, resolution=resolution).abs_svgd
+    resolution = _resolve_resolution(svgd, resolution, validate=validate)
+    return PathCommands.from_svgd(svgd, resolution, validate=validate).abs_svgd
 
 
-def format_svgd_shortest(svgd: str, resolution: int | None = None) -> str:
+def format_svgd_shortest(
+    svgd: str | SvgdBuffer,
+    resolution: int | ErrorBudget | None = None,
+    *,
+    validate: bool = True,
+) -> str:
     """Convert an SVG path data string to the shortest form.
 
     :param svgd: an SVG path data string
+    :param resolution: optionally limit the resolution of the output. Pass an
+        ErrorBudget to choose the smallest resolution within the budget.
+    :param validate: if False, skip validation. Only for trusted input.
     :return: a shortest SVG path data string
     """
-    return PathCommands.from_svgd(svgd, resolution=resolution).svgd
+    resolution = _resolve_resolution(svgd, resolution, validate=validate)
+    return PathCommands.from_svgd(svgd, resolution, validate=validate).svgd
+
+
+def format_svgd_compressed(
+    svgd: str | SvgdBuffer,
+    resolution: int | ErrorBudget | None = None,
+    *,
+    validate: bool = True,
+) -> str:
+    """Convert an SVG path data string to a form that compresses well.
+
+    :param svgd: an SVG path data string
+    :param resolution: optionally limit the resolution of the output. Pass an
+        ErrorBudget to choose the smallest resolution within the budget.
+    :param validate: if False, skip validation. Only for trusted input.
+    :return: the absolute, relative, or shortest SVG path data string,
+        whichever is smallest after deflate (gzip) compression
+
+    Use this for paths that are always served compressed. The shortest string
+    is often not the smallest compressed.
+    """
+    resolution = _resolve_resolution(svgd, resolution, validate=validate)
+    commands = PathCommands.from_svgd(svgd, resolution, validate=validate)
+    return "".join(commands.iter_svgd(RelativeOrAbsolute.COMPRESSED))
+
+
+def format_svgd_resolutions(
+    svgd: str | SvgdBuffer,
+    resolutions: Iterable[int | None],
+    relative_or_absolute: RelativeOrAbsolute = RelativeOrAbsolute.SHORTEST,
+) -> dict[int | None, str]:
+    """Format one SVG path data string at several resolutions (levels of detail).
+
+    :param svgd: an SVG path data string
+    :param resolutions: each resolution to format, e.g., (0, 1, 2, 4)
+    :param relative_or_absolute: the output format
+    :return: a dict mapping each resolution to the string the matching
+        `format_svgd_*` function would return at that resolution
+    :raises ValueError: if the SVG path data string is not valid
+
+    The string is split and validated once. The linked list is still built again
+    for each resolution, because the nodes themselves depend on resolution. A
+    curve becomes a line, a cubic becomes a quadratic, and lines merge only where
+    they do at that resolution, and an `S` or `T` command reflects the control
+    point of the command before it as built at that resolution. Converting
+    relative values to absolute is the only part of building the nodes that could
+    be shared, and it is a small part of the work next to snapping, merging, and
+    formatting.
+    """
+    commands = list(iter_svgd_commands(svgd))
+    return {
+        r: "".join(
+            PathCommands.from_commands(commands, r).iter_svgd(relative_or_absolute)
+        )
+        for r in resolutions
+    }
+
+
+_ConvertOutput = Literal["abs", "rel", "shortest", "cpts"]
+
+_CONVERT_OUTPUTS = frozenset(("abs", "rel", "shortest", "cpts"))
+
+
+@dataclasses.dataclass(frozen=True)
+class ConvertedSvgd:
+    """The outputs of `convert`. Outputs that were not requested are None."""
+
+    abs_svgd: str | None = None
+    rel_svgd: str | None = None
+    svgd: str | None = None
+    cpts: list[list[tuple[float, float]]] | None = None
+
+
+def convert(
+    svgd: str | SvgdBuffer,
+    outputs: Iterable[_ConvertOutput] | None = None,
+    resolution: int | None = None,
+) -> ConvertedSvgd:
+    """Parse an SVG path data string once and get several formats.
+
+    :param svgd: an absolute or relative SVG path data string
+    :param outputs: any of "abs" (`format_svgd_absolute`), "rel"
+        (`format_svgd_relative`), "shortest" (`format_svgd_shortest`), and "cpts"
+        (`get_cpts_from_svgd`). By default, get all four.
+    :param resolution: optionally limit the resolution of the output
+    :return: the requested outputs, each the same as the matching function would
+        return
+    :raises ValueError: if an output name is unknown or the path data is not
+        valid
+
+    Each command is formatted at most once in each of the absolute and relative
+    forms, and the shortest form is chosen from those same fragments.
+    """
+    requested: set[str] = set(_CONVERT_OUTPUTS if outputs is None else outputs)
+    if unknown := requested - _CONVERT_OUTPUTS:
+        msg = f"Unknown convert outputs: {sorted(unknown)}"
+        raise ValueError(msg)
+    nodes = list(PathCommands.from_svgd(svgd, resolution=resolution))
+    cpts = [x for x in (n.cpts for n in nodes) if x] if "cpts" in requested else None
+    if all(n.cmd == "M" for n in nodes):
+        nodes = []
+    absolutes: list[str] = []
+    relatives: list[str] = []
+    if requested & {"abs", "shortest"}:
+        absolutes = [n.get_svgd(RelativeOrAbsolute.ABSOLUTE) for n in nodes]
+    if requested & {"rel", "shortest"}:
+        relatives = [n.get_svgd(RelativeOrAbsolute.RELATIVE) for n in nodes]
+    abs_svgd = rel_svgd = shortest = None
+    if "abs" in requested:
+        abs_svgd = "".join(iter_joined_commands(absolutes))
+    if "rel" in requested:
+        rel_svgd = "".join(iter_joined_commands(relatives))
+    if "shortest" in requested:
+        # the first command is always absolute
+        relatives_ = [None, *relatives[1:]] if nodes else []
+        shortest = "".join(iter_shortest_svgd(absolutes, relatives_))
+    return ConvertedSvgd(abs_svgd, rel_svgd, shortest, cpts)
 
 
 def get_cpts_from_svgd(
-    svgd: str, resolution: int | None = None
+    svgd: str | SvgdBuffer, resolution: int | None = None, *, validate: bool = True
 ) -> list[list[tuple[float, float]]]:
     """Get a list of lists of Bezier control points from an SVG path data string.
 
     :param svgd: an absolute or relative SVG path data string
+    :param validate: if False, skip validation. Only for trusted input.
     :return: a list of curves, each a list of xy tuples.
     """
-    return PathCommands.from_svgd(svgd, resolution=resolution).cpts
+    return PathCommands.from_svgd(svgd, resolution, validate=validate).cpts
 
 
 def get_svgd_from_cpts(
-    cpts: Iterable[Iterable[Iterable[float]]], resolution: int | None = None
+    cpts: Iterable[Iterable[Iterable[float]]],
+    resolution: int | ErrorBudget | None = None,
 ) -> str:
     """Get an SVG path data string for a list of list of Bezier control points.
 
     :param cpts: a list of curves, each a list of xy control points
+    :param resolution: optionally limit the resolution of the output. Pass an
+        ErrorBudget to choose the smallest resolution within the budget.
     :return: SVG path data string
     """
+    if isinstance(resolution, ErrorBudget):
+        cpts = [list(map(tuple, curve)) for curve in cpts]
+        resolution = choose_resolution_for_cpts(cpts, resolution).resolution
     return PathCommands.from_cpts(cpts, resolution=resolution).svgd
+
+
+def iter_cpts_from_svgd(
+    svgd: str | SvgdBuffer, resolution: int | None = None
+) -> Iterator[list[tuple[float, float]]]:
+    """Lazily yield Bezier control points from an SVG path data string.
+
+    :param svgd: an absolute or relative SVG path data string
+    :return: None
+    :yield: curves, each a list of xy tuples, as the string is parsed
+    :raises ValueError: when the first invalid part of the string is reached
+
+    Yields the same curves as `get_cpts_from_svgd` while holding only a few
+    commands in memory at a time.
+    """
+    for cmd in _iter_path_commands(svgd, resolution):
+        if cpts := cmd.cpts:
+            yield cpts
+
+
+def iter_subpaths(
+    svgd: str | SvgdBuffer, resolution: int | None = None
+) -> Iterator[list[list[tuple[float, float]]]]:
+    """Lazily yield the Bezier control points of each subpath in a path.
+
+    :param svgd: an absolute or relative SVG path data string
+    :return: None
+    :yield: subpaths, each a list of curves, each a list of xy tuples. A subpath
+        is every curve between two move commands.
+    :raises ValueError: when the first invalid part of the string is reached
+    """
+    subpath: list[list[tuple[float, float]]] = []
+    for cmd in _iter_path_commands(svgd, resolution):
+        if cmd.cmd == "M":
+            if subpath:
+                yield subpath
+            subpath = []
+        elif cpts := cmd.cpts:
+            subpath.append(cpts)
+    if subpath:
+        yield subpath
+
+
+def write_svgd(
+    fp: IO[str] | IO[bytes],
+    svgd_or_commands: str | SvgdBuffer | PathCommands,
+    relative_or_absolute: RelativeOrAbsolute = RelativeOrAbsolute.SHORTEST,
+    resolution: int | None = None,
+) -> None:
+    """Write a formatted SVG path data string to a text or binary stream.
+
+    :param fp: a text stream (e.g., io.StringIO or a file opened in text mode)
+        or a binary stream (e.g., io.BytesIO or a file opened in binary mode)
+    :param svgd_or_commands: an SVG path data string or a PathCommands instance.
+    :param relative_or_absolute: whether to write relative, absolute, or shortest
+        coordinates
+    :param resolution: optionally limit the resolution of the output. Ignored if
+        svgd_or_commands is a PathCommands instance.
+    """
+    if isinstance(svgd_or_commands, PathCommands):
+        commands = svgd_or_commands
+    else:
+        commands = PathCommands.from_svgd(svgd_or_commands, resolution=resolution)
+    commands.write(fp, relative_or_absolute)
@@ -0,0 +1,150 @@
+"""Convert between SVG path data and matplotlib-style vertices and codes.
+
+A matplotlib `Path` stores its geometry as an (N, 2) array of vertices and an array
+of N codes. These functions read and write the same layout from flat buffers
+without building a tuple for every point, and they do not require matplotlib.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import itertools as it
+from array import array
+from typing import TYPE_CHECKING, Any, cast
+
+from svg_path_data.svg_data import PathCommands
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+    from svg_path_data.string_ops import SvgdBuffer
+
+# The values of the matplotlib.path.Path codes.
+STOP = 0
+MOVETO = 1
+LINETO = 2
+CURVE3 = 3
+CURVE4 = 4
+CLOSEPOLY = 79
+
+# How many vertices does each code take? Codes for curves are repeated once for each
+# vertex after the current point.
+_CODE_2_CMD = {MOVETO: "M", LINETO: "L", CURVE3: "Q", CURVE4: "C"}
+_CODE_2_N = {MOVETO: 1, LINETO: 1, CURVE3: 2, CURVE4: 3, CLOSEPOLY: 1}
+
+
+def _flatten_vertices(
+    vertices: Sequence[float] | Sequence[Sequence[float]],
+) -> Sequence[float]:
+    """Get vertices as a flat sequence of floats.
+
+    :param vertices: a flat sequence [x0, y0, x1, y1, ...], a sequence of xy pairs,
+        or anything with a `ravel` method (e.g., an (N, 2) numpy array)
+    :return: a flat sequence of floats
+    """
+    ravel: Callable[[], Any] | None = getattr(vertices, "ravel", None)
+    if ravel is not None:
+        return ravel().tolist()
+    if not vertices or isinstance(vertices[0], (int, float)):
+        return cast("Sequence[float]", vertices)
+    pairs = cast("Sequence[Sequence[float]]", vertices)
+    return array("d", it.chain.from_iterable(pairs))
+
+
+def _iter_commands(
+    vertices: Sequence[float], codes: Sequence[int] | None
+) -> Iterator[tuple[str, Sequence[float]]]:
+    """Iterate over svg commands for a flat vertex buffer and a code buffer.
+
+    :param vertices: a flat sequence [x0, y0, x1, y1, ...]
+    :param codes: one code per vertex or None for a single polyline
+    :return: None
+    :yield: (command, floats) pairs for `PathCommands.from_commands`
+    :raises ValueError: if the codes are not a valid matplotlib path
+    """
+    num_vertices = len(vertices) // 2
+    if codes is None:
+        codes = [MOVETO, *(LINETO for _ in range(num_vertices - 1))]
+    if len(codes) != num_vertices:
+        msg = f"Expected one code per vertex, got {len(codes)} for {num_vertices}."
+        raise ValueError(msg)
+    if num_vertices and codes[0] != MOVETO:
+        msg = "Invalid path codes. A path must start with MOVETO."
+        raise ValueError(msg)
+    at_code = 0
+    while at_code < num_vertices:
+        code = int(codes[at_code])
+        if code == STOP:
+            return
+        if code not in _CODE_2_N:
+            msg = f"Invalid path code {code} at index {at_code}."
+            raise ValueError(msg)
+        num_codes = _CODE_2_N[code]
+        run = codes[at_code : at_code + num_codes]
+        if len(run) < num_codes or any(int(x) != code for x in run):
+            msg = f"Expected {num_codes} consecutive {code} codes at index {at_code}."
+            raise ValueError(msg)
+        if code == CLOSEPOLY:
+            yield "Z", ()
+        else:
+            vals = vertices[at_code * 2 : (at_code + num_codes) * 2]
+            yield _CODE_2_CMD[code], vals
+        at_code += num_codes
+
+
+def get_svgd_from_vertices_codes(
+    vertices: Sequence[float] | Sequence[Sequence[float]],
+    codes: Sequence[int] | None = None,
+    resolution: int | None = None,
+) -> str:
+    """Get an SVG path data string from matplotlib-style vertices and codes.
+
+    :param vertices: a flat sequence [x0, y0, x1, y1, ...], a sequence of xy pairs,
+        or an (N, 2) array like `matplotlib.path.Path.vertices`
+    :param codes: one code per vertex (MOVETO, LINETO, CURVE3, CURVE4, CLOSEPOLY, or
+        STOP) like `matplotlib.path.Path.codes`. None means a single polyline.
+    :param resolution: optionally limit the resolution of the output
+    :return: SVG path data string
+    :raises ValueError: if the codes are not a valid matplotlib path
+    """
+    cmds = _iter_commands(_flatten_vertices(vertices), codes)
+    return PathCommands.from_commands(cmds, resolution=resolution).svgd
+
+
+def get_vertices_codes_from_svgd(
+    svgd: str | SvgdBuffer, resolution: int | None = None
+) -> tuple[array[float], array[int]]:
+    """Get matplotlib-style vertices and codes from an SVG path data string.
+
+    :param svgd: an absolute or relative SVG path data string
+    :param resolution: optionally limit the resolution used to identify linear
+        curves and closed paths
+    :return: a flat array of vertices [x0, y0, x1, y1, ...] and an array with one
+        code per vertex. `numpy.reshape(vertices, (-1, 2))` gives the layout of
+        `matplotlib.path.Path.vertices`.
+    :raises ValueError: if the SVG data string contains arc commands
+    """
+    vertices: array[float] = array("d")
+    codes: array[int] = array("B")
+    cmds = PathCommands.from_svgd(svgd, resolution=resolution)
+    if all(x.cmd == "M" for x in cmds):
+        return vertices, codes
+    for cmd in cmds:
+        if cmd.cmd == "A":
+            msg = "Arc commands cannot be converted to Bezier control points."
+            raise ValueError(msg)
+        if cmd.cmd == "M":
+            vertices.extend(cmd.abs_vals)
+            codes.append(MOVETO)
+            continue
+        does_close = cmd.does_close
+        if cmd.cmd != "L" or not does_close:
+            vertices.extend(cmd.abs_vals)
+            code = {"L": LINETO, "Q": CURVE3, "C": CURVE4}[cmd.cmd]
+            codes.extend(it.repeat(code, len(cmd.abs_vals) // 2))
+        if does_close:
+            vertices.extend(cmd.path_open)
+            codes.append(CLOSEPOLY)
+    return vertices, codes
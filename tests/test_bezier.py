@@ -0,0 +1,162 @@
+"""Test evaluating and measuring Bezier curves.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+import math
+
+import pytest
+
+from svg_path_data.bezier import (
+    get_bbox,
+    get_crossing_times,
+    get_extrema_times,
+    get_nearest_time,
+    get_piece,
+    get_point,
+    get_winding_crossings,
+    split,
+)
+
+
+class TestExtrema:
+    def test_quadratic(self):
+        """A symmetric quadratic turns around at its middle."""
+        assert get_extrema_times([0, 2, 0]) == [0.5]
+
+    def test_cubic(self):
+        """A cubic can turn around twice."""
+        times = get_extrema_times([0, 3, -3, 0])
+        assert len(times) == 2
+        assert all(0 < t < 1 for t in times)
+
+    def test_monotonic(self):
+        """A monotonic coordinate has no extrema."""
+        assert get_extrema_times([0, 1, 2, 3]) == []
+
+    def test_higher_degree(self):
+        """Only curves up to cubic are supported."""
+        with pytest.raises(ValueError, match="cubic"):
+            _ = get_extrema_times([0, 1, 2, 3, 4])
+
+
+class TestBbox:
+    def test_tight(self):
+        """The bounding box is of the curve, not of its control points."""
+        assert get_bbox([(0, 0), (1, 2), (2, 0)]) == (0, 0, 2, 1)
+
+    def test_line(self):
+        """A line is bounded by its end points."""
+        assert get_bbox([(3, 1), (1, 2)]) == (1, 1, 3, 2)
+
+    def test_cubic_contains_samples(self):
+        """Every point of the curve is inside its bounding box."""
+        cpts = [(0, 0), (4, -3), (-1, 5), (3, 1)]
+        min_x, min_y, max_x, max_y = get_bbox(cpts)
+        for i in range(101):
+            x, y = get_point(cpts, i / 100)
+            assert min_x <= x <= max_x
+            assert min_y <= y <= max_y
+
+
+class TestNearest:
+    def test_line(self):
+        """Project onto a line."""
+        time, distance = get_nearest_time([(0, 0), (10, 0)], (4, 3))
+        assert time == pytest.approx(0.4)
+        assert distance == pytest.approx(3)
+
+    def test_curve(self):
+        """The nearest point on a symmetric arch is its apex."""
+        time, distance = get_nearest_time([(0, 0), (1, 2), (2, 0)], (1, 3))
+        assert time == pytest.approx(0.5)
+        assert distance == pytest.approx(2)
+
+    def test_end_point(self):
+        """The nearest point can be an end point."""
+        cpts = [(0, 0), (1, 1), (2, 1), (3, 0)]
+        time, distance = get_nearest_time(cpts, (-3, -4))
+        assert time == 0
+        assert distance == pytest.approx(5)
+
+
+class TestWindingCrossings:
+    def test_line(self):
+        """An upward line to the right counts +1, downward -1."""
+        assert get_winding_crossings([(1, -1), (1, 1)], (0, 0)) == 1
+        assert get_winding_crossings([(1, 1), (1, -1)], (0, 0)) == -1
+        assert get_winding_crossings([(-1, -1), (-1, 1)], (0, 0)) == 0
+
+    def test_curve_crosses_twice(self):
+        """A curve crossing the ray up and then down cancels out."""
+        cpts = [(1, -1), (3, 3), (5, -1)]
+        assert get_winding_crossings(cpts, (0, 0)) == 0
+        assert get_winding_crossings(cpts, (2, 0)) == -1
+
+    def test_half_open_vertex(self):
+        """A ray through a shared vertex counts once."""
+        point = (0, 0)
+        first = get_winding_crossings([(1, -1), (1, 0)], point)
+        second = get_winding_crossings([(1, 0), (1, 1)], point)
+        assert first + second == 1
+
+    def test_circle(self):
+        """Four quadratic-ish cubic arcs wind once around their center."""
+        k = 4 / 3 * (math.sqrt(2) - 1)
+        circle = [
+            [(1, 0), (1, k), (k, 1), (0, 1)],
+            [(0, 1), (-k, 1), (-1, k), (-1, 0)],
+            [(-1, 0), (-1, -k), (-k, -1), (0, -1)],
+            [(0, -1), (k, -1), (1, -k), (1, 0)],
+        ]
+        assert sum(get_winding_crossings(c, (0.2, 0.1)) for c in circle) == 1
+        assert sum(get_winding_crossings(c, (0.8, 0.8)) for c in circle) == 0
+
+
+class TestCrossingTimes:
+    def test_line(self):
+        """A line crosses a value once, at an exact time."""
+        assert get_crossing_times([0, 4], 1) == [0.25]
+        assert get_crossing_times([0, 4], 5) == []
+
+    def test_cubic(self):
+        """A cubic can cross a value three times."""
+        values = [0, 3, -3, 0]
+        times = get_crossing_times(values, 0.1)
+        assert len(times) == 2
+        assert times == sorted(times)
+        cpts = [(v, 0) for v in values]
+        for time in times:
+            assert get_point(cpts, time)[0] == pytest.approx(0.1)
+
+    def test_touch(self):
+        """A curve that only touches the value at an extremum does not cross."""
+        assert get_crossing_times([0, 2, 0], 1) == []
+
+
+class TestSplit:
+    def test_halves(self):
+        """Each half of a split curve traces the matching half of the curve."""
+        cpts = [(0, 0), (1, 2), (3, -1), (4, 1)]
+        head, tail = split(cpts, 0.3)
+        for i in range(11):
+            time = i / 10
+            expect_head = get_point(cpts, time * 0.3)
+            expect_tail = get_point(cpts, 0.3 + time * 0.7)
+            assert get_point(head, time) == pytest.approx(expect_head)
+            assert get_point(tail, time) == pytest.approx(expect_tail)
+
+    def test_piece(self):
+        """A piece of a curve traces the curve between two times."""
+        cpts = [(0, 0), (1, 2), (3, -1)]
+        piece = get_piece(cpts, 0.25, 0.75)
+        for i in range(11):
+            time = i / 10
+            expect = get_point(cpts, 0.25 + time * 0.5)
+            assert get_point(piece, time) == pytest.approx(expect)
+
+    def test_whole(self):
+        """The piece from 0 to 1 is the curve."""
+        cpts = [(0, 0), (1, 2), (3, -1)]
+        assert get_piece(cpts, 0, 1) == cpts
@@ -0,0 +1,154 @@
+"""Test the content-addressed result cache.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from test_svg_data import potrace_output
+
+from svg_path_data import (
+    format_svgd_absolute,
+    format_svgd_relative,
+    format_svgd_shortest,
+    get_cpts_from_svgd,
+    get_svgd_from_cpts,
+)
+from svg_path_data.cache import SvgdCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestMemoryCache:
+    def test_results_match_uncached(self) -> None:
+        """Cached results are the same as uncached results."""
+        cache = SvgdCache()
+        for _ in range(2):
+            assert cache.format_svgd_shortest(potrace_output, 2) == (
+                format_svgd_shortest(potrace_output, 2)
+            )
+            assert cache.format_svgd_absolute(potrace_output) == (
+                format_svgd_absolute(potrace_output)
+            )
+            assert cache.format_svgd_relative(potrace_output) == (
+                format_svgd_relative(potrace_output)
+            )
+            assert cache.get_cpts_from_svgd(potrace_output) == (
+                get_cpts_from_svgd(potrace_output)
+            )
+        info = cache.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (4, 4, 4)
+
+    def test_keyed_by_function_and_resolution(self) -> None:
+        """The same input with a different function or resolution is a miss."""
+        cache = SvgdCache()
+        _ = cache.format_svgd_shortest("M0.123 0L1 1", 1)
+        _ = cache.format_svgd_shortest("M0.123 0L1 1", 2)
+        _ = cache.format_svgd_absolute("M0.123 0L1 1", 1)
+        assert cache.cache_info().misses == 3
+
+    def test_buffer_and_str_share_results(self) -> None:
+        """Bytes input hashes the same as the equivalent str."""
+        cache = SvgdCache()
+        _ = cache.format_svgd_shortest("M0 0L1 1")
+        assert cache.format_svgd_shortest(b"M0 0L1 1") == "M0 0 1 1"
+        assert cache.cache_info().hits == 1
+
+    def test_cpts_are_copies(self) -> None:
+        """Mutating a returned cpts list does not change the cached value."""
+        cache = SvgdCache()
+        cpts = cache.get_cpts_from_svgd("M0 0L1 1")
+        cpts.clear()
+        assert cache.get_cpts_from_svgd("M0 0L1 1") == [[(0, 0), (1, 1)]]
+
+    def test_svgd_from_cpts(self) -> None:
+        """Cpts input from any iterable of floats is cached."""
+        cache = SvgdCache()
+        cpts = get_cpts_from_svgd(potrace_output)
+        expect = get_svgd_from_cpts(cpts)
+        assert cache.get_svgd_from_cpts(cpts) == expect
+        assert cache.get_svgd_from_cpts(iter(cpts)) == expect
+        assert cache.cache_info().hits == 1
+
+    def test_lru_eviction(self) -> None:
+        """The least recently used result is evicted first."""
+        cache = SvgdCache(maxsize=2)
+        _ = cache.format_svgd_shortest("M0 0L1 1")
+        _ = cache.format_svgd_shortest("M0 0L2 2")
+        _ = cache.format_svgd_shortest("M0 0L1 1")
+        _ = cache.format_svgd_shortest("M0 0L3 3")
+        _ = cache.format_svgd_shortest("M0 0L1 1")
+        _ = cache.format_svgd_shortest("M0 0L2 2")
+        info = cache.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 4, 2)
+
+    def test_clear(self) -> None:
+        """Clearing the cache resets results and statistics."""
+        cache = SvgdCache()
+        _ = cache.format_svgd_shortest("M0 0L1 1")
+        cache.cache_clear()
+        assert cache.cache_info() == (0, 0, 0, 0, 0)
+
+    def test_threads(self) -> None:
+        """Concurrent callers get correct results."""
+        cache = SvgdCache(maxsize=4)
+        svgds = [f"M0 0L{i} {i}" for i in range(8)]
+        errors: list[str] = []
+
+        def work() -> None:
+            for svgd in svgds * 4:
+                if cache.format_svgd_shortest(svgd) != format_svgd_shortest(svgd):
+                    errors.append(svgd)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+
+
+class TestDiskCache:
+    def test_persists_between_instances(self, tmp_path: Path) -> None:
+        """A second cache on the same file finds the first cache's results."""
+        path = tmp_path / "svgd.sqlite"
+        with SvgdCache(path=path) as cache:
+            expect = cache.format_svgd_shortest(potrace_output)
+        with SvgdCache(path=path) as cache:
+            assert cache.format_svgd_shortest(potrace_output) == expect
+            assert cache.format_svgd_shortest(potrace_output) == expect
+            info = cache.cache_info()
+            assert (info.hits, info.disk_hits, info.misses) == (1, 1, 0)
+
+    def test_size_eviction(self, tmp_path: Path) -> None:
+        """The disk tier stays under its size limit."""
+        with SvgdCache(
+            maxsize=1, path=tmp_path / "svgd.sqlite", max_disk_bytes=300
+        ) as cache:
+            for i in range(20):
+                _ = cache.format_svgd_absolute(f"M0 0L{i} {i}")
+            assert 0 < cache.cache_info().disk_bytes <= 300
+            _ = cache.format_svgd_absolute("M0 0L18 18")
+            assert cache.cache_info().disk_hits == 1
+            _ = cache.format_svgd_absolute("M0 0L0 0")
+            assert cache.cache_info().disk_hits == 1
+
+    def test_size_of_reopened_file(self, tmp_path: Path) -> None:
+        """Count results already on disk when the file is opened again."""
+        path = tmp_path / "svgd.sqlite"
+        with SvgdCache(maxsize=1, path=path) as cache:
+            for i in range(20):
+                _ = cache.format_svgd_absolute(f"M0 0L{i} {i}")
+            full_size = cache.cache_info().disk_bytes
+        with SvgdCache(maxsize=1, path=path, max_disk_bytes=300) as cache:
+            assert cache.cache_info().disk_bytes == full_size > 300
+            _ = cache.format_svgd_absolute("M0 0L20 20")
+            assert 0 < cache.cache_info().disk_bytes <= 300
+            for i in range(21, 40):
+                _ = cache.format_svgd_absolute(f"M0 0L{i} {i}")
+                assert 0 < cache.cache_info().disk_bytes <= 300
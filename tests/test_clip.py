@@ -0,0 +1,106 @@
+"""Test dropping and clipping subpaths outside a rectangle.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+import pytest
+from test_svg_data import potrace_output
+
+from svg_path_data.bezier import get_point
+from svg_path_data.clip import clip_to_rect
+from svg_path_data.svg_data import PathCommands, get_cpts_from_svgd
+
+
+class TestCull:
+    def test_drop_outside(self):
+        """Subpaths entirely outside the rect are dropped."""
+        result = clip_to_rect("M0 0H10V10H0ZM100 100H110", (-1, -1, 20, 20))
+        assert result.svgd == "M0 0H10V10H0Z"
+
+    def test_keep_straddling(self):
+        """Without clip, a subpath that crosses the rect is kept whole."""
+        svgd = "M-5 5H15V20"
+        assert clip_to_rect(svgd, (0, 0, 10, 10)).svgd == "M-5 5H15V20"
+
+    def test_margin(self):
+        """The margin grows the rect on every side."""
+        svgd = "M12 0V10"
+        assert clip_to_rect(svgd, (0, 0, 10, 10)).svgd == ""
+        assert clip_to_rect(svgd, (0, 0, 10, 10), 2).svgd == svgd
+
+    def test_control_points(self):
+        """A curve is kept when only its control points reach the rect."""
+        svgd = "M20 0Q5 5 20 10"
+        assert clip_to_rect(svgd, (0, 0, 10, 10)).svgd == svgd
+
+    def test_arc(self):
+        """An arc is kept when its bulge may reach the rect."""
+        svgd = "M0 0A5 5 0 0 1 10 0"
+        assert clip_to_rect(svgd, (0, -6, 10, 2)).svgd == "M0 0A5 5 0 0110 0"
+        assert clip_to_rect(svgd, (0, 20, 10, 2)).svgd == ""
+
+    @pytest.mark.parametrize("svgd", ["M0 5A0 0 0 0 1 10 5", "M0 5A0 5 0 0 1 10 5"])
+    def test_zero_radius_arc(self, svgd: str):
+        """An arc with a zero radius is a straight line between its endpoints."""
+        assert (
+            clip_to_rect(svgd, (2, 0, 6, 10)).svgd == PathCommands.from_svgd(svgd).svgd
+        )
+        assert clip_to_rect(svgd, (2, 6, 6, 10)).svgd == ""
+
+    def test_commands(self):
+        """Accept PathCommands."""
+        cmds = PathCommands.from_svgd(potrace_output)
+        rect = (0, 0, 200, 200)
+        assert clip_to_rect(cmds, rect).svgd == clip_to_rect(potrace_output, rect).svgd
+
+    def test_keep_all(self):
+        """A rect around the whole path keeps the whole path."""
+        result = clip_to_rect(potrace_output, (-1e6, -1e6, 2e6, 2e6), clip=True)
+        assert result.svgd == PathCommands.from_svgd(potrace_output).svgd
+
+    def test_empty(self):
+        """An empty path gives empty output."""
+        assert clip_to_rect("", (0, 0, 10, 10)).svgd == ""
+
+    def test_negative_size(self):
+        """Width and height cannot be negative."""
+        with pytest.raises(ValueError, match="negative"):
+            _ = clip_to_rect("M0 0H1", (0, 0, -1, 1))
+
+
+class TestClip:
+    def test_line(self):
+        """Lines are cut at the edges."""
+        result = clip_to_rect("M-5 5H15V20", (0, 0, 10, 10), clip=True)
+        assert result.svgd == "M0 5H10"
+
+    def test_reenter(self):
+        """A move is inserted where the path leaves and reenters the rect."""
+        result = clip_to_rect("M2 2V20H8V2", (0, 0, 10, 10), clip=True)
+        assert result.abs_svgd == "M2 2V10M8 10V2"
+
+    def test_lose_close(self):
+        """A closed subpath cut open is no longer closed."""
+        result = clip_to_rect("M2 2H20V8H2Z", (0, 0, 10, 10), clip=True)
+        assert result.abs_svgd == "M2 2H10M10 8H2V2"
+
+    def test_curve_on_edges(self):
+        """Pieces of a curve start and end exactly on the edges they cross."""
+        result = clip_to_rect("M-5 5C0 -10 10 20 15 5", (0, 0, 10, 10), clip=True)
+        cpts = get_cpts_from_svgd(result.abs_svgd)
+        assert len(cpts) == 1
+        assert cpts[0][0][0] == 0
+        assert cpts[0][-1][0] == 10
+
+    def test_pieces_inside(self):
+        """Every point of every clipped piece is inside the rect."""
+        rect = (50, 50, 100, 100)
+        result = clip_to_rect(potrace_output, rect, clip=True)
+        cpts = get_cpts_from_svgd(result.abs_svgd)
+        assert cpts
+        for curve in cpts:
+            for i in range(11):
+                x, y = get_point(curve, i / 10)
+                assert 50 - 1e-6 <= x <= 150 + 1e-6
+                assert 50 - 1e-6 <= y <= 150 + 1e-6
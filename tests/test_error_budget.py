@@ -0,0 +1,142 @@
+"""Test choosing a resolution from a pixel-error budget.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+# pyright: reportPrivateUsage = false
+
+import math
+
+import pytest
+from test_svg_data import potrace_output
+
+from svg_path_data.error_budget import (
+    ErrorBudget,
+    ResolutionChoice,
+    get_pixels_per_unit,
+    get_rounding_error,
+)
+from svg_path_data.svg_data import (
+    _get_distance_to_segment,
+    choose_resolution,
+    choose_resolution_for_cpts,
+    format_svgd_absolute,
+    format_svgd_relative,
+    format_svgd_shortest,
+    get_cpts_from_svgd,
+    get_svgd_from_cpts,
+)
+
+
+def _get_actual_error(svgd: str, resolution: int) -> float:
+    """Get how far any input control point is from the output control polygons.
+
+    :param svgd: an SVG path data string
+    :param resolution: the output resolution
+    :return: the largest distance from an input control point to the nearest
+        segment of an output control polygon
+    """
+    output = get_cpts_from_svgd(format_svgd_absolute(svgd, resolution))
+    segs = [s for c in output for s in zip(c, c[1:])]
+    return max(
+        min(_get_distance_to_segment(p, a, b) for a, b in segs)
+        for c in get_cpts_from_svgd(svgd)
+        for p in c
+    )
+
+
+class TestPixelsPerUnit:
+    def test_bounding_box(self):
+        """Without a viewBox, scale the larger side of the bounding box."""
+        budget = ErrorBudget(render_size=100)
+        assert get_pixels_per_unit(budget, [(0, 0), (50, 10), (-50, 0)]) == 1
+
+    def test_view_box(self):
+        """The viewBox replaces the bounding box."""
+        budget = ErrorBudget(render_size=100, view_box=(0, 0, 400, 200))
+        assert get_pixels_per_unit(budget, [(0, 0), (1, 1)]) == 0.25
+
+    def test_no_extent(self):
+        """A path with no size has no scale."""
+        assert get_pixels_per_unit(ErrorBudget(100), [(1, 1)]) == math.inf
+
+
+class TestRoundingError:
+    def test_rounding_error(self):
+        """Get the largest change to any value."""
+        assert get_rounding_error([1.25, 2.04], 1) == pytest.approx(0.05)
+
+    def test_stop_at_limit(self):
+        """Stop at the first value past the limit."""
+        assert get_rounding_error([1.1, 1.4, 1.2], 0, 0.3) == pytest.approx(0.4)
+
+
+class TestChooseResolution:
+    @pytest.mark.parametrize(
+        ("max_pixel_error", "expect"), [(0.5, 0), (0.1, 1), (0.01, 2)]
+    )
+    def test_smaller_budget_more_digits(self, max_pixel_error: float, expect: int):
+        """A smaller budget requires a higher resolution."""
+        budget = ErrorBudget(render_size=64, max_pixel_error=max_pixel_error)
+        choice = choose_resolution(potrace_output, budget)
+        assert choice.resolution == expect
+        assert choice.max_pixel_error <= max_pixel_error
+
+    def test_integers(self):
+        """Integer coordinates need no digits, however small the budget."""
+        budget = ErrorBudget(render_size=1000, max_pixel_error=1e-6)
+        choice = choose_resolution("M0 0L10 10Q20 0 30 10", budget)
+        assert choice == ResolutionChoice(0, 0.0, 0.0)
+
+    def test_larger_view_box_fewer_digits(self):
+        """The same path in a larger viewBox is rendered smaller."""
+        svgd = "M0.123 0L5.456 5"
+        small = choose_resolution(svgd, ErrorBudget(100, 0.5))
+        large = choose_resolution(svgd, ErrorBudget(100, 0.5, (0, 0, 500, 500)))
+        assert small.resolution == 2
+        assert large.resolution == 0
+
+    def test_nothing_fits(self):
+        """Return None when no resolution is within the budget."""
+        budget = ErrorBudget(render_size=1, max_pixel_error=1e-20)
+        assert choose_resolution("M0 0 1 .3333333333333333", budget).resolution is None
+
+    def test_straightened_curves_count(self):
+        """Count the error of straightening a curve, not only rounding."""
+        budget = ErrorBudget(render_size=20, max_pixel_error=0.5)
+        choice = choose_resolution("M0 0Q10 .4 20 0", budget)
+        assert choice.resolution == 1
+        assert format_svgd_absolute("M0 0Q10 .4 20 0", 0) == "M0 0H20"
+
+    @pytest.mark.parametrize("max_pixel_error", [0.5, 0.1, 0.02])
+    def test_measured_error_is_a_bound(self, max_pixel_error: float):
+        """No control point moves farther than the measured error."""
+        budget = ErrorBudget(render_size=64, max_pixel_error=max_pixel_error)
+        choice = choose_resolution(potrace_output, budget)
+        assert choice.resolution is not None
+        actual = _get_actual_error(potrace_output, choice.resolution)
+        assert actual <= choice.max_error * math.sqrt(2)
+
+    def test_cpts(self):
+        """Choose a resolution for control points."""
+        cpts = [[(0.123, 0), (20.456, 10)]]
+        choice = choose_resolution_for_cpts(cpts, ErrorBudget(24, 0.25))
+        assert choice.resolution == 1
+
+
+class TestFormatWithBudget:
+    @pytest.mark.parametrize(
+        "func", [format_svgd_absolute, format_svgd_relative, format_svgd_shortest]
+    )
+    def test_format(self, func):
+        """Format functions accept an ErrorBudget in place of a resolution."""
+        budget = ErrorBudget(render_size=64, max_pixel_error=0.1)
+        assert func(potrace_output, budget) == func(potrace_output, 1)
+
+    def test_svgd_from_cpts(self):
+        """get_svgd_from_cpts accepts an ErrorBudget and any iterable of cpts."""
+        cpts = [[(0.123, 0), (20.456, 10)]]
+        budget = ErrorBudget(24, 0.25)
+        result = get_svgd_from_cpts((iter(c) for c in cpts), budget)
+        assert result == "M.1 0 20.5 10"
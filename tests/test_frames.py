@@ -0,0 +1,167 @@
+"""Test storing animation frames as quantized deltas.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+import math
+import zlib
+
+import pytest
+from test_svg_data import potrace_output
+
+from svg_path_data.frames import FrameSequence
+from svg_path_data.svg_data import (
+    PathCommands,
+    RelativeOrAbsolute,
+    format_svgd_absolute,
+    get_cpts_from_svgd,
+    get_svgd_from_cpts,
+)
+
+
+def _get_morph(num_frames: int) -> list[str]:
+    """Get frames of the potrace sample as it sways.
+
+    :param num_frames: the number of frames
+    :return: an SVG path data string for each frame
+    """
+    cpts = get_cpts_from_svgd(potrace_output)
+    frames: list[str] = []
+    for i in range(num_frames):
+        lean = 0.1 * math.sin(i / num_frames * 2 * math.pi)
+        frames.append(
+            get_svgd_from_cpts([[(x + lean * y, y) for x, y in c] for c in cpts])
+        )
+    return frames
+
+
+class TestFrameSequence:
+    def test_round_trip(self):
+        """Each frame decodes to the same values."""
+        frames = FrameSequence.from_svgds(_get_morph(10), 2)
+        decoded = FrameSequence.decode(frames.encode())
+        assert decoded.template == frames.template
+        assert decoded.resolution == 2
+        assert decoded.frames == frames.frames
+
+    def test_quantized(self):
+        """Values are rounded to the resolution."""
+        frames = FrameSequence.from_svgds(["M0 0L1.234 5.678"], 1)
+        assert list(frames.frames[0]) == [0, 0, 12, 57]
+        assert frames.get_values(0) == [0, 0, 1.2, 5.7]
+        assert frames.get_svgd(0) == "M0 0 1.2 5.7"
+
+    def test_get_svgd(self):
+        """Regenerate any frame in any format."""
+        morph = _get_morph(5)
+        frames = FrameSequence.from_svgds(morph, 3)
+        for i, svgd in enumerate(morph):
+            result = frames.get_svgd(i, RelativeOrAbsolute.ABSOLUTE)
+            expect = format_svgd_absolute(svgd, 3)
+            result_vals = [v for c in get_cpts_from_svgd(result) for p in c for v in p]
+            expect_vals = [v for c in get_cpts_from_svgd(expect) for p in c for v in p]
+            assert result_vals == pytest.approx(expect_vals, abs=1.5e-3)
+
+    def test_deltas(self):
+        """Deltas are the first frame, then changes from frame to frame."""
+        frames = FrameSequence.from_svgds(["M0 0H10", "M0 0H12", "M1 0H12"], 0)
+        assert [list(x) for x in frames.get_deltas()] == [
+            [0, 0, 10, 0],
+            [0, 0, 2, 0],
+            [1, 0, 0, 0],
+        ]
+        rebuilt = FrameSequence.from_deltas("ML", 0, frames.get_deltas())
+        assert rebuilt.frames == frames.frames
+
+    def test_smaller_than_strings(self):
+        """Encoded frames are smaller than the shortest strings of each frame."""
+        morph = _get_morph(20)
+        frames = FrameSequence.from_svgds(morph, 2)
+        total = sum(len(frames.get_svgd(i)) for i in range(len(frames)))
+        assert len(frames.encode()) < total / 5
+
+    def test_elevate(self):
+        """A curve that is a line in some frames keeps its place in the template."""
+        svgds = ["M0 0C3 3 6 3 10 0", "M0 0L10 0", "M0 0Q5 5 10 0"]
+        frames = FrameSequence.from_svgds(svgds, 2)
+        assert frames.template == "MC"
+        assert [frames.get_svgd(i) for i in range(3)] == svgds[:1] + [
+            "M0 0H10",
+            "M0 0Q5 5 10 0",
+        ]
+
+    def test_collinear_frame(self):
+        """A frame where two lines are collinear keeps both lines."""
+        frames = FrameSequence.from_svgds(["M0 0L5 1L10 0", "M0 0L5 0L10 0"], 0)
+        assert frames.template == "MLL"
+        assert list(frames.frames[1]) == [0, 0, 5, 0, 10, 0]
+        assert frames.get_svgd(1) == "M0 0H10"
+
+    def test_zero_length_frame(self):
+        """A frame where a line has zero length keeps the line."""
+        svgds = ["M0 0L5 5L10 0Z", "M0 0L0 0L10 0Z"]
+        frames = FrameSequence.from_svgds(svgds, 0)
+        assert frames.template == "MLLZ"
+        assert [frames.get_svgd(i) for i in range(2)] == ["M0 0 5 5l5-5Z", "M0 0H10Z"]
+
+    def test_tween_from_flat_line(self):
+        """Every frame of a morph out of a flat line shares one structure."""
+        svgds = [f"M0 0L5 {i}L10 0L15 {-i}L20 0" for i in range(5)]
+        frames = FrameSequence.decode(FrameSequence.from_svgds(svgds, 0).encode())
+        assert frames.template == "MLLLL"
+        assert frames.get_svgd(0) == "M0 0H20"
+        assert frames.get_svgd(4) == "M0 0 5 4 15-4l5 4"
+
+    def test_relative_and_shorthand(self):
+        """Relative and shorthand commands are stored as absolute commands."""
+        svgds = ["m1 1h2v2q1 1 2 0t2 0z", "M1 1L3 1L3 3Q4 4 5 3Q6 2 7 3Z"]
+        frames = FrameSequence.from_svgds(svgds, 0)
+        assert frames.template == "MLLQQZ"
+        assert frames.frames[0] == frames.frames[1]
+
+    def test_arc(self):
+        """Arc values are stored like any other values."""
+        svgds = ["M0 0A5 5 0 0 1 10 0", "M0 0A6 5 30 1 1 10 0"]
+        frames = FrameSequence.decode(FrameSequence.from_svgds(svgds, 1).encode())
+        assert frames.get_svgd(1) == "M0 0A6 5 30 1110 0"
+
+    def test_commands(self):
+        """Accept PathCommands."""
+        cmds = [PathCommands.from_svgd(x) for x in _get_morph(3)]
+        assert FrameSequence.from_svgds(cmds, 2).frames == (
+            FrameSequence.from_svgds(_get_morph(3), 2).frames
+        )
+
+    def test_empty(self):
+        """Encode no frames."""
+        frames = FrameSequence.decode(FrameSequence.from_svgds([], 2).encode())
+        assert len(frames) == 0
+
+    def test_different_structure(self):
+        """Frames must have the same commands."""
+        with pytest.raises(ValueError, match="commands"):
+            _ = FrameSequence.from_svgds(["M0 0H10", "M0 0H10V10"], 2)
+        with pytest.raises(ValueError, match="different commands"):
+            _ = FrameSequence.from_svgds(["M0 0H10", "M0 0A1 1 0 0 1 10 0"], 2)
+
+    def test_bad_values(self):
+        """Each frame needs one value per template value."""
+        with pytest.raises(ValueError, match="values"):
+            _ = FrameSequence("ML", 2, [[0, 0, 1]])
+        with pytest.raises(ValueError, match="negative"):
+            _ = FrameSequence("ML", -1, [[0, 0, 1, 1]])
+
+    @pytest.mark.parametrize(
+        "data", [b"", b"SVGF\x01", b"SVGF\x01" + b"\x78\x9c\x00", b"PNG\x01"]
+    )
+    def test_bad_data(self, data: bytes):
+        """Raise a ValueError for data that is not encoded frames."""
+        with pytest.raises(ValueError, match="[Ee]ncoded|header"):
+            _ = FrameSequence.decode(data)
+
+    def test_truncated(self):
+        """Raise a ValueError for encoded frames that end early."""
+        body = zlib.decompress(FrameSequence.from_svgds(["M0 0H10"], 0).encode()[5:])
+        with pytest.raises(ValueError, match="end early"):
+            _ = FrameSequence.decode(b"SVGF\x01" + zlib.compress(body[:-1]))
@@ -0,0 +1,142 @@
+"""Test parsing path data pushed in chunks.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import TYPE_CHECKING
+
+import pytest
+from test_svg_data import potrace_output
+
+from svg_path_data import get_cpts_from_svgd
+from svg_path_data.incremental import aiter_cpts_from_svgd, aiter_path_commands
+from svg_path_data.svg_data import PathCommands, SvgdParser
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
+    from svg_path_data.svg_data import PathCommand
+
+
+def _describe(cmds: Iterable[PathCommand]) -> list[tuple[str, list[float]]]:
+    """Get the command letter and absolute values of each command.
+
+    :param cmds: path commands
+    :return: a comparable description of the commands
+    """
+    return [(x.cmd, list(x.abs_vals)) for x in cmds]
+
+
+def _split_randomly(svgd: str, seed: int) -> list[str]:
+    """Split a string into chunks of random length, some of them empty.
+
+    :param svgd: the string to split
+    :param seed: a random seed
+    :return: chunks that join to svgd
+    """
+    rng = random.Random(seed)
+    cuts = sorted(rng.randint(0, len(svgd)) for _ in range(len(svgd) // 4))
+    return [svgd[i:j] for i, j in zip([0, *cuts], [*cuts, len(svgd)])]
+
+
+def _parse_chunks(
+    chunks: Iterable[str | bytes], resolution: int | None = None
+) -> list[PathCommand]:
+    """Feed chunks to a parser and collect the commands.
+
+    :param chunks: parts of an svg path data string
+    :param resolution: optionally limit the resolution
+    :return: all commands released by the parser
+    """
+    parser = SvgdParser(resolution)
+    cmds: list[PathCommand] = []
+    for chunk in chunks:
+        cmds.extend(parser.feed(chunk))
+    cmds.extend(parser.close())
+    return cmds
+
+
+class TestSvgdParser:
+    @pytest.mark.parametrize("seed", range(10))
+    def test_random_chunks(self, seed: int) -> None:
+        """Commands split anywhere parse the same as the whole string."""
+        chunks = _split_randomly(potrace_output, seed)
+        expect = _describe(PathCommands.from_svgd(potrace_output, 2))
+        assert _describe(_parse_chunks(chunks, 2)) == expect
+
+    def test_one_char_at_a_time(self) -> None:
+        """Every boundary inside a number is handled."""
+        svgd = "M1.5e-3-2.25E+1l.5.5-1e1 0z m3 3h-.25"
+        expect = _describe(PathCommands.from_svgd(svgd))
+        assert _describe(_parse_chunks(svgd)) == expect
+
+    def test_bytes_split_inside_character(self) -> None:
+        """Bytes are decoded incrementally."""
+        data = "M0 0L1 1\u00a0L2 2".encode()
+        split = data.index(b"\xa0")
+        chunks = [data[:split], data[split:]]
+        assert _describe(_parse_chunks(chunks)) == _describe(
+            PathCommands.from_svgd("M0 0L1 1 L2 2")
+        )
+
+    def test_first_command_before_end(self) -> None:
+        """Commands are released before the rest of the path arrives."""
+        parser = SvgdParser()
+        assert parser.feed("M0 0L1 1") == []
+        assert [x.cmd for x in parser.feed("L2 3 ")] == ["M", "L"]
+
+    def test_invalid_content_raises_early(self) -> None:
+        """Invalid content raises when its chunk is fed."""
+        parser = SvgdParser()
+        _ = parser.feed("M0 0L1 1")
+        with pytest.raises(ValueError, match="Unrecognized content"):
+            _ = parser.feed(" x L2 2")
+
+    def test_bad_param_count_raises_on_close(self) -> None:
+        """A short final command is only known to be short on close."""
+        parser = SvgdParser()
+        _ = parser.feed("M0 0L1")
+        with pytest.raises(ValueError, match="takes"):
+            _ = parser.close()
+
+    def test_feed_after_close(self) -> None:
+        """A closed parser cannot take more data."""
+        parser = SvgdParser()
+        _ = parser.close()
+        assert parser.close() == []
+        with pytest.raises(ValueError, match="closed"):
+            _ = parser.feed("M0 0")
+
+
+async def _aiter_chunks(chunks: Iterable[str]) -> AsyncIterator[str]:
+    for chunk in chunks:
+        await asyncio.sleep(0)
+        yield chunk
+
+
+class TestAsync:
+    def test_async_iterable(self) -> None:
+        """Chunks from an async iterable parse the same as the whole string."""
+
+        async def collect() -> list[list[tuple[float, float]]]:
+            chunks = _split_randomly(potrace_output, 0)
+            return [x async for x in aiter_cpts_from_svgd(_aiter_chunks(chunks))]
+
+        assert asyncio.run(collect()) == get_cpts_from_svgd(potrace_output)
+
+    def test_stream_reader(self) -> None:
+        """A StreamReader is read in chunks until EOF."""
+
+        async def collect() -> list[PathCommand]:
+            reader = asyncio.StreamReader()
+            reader.feed_data(potrace_output.encode())
+            reader.feed_eof()
+            return [x async for x in aiter_path_commands(reader)]
+
+        expect = _describe(PathCommands.from_svgd(potrace_output))
+        assert _describe(asyncio.run(collect())) == expect
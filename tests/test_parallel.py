@@ -0,0 +1,146 @@
+"""Test converting subpaths in parallel.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+# pyright: reportPrivateUsage = false
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from test_svg_data import potrace_output
+
+from svg_path_data.parallel import (
+    format_svgd_many_threaded,
+    format_svgd_parallel,
+    split_svgd_subpaths,
+)
+from svg_path_data.svg_data import (
+    PathCommands,
+    RelativeOrAbsolute,
+    format_svgd_absolute,
+    format_svgd_relative,
+    format_svgd_shortest,
+    get_cpts_from_svgd,
+)
+
+_MANY_SUBPATHS = " ".join([potrace_output] * 4)
+
+_IS_FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def test_split_before_absolute_moves():
+    """Split only before absolute M commands."""
+    svgd = "m1 1 2 2ZL3 3M4 4m1 1ZM5 5"
+    assert split_svgd_subpaths(svgd) == ["m1 1 2 2ZL3 3", "M4 4m1 1Z", "M5 5"]
+
+
+@pytest.mark.parametrize("mode", list(RelativeOrAbsolute))
+def test_equivalent_to_serial(mode: RelativeOrAbsolute):
+    """Parallel output describes the same curves as serial output."""
+    serial = PathCommands.from_svgd(_MANY_SUBPATHS, resolution=2)._get_svgd(mode)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        result = format_svgd_parallel(
+            _MANY_SUBPATHS, 2, mode, executor=executor, max_workers=3
+        )
+    if mode != RelativeOrAbsolute.COMPRESSED:
+        assert result[0] == ("m" if mode == RelativeOrAbsolute.RELATIVE else "M")
+    assert get_cpts_from_svgd(result) == get_cpts_from_svgd(serial)
+    assert len(result) <= len(serial) + len(split_svgd_subpaths(_MANY_SUBPATHS))
+
+
+def test_absolute_matches_serial():
+    """Absolute output is the same as serial output."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = format_svgd_parallel(
+            _MANY_SUBPATHS,
+            relative_or_absolute=RelativeOrAbsolute.ABSOLUTE,
+            executor=executor,
+            max_workers=2,
+        )
+    assert result == format_svgd_absolute(_MANY_SUBPATHS)
+
+
+@pytest.mark.parametrize("mode", list(RelativeOrAbsolute))
+def test_redundant_moves(mode: RelativeOrAbsolute):
+    """Keep redundant moves where the serial result keeps them."""
+    svgd = "M0 0L1 1M5 5M6 6L7 7"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = format_svgd_parallel(svgd, None, mode, executor=executor)
+    assert format_svgd_absolute(result) == "M0 0 1 1M5 5M6 6 7 7"
+    if mode == RelativeOrAbsolute.ABSOLUTE:
+        assert result == format_svgd_absolute(svgd)
+
+
+def test_implicit_move_after_close():
+    """Keep the implicit move after Z with the subpath it continues."""
+    svgd = "M0 0H2V2ZL1 5M9 9h1M0 0 3 3Zl1-1"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = format_svgd_parallel(svgd, executor=executor, max_workers=2)
+    assert get_cpts_from_svgd(result) == get_cpts_from_svgd(svgd)
+
+
+def test_process_pool():
+    """Use a process pool by default."""
+    result = format_svgd_parallel(_MANY_SUBPATHS, 2, max_workers=2)
+    expect = format_svgd_shortest(_MANY_SUBPATHS, 2)
+    assert get_cpts_from_svgd(result) == get_cpts_from_svgd(expect)
+
+
+@pytest.mark.parametrize(
+    ("mode", "func"),
+    [
+        (RelativeOrAbsolute.SHORTEST, format_svgd_shortest),
+        (RelativeOrAbsolute.ABSOLUTE, format_svgd_absolute),
+        (RelativeOrAbsolute.RELATIVE, format_svgd_relative),
+    ],
+)
+def test_many_threaded_matches_serial(mode: RelativeOrAbsolute, func):
+    """Each threaded result is the same as the serial result, in order."""
+    svgds = split_svgd_subpaths(potrace_output) * 3
+    result = format_svgd_many_threaded(svgds, 2, mode, max_workers=4)
+    assert result == [func(x, 2) for x in svgds]
+
+
+def test_shared_instance_read_by_threads():
+    """Threads reading one instance at once all get the same strings."""
+    expect = PathCommands.from_svgd(potrace_output, 2)
+    expect_svgds = (expect.svgd, expect.rel_svgd, expect.abs_svgd)
+    cmds = PathCommands.from_svgd(potrace_output, 2)
+    barrier = threading.Barrier(4)
+    results: list[tuple[str, str, str]] = []
+
+    def read() -> None:
+        _ = barrier.wait()
+        results.append((cmds.svgd, cmds.rel_svgd, cmds.abs_svgd))
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [expect_svgds] * 4
+
+
+@pytest.mark.skipif(
+    not _IS_FREE_THREADED or (os.cpu_count() or 1) < 4,
+    reason="requires a free-threaded build and at least 4 cores",
+)
+def test_threads_scale_without_gil():
+    """Four threads are well over twice as fast as one without the GIL."""
+    svgds = [potrace_output] * 32
+
+    def best_time(max_workers: int) -> float:
+        times: list[float] = []
+        for _ in range(3):
+            start = time.perf_counter()
+            _ = format_svgd_many_threaded(svgds, 2, max_workers=max_workers)
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    assert best_time(1) / best_time(4) > 2.5
@@ -0,0 +1,151 @@
+"""Test converting polyline and polygon points attributes.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+import random
+
+import pytest
+
+from svg_path_data.points import (
+    format_points,
+    get_points_from_svgd,
+    get_svgd_from_points,
+    parse_points,
+)
+from svg_path_data.string_ops import join_numbers, split_numbers
+from svg_path_data.svg_data import format_svgd_absolute
+
+
+class TestSplitJoinNumbers:
+    def test_split_separators(self):
+        assert split_numbers(" 1,2\n3\t-4 ") == ["1", "2", "3", "-4"]
+
+    def test_split_elided(self):
+        assert split_numbers("1.5.5-2e-3.25") == ["1.5", ".5", "-2e-3", ".25"]
+
+    def test_split_empty(self):
+        assert split_numbers("") == []
+
+    def test_split_junk(self):
+        with pytest.raises(ValueError, match="Unexpected 'x'"):
+            _ = split_numbers("1 2 x 3")
+
+    def test_join_elides(self):
+        assert join_numbers(["1", "-2", ".5", ".5", "3", "1e-2", ".5"]) == (
+            "1-2 .5.5 3 1e-2.5"
+        )
+
+    def test_round_trip(self):
+        numbers = ["0", "1.5", ".5", "-.25", "2e+20", "-3", "4"]
+        assert split_numbers(join_numbers(numbers)) == numbers
+
+
+class TestFormatPoints:
+    def test_from_tuples(self):
+        assert format_points([(0, 0), (10.5, -2), (0.25, 0.5)]) == "0 0 10.5-2 .25.5"
+
+    def test_from_string(self):
+        assert format_points("0.000,0 10.50,-2.0 0.25,0.5") == "0 0 10.5-2 .25.5"
+
+    def test_resolution(self):
+        assert format_points([(1.234, 5.678)], 1) == "1.2 5.7"
+
+    def test_empty(self):
+        assert format_points([]) == ""
+        assert format_points("") == ""
+
+    def test_odd_count(self):
+        with pytest.raises(ValueError, match="even count"):
+            _ = format_points("1 2 3")
+
+    def test_matches_path_numbers(self):
+        """Format numbers exactly as path data formats them."""
+        rng = random.Random(49)
+        points = [(rng.uniform(-100, 100), rng.uniform(-100, 100)) for _ in range(50)]
+        svgd = "M" + " ".join(f"{x} {y}" for x, y in points)
+        expect = format_svgd_absolute(svgd, resolution=3)
+        assert "M" + format_points(points, 3) == expect
+
+
+class TestParsePoints:
+    def test_parse(self):
+        assert parse_points("0,0 10.5-2 .25.5") == [
+            (0.0, 0.0),
+            (10.5, -2.0),
+            (0.25, 0.5),
+        ]
+
+    def test_round_trip(self):
+        points = [(0.0, 1.5), (-2.25, 3e-5), (100.0, -0.5)]
+        assert parse_points(format_points(points)) == points
+
+    def test_odd_count(self):
+        with pytest.raises(ValueError, match="even count"):
+            _ = parse_points("1 2 3")
+
+    def test_junk(self):
+        with pytest.raises(ValueError, match="Invalid number list"):
+            _ = parse_points("1 2 L 3 4")
+
+
+class TestSvgdFromPoints:
+    def test_polyline(self):
+        assert get_svgd_from_points([(0, 0), (10, 0), (10, 10)]) == "M0 0 10 0 10 10"
+
+    def test_polygon(self):
+        svgd = get_svgd_from_points("0,0 10,0 10,10", closed=True)
+        assert svgd == "M0 0 10 0 10 10Z"
+
+    def test_empty(self):
+        assert get_svgd_from_points([], closed=True) == ""
+
+    def test_valid_path(self):
+        svgd = get_svgd_from_points("0,0 10,0 10,10", closed=True)
+        assert format_svgd_absolute(svgd) == "M0 0H10V10Z"
+
+
+class TestPointsFromSvgd:
+    def test_polyline(self):
+        assert get_points_from_svgd("M0 0L10 0 10 10") == ("0 0 10 0 10 10", False)
+
+    def test_polygon(self):
+        assert get_points_from_svgd("M0 0H10V10Z") == ("0 0 10 0 10 10", True)
+
+    def test_relative(self):
+        assert get_points_from_svgd("m1 1h9v9l-9 0z") == ("1 1 10 1 10 10 1 10", True)
+
+    def test_implicit_lines_after_move(self):
+        assert get_points_from_svgd("m1 1 2 2 3 3") == ("1 1 3 3 6 6", False)
+
+    def test_drop_repeated_start(self):
+        """Do not repeat the first point when a polygon returns to it."""
+        assert get_points_from_svgd("M0 0H10V10L0 0Z") == ("0 0 10 0 10 10", True)
+
+    def test_resolution(self):
+        assert get_points_from_svgd("M0.123 0L1.456 1", 1) == (".1 0 1.5 1", False)
+
+    def test_empty(self):
+        assert get_points_from_svgd("") == ("", False)
+
+    def test_round_trip(self):
+        points = "0 0 10 0 10 10 5 15"
+        svgd = get_svgd_from_points(points, closed=True)
+        assert get_points_from_svgd(svgd) == (points, True)
+
+    def test_curve(self):
+        with pytest.raises(ValueError, match="only lines"):
+            _ = get_points_from_svgd("M0 0Q5 5 10 0")
+
+    def test_arc(self):
+        with pytest.raises(ValueError, match="only lines"):
+            _ = get_points_from_svgd("M0 0A5 5 0 0 1 10 0")
+
+    def test_two_subpaths(self):
+        with pytest.raises(ValueError, match="one subpath"):
+            _ = get_points_from_svgd("M0 0H10M20 20H30")
+
+    def test_after_close(self):
+        with pytest.raises(ValueError, match="one subpath"):
+            _ = get_points_from_svgd("M0 0H10V10ZL5 5")
@@ -0,0 +1,181 @@
+"""Test flattening paths to polylines.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+import math
+
+import pytest
+from test_svg_data import potrace_output
+
+from svg_path_data.bezier import get_point
+from svg_path_data.polyline import (
+    flatten,
+    get_bezier_steps,
+    iter_arc_points,
+)
+from svg_path_data.svg_data import PathCommands, get_cpts_from_svgd
+
+
+def _get_distance_to_polyline(
+    point: tuple[float, float], polyline: list[tuple[float, float]]
+) -> float:
+    """Get the distance from a point to the nearest segment of a polyline.
+
+    :param point: the point to measure from
+    :param polyline: the points of a polyline
+    :return: the distance to the nearest segment
+    """
+    px, py = point
+    best = math.inf
+    for (ax, ay), (bx, by) in zip(polyline, polyline[1:]):
+        vx, vy = bx - ax, by - ay
+        length_sq = vx * vx + vy * vy
+        time = 0.0
+        if length_sq:
+            time = min(max(((px - ax) * vx + (py - ay) * vy) / length_sq, 0), 1)
+        best = min(best, math.hypot(ax + vx * time - px, ay + vy * time - py))
+    return best
+
+
+def _get_points(coords, start: int, stop: int) -> list[tuple[float, float]]:
+    """Get points start to stop from a flat coordinate buffer.
+
+    :param coords: [x0, y0, x1, y1, ...]
+    :param start: the index of the first point
+    :param stop: the index after the last point
+    :return: a list of xy tuples
+    """
+    return [(coords[i], coords[i + 1]) for i in range(start * 2, stop * 2, 2)]
+
+
+class TestFlatten:
+    def test_lines(self):
+        """Lines are copied without new points."""
+        result = flatten("M0 0H10V10Z", 1)
+        assert list(result.coords) == [0, 0, 10, 0, 10, 10, 0, 0]
+        assert list(result.offsets) == [0, 4]
+        assert list(result.closed) == [1]
+
+    def test_closed_without_z(self):
+        """A subpath that ends at its first point is closed without a z."""
+        result = flatten("M0 0Q5 5 10 0T0 0M20 0H30", 1)
+        assert list(result.closed) == [1, 0]
+
+    def test_subpaths(self):
+        """Each subpath starts at an offset."""
+        result = flatten("M0 0L1 1M5 5L6 6L7 5", 1)
+        assert list(result.offsets) == [0, 2, 5]
+        assert list(result.closed) == [0, 0]
+
+    def test_drop_lone_moves(self):
+        """A subpath with only a move command has no segments."""
+        result = flatten("M9 9M0 0L1 1M5 5", 1)
+        assert list(result.coords) == [0, 0, 1, 1]
+        assert list(result.offsets) == [0, 2]
+
+    def test_empty(self):
+        """An empty path has one offset and no points."""
+        result = flatten("", 1)
+        assert list(result.coords) == []
+        assert list(result.offsets) == [0]
+
+    def test_commands(self):
+        """Accept PathCommands."""
+        cmds = PathCommands.from_svgd(potrace_output)
+        assert flatten(cmds, 0.5) == flatten(potrace_output, 0.5)
+
+    @pytest.mark.parametrize("tolerance", [1, 0.1, 0.01])
+    def test_within_tolerance(self, tolerance: float):
+        """Every point of every curve is within tolerance of the polylines."""
+        result = flatten(potrace_output, tolerance)
+        polylines = [
+            _get_points(result.coords, a, b)
+            for a, b in zip(result.offsets, result.offsets[1:])
+        ]
+        points = [(x, y) for p in polylines for x, y in p]
+        for cpts in get_cpts_from_svgd(potrace_output):
+            nearest = min(
+                range(len(polylines)),
+                key=lambda i: _get_distance_to_polyline(cpts[0], polylines[i]),
+            )
+            for time in (i / 50 for i in range(51)):
+                point = get_point(cpts, time)
+                dist = _get_distance_to_polyline(point, polylines[nearest])
+                assert dist <= tolerance * (1 + 1e-9)
+        assert len(points) == result.offsets[-1]
+
+    def test_smaller_tolerance_more_points(self):
+        """A smaller tolerance gives more points."""
+        coarse = flatten(potrace_output, 1)
+        fine = flatten(potrace_output, 0.01)
+        assert coarse.offsets[-1] < fine.offsets[-1]
+
+    @pytest.mark.parametrize("tolerance", [0, -1])
+    def test_bad_tolerance(self, tolerance: float):
+        """Tolerance must be positive."""
+        with pytest.raises(ValueError, match="positive"):
+            _ = flatten("M0 0L1 1", tolerance)
+
+
+class TestBezierSteps:
+    def test_line(self):
+        """A line is one step."""
+        assert get_bezier_steps([(0, 0), (5, 5)], 0.1) == 1
+
+    def test_straight_curve(self):
+        """A curve with collinear, evenly spaced control points is one step."""
+        assert get_bezier_steps([(0, 0), (1, 1), (2, 2), (3, 3)], 0.1) == 1
+
+    def test_quadratic(self):
+        """Wang's formula is exact for a quadratic."""
+        # the curve is 2 from its chord, so the bound is 2 / n**2
+        assert get_bezier_steps([(0, 0), (4, 4), (8, 0)], 2) == 1
+        assert get_bezier_steps([(0, 0), (4, 4), (8, 0)], 0.5) == 2
+        assert get_bezier_steps([(0, 0), (4, 4), (8, 0)], 0.49) == 3
+
+
+class TestArcs:
+    @pytest.mark.parametrize("tolerance", [1, 0.1, 0.001])
+    @pytest.mark.parametrize(("large_arc", "sweep"), [(0, 0), (0, 1), (1, 0), (1, 1)])
+    def test_on_circle(self, tolerance: float, large_arc: int, sweep: int):
+        """Points are on the circle and segments within tolerance."""
+        arc = (10, 10, 0, large_arc, sweep, 10, 10)
+        points = list(iter_arc_points((0, 0), arc, tolerance))
+        assert points[-1] == (10, 10)
+        center = (0, 10) if bool(large_arc) != bool(sweep) else (10, 0)
+        for x, y in points:
+            assert math.hypot(x - center[0], y - center[1]) == pytest.approx(10)
+        for (ax, ay), (bx, by) in zip([(0, 0), *points], points):
+            mid = math.hypot((ax + bx) / 2 - center[0], (ay + by) / 2 - center[1])
+            assert 10 - mid <= tolerance * (1 + 1e-9)
+        expect_large = 3 * math.pi / 2 if large_arc else math.pi / 2
+        assert len(points) == math.ceil(
+            expect_large / (2 * math.acos(1 - tolerance / 10))
+        )
+
+    def test_scale_small_radii(self):
+        """Radii too small to reach the end are scaled up to a half ellipse."""
+        points = list(iter_arc_points((0, 0), (1, 1, 0, 0, 1, 10, 0), 0.01))
+        for x, y in points:
+            assert math.hypot(x - 5, y) == pytest.approx(5)
+        assert all(y <= 1e-9 for _, y in points)
+
+    def test_rotated_ellipse(self):
+        """Points are on a rotated ellipse."""
+        points = list(iter_arc_points((0, 0), (20, 10, 90, 0, 1, 0, 40), 0.01))
+        for x, y in points:
+            assert (x / 10) ** 2 + ((y - 20) / 20) ** 2 == pytest.approx(1)
+
+    def test_zero_radius(self):
+        """An arc with a zero radius is a line."""
+        assert list(iter_arc_points((0, 0), (0, 5, 0, 0, 1, 3, 4), 0.1)) == [(3, 4)]
+
+    def test_flatten_arc(self):
+        """Flatten an arc command in a path."""
+        result = flatten("M0 0A5 5 0 0 1 10 0", 0.01)
+        points = _get_points(result.coords, 0, result.offsets[-1])
+        assert points[0] == (0, 0)
+        assert points[-1] == (10, 0)
+        assert all(math.hypot(x - 5, y) == pytest.approx(5) for x, y in points)
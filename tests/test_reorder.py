@@ -0,0 +1,134 @@
+"""Test reordering subpaths to shorten pen-up travel.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+import random
+
+import pytest
+from test_svg_data import potrace_output
+
+from svg_path_data.reorder import (
+    get_travel_distance,
+    reorder_subpaths,
+    reorder_svgd,
+)
+from svg_path_data.spatial import SegmentIndex
+from svg_path_data.svg_data import iter_subpaths
+
+
+def _get_random_strokes(count: int, seed: int) -> list[list[list[tuple[float, float]]]]:
+    """Get open subpaths of one line each, scattered over a square.
+
+    :param count: the number of subpaths
+    :param seed: a random seed
+    :return: a list of subpaths
+    """
+    rng = random.Random(seed)
+    strokes: list[list[list[tuple[float, float]]]] = []
+    for _ in range(count):
+        x, y = rng.uniform(0, 1000), rng.uniform(0, 1000)
+        strokes.append([[(x, y), (x + rng.uniform(-9, 9), y + rng.uniform(-9, 9))]])
+    return strokes
+
+
+def _reverse(
+    subpath: list[list[tuple[float, float]]],
+) -> list[list[tuple[float, float]]]:
+    """Draw a subpath backward.
+
+    :param subpath: a list of curves
+    :return: the curves in reverse order, each reversed
+    """
+    return [c[::-1] for c in reversed(subpath)]
+
+
+class TestReorderSubpaths:
+    def test_empty(self):
+        """Return an empty list for no subpaths."""
+        assert reorder_subpaths([]) == []
+
+    @pytest.mark.parametrize("fill_rule", ["nonzero", "evenodd", None])
+    def test_shorter(self, fill_rule):
+        """Travel is much shorter than a random order."""
+        strokes = _get_random_strokes(500, 0)
+        result = reorder_subpaths(strokes, fill_rule)
+        assert get_travel_distance(result) < get_travel_distance(strokes) / 5
+
+    def test_reversing_is_shorter(self):
+        """Reversing open subpaths shortens travel further."""
+        strokes = _get_random_strokes(500, 1)
+        directed = get_travel_distance(reorder_subpaths(strokes, "nonzero"))
+        undirected = get_travel_distance(reorder_subpaths(strokes, None))
+        assert undirected < directed
+
+    def test_nonzero_keeps_direction(self):
+        """Subpaths of a nonzero fill are never reversed."""
+        strokes = _get_random_strokes(200, 2)
+        result = reorder_subpaths(strokes, "nonzero")
+        assert sorted(result) == sorted(strokes)
+
+    @pytest.mark.parametrize("fill_rule", ["evenodd", None])
+    def test_same_subpaths(self, fill_rule):
+        """Each subpath is drawn once, forward or backward."""
+        strokes = _get_random_strokes(200, 3)
+        result = reorder_subpaths(strokes, fill_rule)
+        assert len(result) == len(strokes)
+        for subpath in result:
+            assert subpath in strokes or _reverse(subpath) in strokes
+
+    def test_chain(self):
+        """Chain subpaths that meet end to end."""
+        subpaths = [
+            [[(2, 0), (3, 0)]],
+            [[(0, 0), (1, 0)]],
+            [[(2, 0), (1, 0)]],
+        ]
+        result = reorder_subpaths(subpaths, None)
+        assert get_travel_distance(result) == 0
+
+    def test_start(self):
+        """Start from the pen position."""
+        subpaths = [[[(0, 0), (1, 0)]], [[(9, 0), (10, 0)]]]
+        result = reorder_subpaths(subpaths, "nonzero", start=(10, 0))
+        assert result[0] == [[(9, 0), (10, 0)]]
+
+    def test_never_longer(self):
+        """Keep the input order if it is already shorter."""
+        subpaths = list(iter_subpaths(potrace_output))
+        result = reorder_subpaths(subpaths)
+        assert get_travel_distance(result) <= get_travel_distance(subpaths)
+
+    def test_bad_fill_rule(self):
+        """Raise a ValueError for an unknown fill rule."""
+        with pytest.raises(ValueError, match="fill rule"):
+            _ = reorder_subpaths([], "winding")  # type: ignore[arg-type]
+
+
+class TestReorderSvgd:
+    def test_join_unfilled(self):
+        """Drop move commands between subpaths that meet in an unfilled path."""
+        assert reorder_svgd("M9 0H10M1 0H2M0 0H1", None) == "M0 0H2M9 0h1"
+
+    def test_keep_moves_after_open_filled(self):
+        """Keep move commands after open subpaths of a filled path."""
+        assert reorder_svgd("M9 0H10M1 0H2M0 0H1") == "M0 0H1M1 0H2M9 0h1"
+
+    def test_closed(self):
+        """Reorder closed subpaths."""
+        result = reorder_svgd("M5 5H6V6ZM0 0H1V1ZM0 0H-1V-1Z")
+        assert result == "M0 0H1V1ZM0 0H-1V-1ZM5 5H6V6Z"
+
+    @pytest.mark.parametrize("fill_rule", ["nonzero", "evenodd"])
+    def test_fill_unchanged(self, fill_rule):
+        """Every point is filled before reordering if and only if after."""
+        svgd = "M0 0H10V10H0ZM2 2V8H8V2ZM20 0H30V10H20ZM22 2H28V8H22Z"
+        result = reorder_svgd(svgd, fill_rule)
+        before, after = SegmentIndex.from_svgd(svgd), SegmentIndex.from_svgd(result)
+        for x in range(-1, 32):
+            for y in range(-1, 12):
+                point = (x + 0.5, y + 0.5)
+                assert before.contains(point, fill_rule) == after.contains(
+                    point, fill_rule
+                )
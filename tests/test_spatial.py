@@ -0,0 +1,148 @@
+"""Test the spatial index over path segments.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+import random
+
+import pytest
+from test_svg_data import potrace_output
+
+from svg_path_data.bezier import get_bbox, get_nearest_time, get_winding_crossings
+from svg_path_data.spatial import SegmentIndex
+from svg_path_data.svg_data import PathCommands, get_cpts_from_svgd, iter_subpaths
+
+_SUBPATHS = list(iter_subpaths(potrace_output))
+_SEGMENTS = [c for s in _SUBPATHS for c in s]
+_CLOSERS = [[s[-1][-1], s[0][0]] for s in _SUBPATHS]
+
+
+def _random_points(count: int) -> list[tuple[float, float]]:
+    """Get random points around the potrace sample.
+
+    :param count: the number of points
+    :return: random points in and around the bounding box of the sample
+    """
+    rng = random.Random(41)
+    return [(rng.uniform(-20, 380), rng.uniform(-20, 260)) for _ in range(count)]
+
+
+@pytest.fixture(scope="module")
+def index() -> SegmentIndex:
+    """Index the potrace sample.
+
+    :return: a segment index
+    """
+    return SegmentIndex(_SUBPATHS)
+
+
+class TestBuild:
+    def test_segments_in_path_order(self, index: SegmentIndex):
+        """Segments are numbered as in get_cpts_from_svgd."""
+        assert len(index) == len(get_cpts_from_svgd(potrace_output))
+        assert [index.get_segment(i) for i in range(len(index))] == _SEGMENTS
+
+    def test_from_commands(self, index: SegmentIndex):
+        """Index a PathCommands instance."""
+        other = SegmentIndex.from_commands(PathCommands.from_svgd(potrace_output))
+        assert other.get_segments_in_rect(0, 0, 50, 50) == index.get_segments_in_rect(
+            0, 0, 50, 50
+        )
+
+    def test_empty(self):
+        """An empty path has no segments."""
+        index = SegmentIndex.from_svgd("")
+        assert len(index) == 0
+        assert index.get_nearest_segment((0, 0)) is None
+        assert not index.contains((0, 0))
+
+    def test_arcs_raise(self):
+        """Arc commands have no Bezier control points."""
+        with pytest.raises(ValueError, match="Arc commands"):
+            _ = SegmentIndex.from_svgd("M0 0A1 1 0 0 1 2 2")
+
+
+class TestQueries:
+    @pytest.mark.parametrize("point", _random_points(40))
+    def test_nearest(self, index: SegmentIndex, point: tuple[float, float]):
+        """The nearest segment is the same as found by a linear scan."""
+        result = index.get_nearest_segment(point)
+        assert result is not None
+        expect = min(get_nearest_time(c, point)[1] for c in _SEGMENTS)
+        assert result.distance == pytest.approx(expect)
+
+    def test_nearest_max_distance(self, index: SegmentIndex):
+        """Nothing is nearer than max_distance far from the path."""
+        assert index.get_nearest_segment((1000, 1000), max_distance=10) is None
+
+    @pytest.mark.parametrize("point", _random_points(20))
+    def test_rect(self, index: SegmentIndex, point: tuple[float, float]):
+        """Rectangle queries match a linear scan of bounding boxes."""
+        x, y = point
+        rect = (x, y, x + 30, y + 15)
+        expect = [
+            i
+            for i, c in enumerate(_SEGMENTS)
+            if (b := get_bbox(c))[0] <= rect[2]
+            and rect[0] <= b[2]
+            and b[1] <= rect[3]
+            and rect[1] <= b[3]
+        ]
+        assert index.get_segments_in_rect(*rect) == expect
+
+    def test_winding(self, index: SegmentIndex):
+        """Winding numbers match a linear scan of every closed subpath."""
+        for point in _random_points(100):
+            expect = sum(get_winding_crossings(c, point) for c in _SEGMENTS + _CLOSERS)
+            assert index.get_winding_number(point) == expect
+
+    def test_fill_rules(self):
+        """A hole in the same direction is filled only by the nonzero rule."""
+        index = SegmentIndex.from_svgd("M0 0H10V10H0ZM3 3H7V7H3Z")
+        assert index.contains((5, 5), "nonzero")
+        assert not index.contains((5, 5), "evenodd")
+        assert index.contains((1, 5), "evenodd")
+        assert not index.contains((11, 5))
+
+    def test_open_subpath_is_closed(self):
+        """An open subpath is filled as if closed."""
+        index = SegmentIndex.from_svgd("M0 0Q5 10 10 0")
+        assert index.contains((5, 2))
+
+    def test_unknown_fill_rule(self, index: SegmentIndex):
+        """Only nonzero and evenodd are fill rules."""
+        with pytest.raises(ValueError, match="fill rule"):
+            _ = index.contains((0, 0), "inherit")  # pyright: ignore[reportArgumentType]
+
+
+class TestUpdate:
+    def test_update_segment(self):
+        """Move one segment without rebuilding the grid."""
+        index = SegmentIndex.from_svgd("M0 0H10V10H0Z")
+        index.update_segment(1, [(10, 0), (30, 20)])
+        index.update_segment(2, [(30, 20), (0, 10)])
+        assert index.get_nearest_segment((30, 21)).segment == 1  # pyright: ignore
+        assert index.get_segments_in_rect(25, 15, 35, 25) == [1, 2]
+        assert index.contains((15, 10))
+
+    def test_update_matches_rebuild(self):
+        """An updated index answers like a new index of the same segments."""
+        subpaths = [[list(c) for c in s] for s in _SUBPATHS]
+        index = SegmentIndex(subpaths)
+        rng = random.Random(0)
+        i = 0
+        for subpath in subpaths:
+            for curve in subpath:
+                if rng.random() < 0.2:
+                    curve[1:-1] = [(x + 40, y - 40) for x, y in curve[1:-1]]
+                    index.update_segment(i, curve)
+                i += 1
+        fresh = SegmentIndex(subpaths)
+        for point in _random_points(30):
+            assert index.get_winding_number(point) == fresh.get_winding_number(point)
+            nearest = index.get_nearest_segment(point)
+            expect = fresh.get_nearest_segment(point)
+            assert nearest is not None
+            assert expect is not None
+            assert nearest.distance == pytest.approx(expect.distance)
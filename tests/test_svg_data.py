@@ -6,20 +6,50 @@
 
 # pyright: reportPrivateUsage = false
 
+import copy as copy_module
+import gc
+import io
+import mmap
+import pickle
+import weakref
+import zlib
+from collections.abc import Callable
+from pathlib import Path
 from typing import TypeVar
 
 import pytest
 from paragraphs import par
 
-from svg_path_data.string_ops import svgd_join, svgd_split
+from benchmarks.compressed_size import get_corpus
+from svg_path_data import svg_data
+from svg_path_data.float_string_conversion import format_number
+from svg_path_data.string_ops import (
+    SvgdCommandSplitter,
+    concat_svgd,
+    get_smallest_compressed,
+    is_valid_svgd,
+    iter_svgd_commands,
+    svgd_join,
+    svgd_split,
+    svgd_split_buffer,
+    validate_svgd,
+)
 from svg_path_data.svg_data import (
     PathCommand,
     PathCommands,
+    RelativeOrAbsolute,
+    SvgdParser,
+    convert,
     format_svgd_absolute,
+    format_svgd_compressed,
     format_svgd_relative,
+    format_svgd_resolutions,
     format_svgd_shortest,
     get_cpts_from_svgd,
     get_svgd_from_cpts,
+    iter_cpts_from_svgd,
+    iter_subpaths,
+    write_svgd,
 )
 
 _T = TypeVar("_T")
@@ -98,6 +128,45 @@ def test_exponential_notation():
     assert svgd_split("M1e-2 2E3 3.4e+5-1") == ["M", "1e-2", "2E3", "3.4e+5", "-1"]
 
 
+class TestMinimalSeparators:
+    """Drop every separator the SVG path grammar does not need."""
+
+    @pytest.mark.parametrize(
+        ("parts", "expect"),
+        [
+            (("M", "1.5", ".5"), "M1.5.5"),
+            (("M", "15", ".5"), "M15 .5"),
+            (("M", "1e-2", ".5", "-.5", "1"), "M1e-2.5-.5 1"),
+            (("A", "1", "1", "0", "1", "1", "4", "5"), "A1 1 0 114 5"),
+            (("A", "1", "1", "0", "1", "0", ".5", "5"), "A1 1 0 10.5 5"),
+            (("A", "3", "4", "5", "6", "7", "9", "11"), "A3 4 5 6 7 9 11"),
+        ],
+    )
+    def test_svgd_join(self, parts: tuple[str, ...], expect: str):
+        """Join numbers after a decimal point or arc flag without a space."""
+        assert svgd_join(*parts) == expect
+        assert svgd_split("M0 0" + expect)[3:] == list(parts)
+
+    def test_joined_commands(self):
+        """Drop a space before a point between implicitly repeated commands."""
+        svgd = "M0 0 1 1.5.5 2"
+        assert format_svgd_absolute(svgd) == svgd
+
+    @pytest.mark.parametrize(
+        "svgd", ["M0 0a1 1 0 11.5.5 1 1 0 00-3 4", "M0 0A1 1 0 1 1 .5 .5"]
+    )
+    def test_packed_arc_flags(self, svgd: str):
+        """Read each arc flag as one character in every parser."""
+        expect = ["a", "1", "1", "0", "1", "1", ".5", ".5"]
+        assert [x.lower() for x in svgd_split(svgd)[3:11]] == expect
+        commands = list(iter_svgd_commands(svgd))
+        assert commands[1][1] == [1, 1, 0, 1, 1, 0.5, 0.5]
+        assert list(iter_svgd_commands(svgd.encode())) == commands
+        splitter = SvgdCommandSplitter()
+        groups = [g for c in svgd for g in splitter.feed(c)]
+        assert [*groups, *splitter.close()] == commands
+
+
 class TestNonAdjacentCurveShorthand:
     """Test that non-adjacent curves get shorthand for equal first two points."""
 
@@ -125,7 +194,7 @@ class TestCloseCurve:
             ((0.5, 2.5), (0.0, 2.0), (0.0, 1.0), (0.5, 0.5)),
         )
         svgd = get_svgd_from_cpts(cpts)
-        assert svgd == "M.5 .5C1 0 2 0 2.5 .5s.5 1.5 0 2S1 3 .5 2.5 0 1 .5 .5Z"
+        assert svgd == "M.5.5C1 0 2 0 2.5.5s.5 1.5 0 2-1.5.5-2 0S0 1 .5.5Z"
 
     def test_mid_curve(self):
         """Explicitly close anywhere a curve ends at the the start of a path."""
@@ -136,7 +205,7 @@ class TestCloseCurve:
             ((0.5, 0.5), (1.0, 0.0), (2.0, 0.0), (2.5, 0.5)),
         )
         svgd = get_svgd_from_cpts(cpts)
-        assert svgd == "M.5 .5C1 0 2 0 2.5 .5s.5 1.5 0 2S1 3 .5 .5Zm0 0C1 0 2 0 2.5 .5"
+        assert svgd == "M.5.5C1 0 2 0 2.5.5s.5 1.5 0 2S1 3 .5.5Zm0 0C1 0 2 0 2.5.5"
 
 
 def test_consecutive_l_at_start():
@@ -155,12 +224,12 @@ class TestResolution:
             [(1 / 3, 2 / 3), (3 / 3, 4 / 3)],
             [(3 / 3, 4 / 3 + 1 / 1000), (5 / 3, 4 / 3 + 2 / 10000)],
         ]
-        assert_svgd_equal(get_svgd_from_cpts(cpts, resolution=2), "M.33 .67 1 1.33h.67")
+        assert_svgd_equal(get_svgd_from_cpts(cpts, resolution=2), "M.33.67 1 1.33h.67")
 
     def test_resolution_from_svgd(self):
         svgd = "M.333333 .67L1 1.33H1.67"
         cmds = PathCommands.from_svgd(svgd, resolution=2)
-        assert_svgd_equal(cmds.abs_svgd, "M.33 .67 1 1.33H1.67")
+        assert_svgd_equal(cmds.abs_svgd, "M.33.67 1 1.33H1.67")
 
 
 class TestBreakCommand:
@@ -300,6 +369,186 @@ class TestValidateSvgd:
             _ = PathCommands.from_svgd(svgd)
         assert "Unrecognized content 'b' in input" in str(excinfo.value)
 
+    @pytest.mark.parametrize(
+        ("svgd", "match"),
+        [
+            ("M0 0L1 1Z1 1", "Command Z takes 0"),
+            ("L1 1", "must start with a move"),
+            ("M0 0L1", "Command L takes"),
+            ("M0 0L1 1b", "Unrecognized content 'b'"),
+            ("M0 0A1 1 0 112", "Command A takes"),
+        ],
+    )
+    def test_validate_without_parsing(self, svgd: str, match: str):
+        """Raise the same errors without building commands."""
+        with pytest.raises(ValueError, match=match):
+            validate_svgd(svgd)
+        with pytest.raises(ValueError, match=match):
+            validate_svgd(svgd.encode())
+        assert not is_valid_svgd(svgd)
+
+    @pytest.mark.parametrize("svgd", [potrace_output, "M0 0A1 1 0 114 5z", ""])
+    def test_valid(self, svgd: str):
+        """Accept valid path data."""
+        validate_svgd(svgd)
+        assert is_valid_svgd(svgd)
+        assert is_valid_svgd(svgd.encode())
+
+
+class TestSkipValidation:
+    """Trusted input can skip validation."""
+
+    @pytest.mark.parametrize(
+        "svgd",
+        [
+            potrace_output,
+            "M0 0L1.5.5-2e3 4A1 1 0 114 5Z",
+            "m1 1 2 2zl3 3M4 4h1v1",
+            "",
+        ],
+    )
+    def test_split_matches(self, svgd: str):
+        """The fast tokenizer gives the same parts for valid input."""
+        assert svgd_split(svgd, validate=False) == svgd_split(svgd)
+        buffer = svgd.encode()
+        assert svgd_split_buffer(buffer, validate=False) == svgd_split_buffer(buffer)
+
+    @pytest.mark.parametrize(
+        "func",
+        [
+            format_svgd_absolute,
+            format_svgd_relative,
+            format_svgd_shortest,
+            format_svgd_compressed,
+            get_cpts_from_svgd,
+        ],
+    )
+    def test_same_output(self, func):
+        """Valid input gives the same output with or without validation."""
+        for svgd in (potrace_output, potrace_output.encode()):
+            assert func(svgd, 2, validate=False) == func(svgd, 2)
+
+    def test_junk_is_not_checked(self):
+        """Content that is not a command or number is not found."""
+        assert svgd_split("M0 0Lx1 1", validate=False) == ["M", "0", "0", "L", "1", "1"]
+
+
+class TestBufferInput:
+    """Parse bytes-like svg path data without converting it to a str."""
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_buffer_matches_str(self, wrap: type):
+        """Buffer input gives the same result as str input."""
+        buffer = wrap(potrace_output.encode())
+        assert format_svgd_shortest(buffer) == format_svgd_shortest(potrace_output)
+        assert get_cpts_from_svgd(buffer) == get_cpts_from_svgd(potrace_output)
+
+    def test_mmap(self, tmp_path: Path):
+        """Parse an mmap in place."""
+        path = tmp_path / "path.txt"
+        _ = path.write_bytes(potrace_output.encode())
+        with (
+            path.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m,
+        ):
+            result = format_svgd_relative(m, resolution=2)
+        assert result == format_svgd_relative(potrace_output, resolution=2)
+
+    def test_split_buffer(self):
+        """Make implicit commands explicit and store floats in one buffer."""
+        cmds, vals = svgd_split_buffer(b"m1 2 3 4L5-6zh.5e1")
+        assert cmds == "mlLzh"
+        assert list(vals) == [1, 2, 3, 4, 5, -6, 5]
+
+    def test_empty(self):
+        """An empty buffer results in an empty list of cpts."""
+        assert get_cpts_from_svgd(b"") == []
+
+    @pytest.mark.parametrize(
+        ("svgd", "message"),
+        [
+            (b"M0 0L1 1Z1 1", "Command Z takes 0"),
+            (b"L1 1", "SVG path data must start with a move"),
+            (b"M0 0L1", "Command L takes (some multiple of) 2"),
+            (b"M0 0L1 1b", "Unrecognized content 'b' in input"),
+        ],
+    )
+    def test_validate(self, svgd: bytes, message: str):
+        """Raise the same errors as str input."""
+        with pytest.raises(ValueError) as excinfo:
+            _ = svgd_split_buffer(svgd)
+        assert message in str(excinfo.value)
+
+
+class TestIterCpts:
+    """Lazily yield control points as a path data string is parsed."""
+
+    @pytest.mark.parametrize(
+        "svgd",
+        [
+            potrace_output,
+            "M0 0L1 1M2 2M3 3L4 4",
+            "M1052 242H536L465 0H2L553 1466h494L1598 0H1124Zm-95 317-162 527L634 559Z",
+            "M0 0L1 1 2 2 3 3 3 3L4 4ZL5 5",
+            "M.5 .5C1 0 2 0 2.5 .5s.5 1.5 0 2S1 3 .5 .5Zm0 0C1 0 2 0 2.5 .5",
+            "",
+        ],
+    )
+    def test_match_get_cpts(self, svgd: str):
+        """Yield the same curves as get_cpts_from_svgd."""
+        expect = get_cpts_from_svgd(svgd, resolution=2)
+        assert list(iter_cpts_from_svgd(svgd, resolution=2)) == expect
+        subpaths = list(iter_subpaths(svgd, resolution=2))
+        assert [x for y in subpaths for x in y] == expect
+
+    def test_subpaths(self):
+        """Split curves at move commands, including the implied move after Z."""
+        subpaths = list(iter_subpaths("M0 0H1V1ZL2 2M5 5H6"))
+        assert subpaths == [
+            [[(0, 0), (1, 0)], [(1, 0), (1, 1)], [(1, 1), (0, 0)]],
+            [[(0, 0), (2, 2)]],
+            [[(5, 5), (6, 5)]],
+        ]
+
+    def test_error_at_point_of_failure(self):
+        """Yield valid curves before raising on invalid content."""
+        curves = iter_cpts_from_svgd("M0 0L1 0L1 1L0 1L0 2 3")
+        assert next(curves) == [(0, 0), (1, 0)]
+        with pytest.raises(ValueError) as excinfo:
+            _ = list(curves)
+        assert "Command L takes (some multiple of) 2" in str(excinfo.value)
+
+
+class TestLazyFormatting:
+    """Compute only the string representations an output mode needs."""
+
+    def test_no_formatting_for_cpts(self, monkeypatch: pytest.MonkeyPatch):
+        """Do not format any numbers for cpts when resolution is None."""
+
+        def fail(*_: object) -> str:
+            msg = "format_number called"
+            raise AssertionError(msg)
+
+        expect = get_cpts_from_svgd(potrace_output)
+        monkeypatch.setattr(svg_data, "format_number", fail)
+        assert get_cpts_from_svgd(potrace_output) == expect
+
+    def test_no_relative_strings_for_absolute(self, monkeypatch: pytest.MonkeyPatch):
+        """Do not compute relative strings for absolute output."""
+        formatted: list[float | str] = []
+
+        def count(number: float | str, resolution: int | None = None) -> str:
+            formatted.append(number)
+            return format_number(number, resolution)
+
+        expect = PathCommands.from_svgd(potrace_output, resolution=2).rel_svgd
+        monkeypatch.setattr(svg_data, "format_number", count)
+        cmds = PathCommands.from_svgd(potrace_output, resolution=2)
+        _ = cmds.abs_svgd
+        num_absolute = len(formatted)
+        assert cmds.rel_svgd == expect
+        assert len(formatted) > num_absolute
+
 
 class TestZeroLengthCurves:
     """Skip zero-length curves when generating SVG data from cpts."""
@@ -343,6 +592,39 @@ class TestZeroLengthCurves:
         svgd = get_svgd_from_cpts([])
         assert svgd == ""
 
+    def test_relative_after_removed_command(self):
+        """Relative commands after a removed command do not drift."""
+        svgd = "M0 0l.3 0l.3 0l.3 0l1 0"
+        assert format_svgd_absolute(svgd, 0) == "M0 0H2"
+
+
+class TestMergedRelativeLines:
+    """Merged relative lines keep their absolute end points."""
+
+    def test_merge_relative_lines(self):
+        """The merged line ends where the second relative line ends."""
+        assert format_svgd_absolute("M0 0l10 0.4l10 0.4", 0) == "M0 0 20 1"
+
+    def test_merge_relative_lines_at_resolution(self):
+        """Do not re-base the second relative line on the start of the first."""
+        assert format_svgd_absolute("M0 0l10 1l10 1.2", 0) == "M0 0 20 2"
+
+    def test_merge_then_continue(self):
+        """Commands after a merged line are relative to its true end."""
+        svgd = "M0 0l10 1l10 1.2l0 5"
+        assert format_svgd_absolute(svgd, 0) == "M0 0 20 2V7"
+
+    def test_merge_without_resolution(self):
+        """Merging is exact without a resolution. This once gave "M0 0H1"."""
+        svgd = "M0 0l.3 0l.3 0l.3 0l1 0"
+        assert format_svgd_absolute(svgd) == "M0 0H1.9"
+
+    def test_close_after_merge(self):
+        """A path that returns to its start closes. This once gave "M0 0 10 1-10-1"."""
+        svgd = "M0 0l10 1l10 1.2l-20-2.2"
+        assert format_svgd_absolute(svgd, 0) == "M0 0 20 2Z"
+        assert format_svgd_relative(svgd, 0) == "m0 0 20 2z"
+
 
 class TestLinearCurves:
     """Test that linear curves are converted to L commands."""
@@ -360,7 +642,484 @@ class TestLinearCurves:
         assert_svgd_equal(cmds.abs_svgd, "M0 0 10 10")
 
 
+class TestDegreeElevatedCubics:
+    """Write cubics that are degree-elevated quadratics as quadratics."""
+
+    def test_exact(self):
+        """An exactly elevated cubic is a quadratic at any resolution."""
+        svgd = "M0 0C2 2 4 2 6 0C8-2 10-2 12 0"
+        assert format_svgd_absolute(svgd) == "M0 0Q3 3 6 0T12 0"
+
+    def test_cpts_as_given(self):
+        """Control points are the cubic control points of the input."""
+        svgd = "M0 0C2 2 4 2 6 0"
+        assert get_cpts_from_svgd(svgd) == [[(0, 0), (2, 2), (4, 2), (6, 0)]]
+
+    def test_within_resolution(self):
+        """A rounded elevated cubic is a quadratic only at a lower resolution."""
+        svgd = "M0 0C.6667 .6667 1.3333 .6667 2 0"
+        assert format_svgd_absolute(svgd, 3) == "M0 0Q1 1 2 0"
+        assert format_svgd_absolute(svgd, 5) == "M0 0C.6667.6667 1.3333.6667 2 0"
+
+    def test_rounded_control_point(self):
+        """Keep a cubic if the rounded quadratic would write different handles."""
+        svgd = "M0 0C0 1 .5 1 1.5 0"
+        assert format_svgd_absolute(svgd, 1) == "M0 0Q0 1.5 1.5 0"
+        assert format_svgd_absolute(svgd, 0) == "M0 0C0 1 0 1 2 0"
+
+    def test_smooth_cubic_after_reduced(self):
+        """An S after a reduced cubic reflects the cubic handle of the input."""
+        svgd = "M0 0C1 1 2 1 3 0S5-1 6 0"
+        assert get_cpts_from_svgd(svgd)[1] == [(3, 0), (4, -1), (5, -1), (6, 0)]
+        assert format_svgd_absolute(svgd) == "M0 0Q1.5 1.5 3 0T6 0"
+
+    def test_smooth_quadratic_after_reduced(self):
+        """A T after a cubic implies the current point, not the reduced handle."""
+        svgd = "M0 0C2 2 4 2 6 0T12 0"
+        assert get_cpts_from_svgd(svgd)[1] == [(6, 0), (12, 0)]
+        assert format_svgd_shortest(svgd) == "M0 0Q3 3 6 0h6"
+
+    def test_not_elevated(self):
+        """Keep a cubic that is not a quadratic."""
+        svgd = "M0 0C0 2 4 2 6 0"
+        assert format_svgd_absolute(svgd, 0) == svgd
+
+    def test_from_cpts(self):
+        """Elevated cubics from control points are written as quadratics."""
+        p0, q, p3 = (0.0, 0.0), (1.5, 3.0), (3.0, 0.0)
+        p1 = (p0[0] + 2 / 3 * (q[0] - p0[0]), p0[1] + 2 / 3 * (q[1] - p0[1]))
+        p2 = (p3[0] + 2 / 3 * (q[0] - p3[0]), p3[1] + 2 / 3 * (q[1] - p3[1]))
+        assert get_svgd_from_cpts([[p0, p1, p2, p3]], 6) == "M0 0Q1.5 3 3 0"
+
+
 cpts = [
     [(0, 0), (0, 0), (0, 0), (0, 0)],  # Zero-length quadratic
     [(0, 0), (0, 0), (0, 0), (0, 0)],  # Zero-length quadratic
 ]
+
+
+class TestWriteSvgd:
+    """Write formatted path data to a stream."""
+
+    @pytest.mark.parametrize("mode", list(RelativeOrAbsolute))
+    def test_text_stream(self, mode: RelativeOrAbsolute):
+        """Write the same string the properties return."""
+        cmds = PathCommands.from_svgd(potrace_output, resolution=2)
+        fp = io.StringIO()
+        cmds.write(fp, mode)
+        assert fp.getvalue() == cmds._get_svgd(mode)
+
+    def test_binary_stream(self):
+        """Encode fragments for a binary stream."""
+        fp = io.BytesIO()
+        write_svgd(fp, potrace_output, resolution=2)
+        assert fp.getvalue().decode() == format_svgd_shortest(potrace_output, 2)
+
+    def test_file(self, tmp_path: Path):
+        """Write to text and binary files."""
+        text_path = tmp_path / "text.txt"
+        with text_path.open("w") as f:
+            write_svgd(f, potrace_output, RelativeOrAbsolute.RELATIVE)
+        binary_path = tmp_path / "binary.txt"
+        with binary_path.open("wb") as f:
+            write_svgd(f, potrace_output, RelativeOrAbsolute.RELATIVE)
+        expect = format_svgd_relative(potrace_output)
+        assert text_path.read_text() == expect
+        assert binary_path.read_text() == expect
+
+    def test_empty(self):
+        """Write nothing for an empty path."""
+        fp = io.StringIO()
+        write_svgd(fp, "M1 1")
+        assert fp.getvalue() == ""
+
+
+class TestPickle:
+    """Pickle and copy PathCommands as flat arrays."""
+
+    @pytest.mark.parametrize(
+        "svgd", [potrace_output, "M0 0L1 1M2 2M3 3L4 4", "M0 0A1 1 0 0 1 2 2Z", ""]
+    )
+    def test_round_trip(self, svgd: str):
+        """Recreate the same commands after pickling and deep copying."""
+        cmds = PathCommands.from_svgd(svgd, resolution=2)
+        for copy in (pickle.loads(pickle.dumps(cmds)), copy_module.deepcopy(cmds)):
+            assert copy.svgd == cmds.svgd
+            assert copy.rel_svgd == cmds.rel_svgd
+            assert copy.abs_svgd == cmds.abs_svgd
+            assert [x.cmd for x in copy] == [x.cmd for x in cmds]
+
+    def test_long_path(self):
+        """Pickle a path longer than the recursion limit."""
+        cpts = [[(i, i % 2), (i + 1, (i + 1) % 2)] for i in range(5000)]
+        cmds = PathCommands.from_cpts(cpts)
+        assert pickle.loads(pickle.dumps(cmds)).cpts == cmds.cpts
+
+    def test_freed_without_gc(self):
+        """Free every command by reference counting alone."""
+        cmds = PathCommands.from_svgd(potrace_output)
+        refs = [weakref.ref(x) for x in cmds]
+        gc.disable()
+        try:
+            del cmds
+            assert all(x() is None for x in refs)
+        finally:
+            gc.enable()
+
+    def test_build_from_tail(self):
+        """Keep every command alive through the last command."""
+        node = PathCommand.append("M", [0, 0], resolution=2)
+        node = PathCommand.append("L", [1, 1], node)
+        node = PathCommand.append("L", [2, 0], node)
+        _ = gc.collect()
+        assert PathCommands(node).svgd == "M0 0 1 1 2 0"
+
+    def test_tail_outlives_commands(self):
+        """Format from the last command after the container is freed."""
+        cmds = PathCommands.from_svgd(potrace_output)
+        expect = cmds.svgd
+        tail = cmds.tail
+        del cmds
+        _ = gc.collect()
+        assert PathCommands(tail).svgd == expect
+
+    def test_walk_from_head(self):
+        """Reach every command through next from the first command."""
+        cmds = PathCommands.from_svgd(potrace_output)
+        from_head = PathCommands(cmds.head)
+        del cmds
+        _ = gc.collect()
+        assert from_head.svgd == format_svgd_shortest(potrace_output)
+
+    def test_released_commands_format_alone(self):
+        """Format a command after the commands before it are freed."""
+        parser = SvgdParser()
+        cmds = [*parser.feed("M1 1q1 1 2 0t2 0t2 0"), *parser.close()]
+        last = cmds[-1]
+        del cmds, parser
+        _ = gc.collect()
+        assert last.get_svgd(RelativeOrAbsolute.RELATIVE) == "t2 0"
+        assert last.get_svgd(RelativeOrAbsolute.ABSOLUTE) == "T7 1"
+
+
+class TestConvert:
+    """Get several output formats from one parse."""
+
+    @pytest.mark.parametrize(
+        "svgd",
+        [potrace_output, "M0 0L1 1M2 2M3 3L4 4", "M0 0C1 1 2 2 3 0Z", "M1 1", ""],
+    )
+    @pytest.mark.parametrize("resolution", [None, 1])
+    def test_matches_separate_calls(self, svgd: str, resolution: int | None):
+        """Each output is the same as the matching function's."""
+        result = convert(svgd, resolution=resolution)
+        assert result.abs_svgd == format_svgd_absolute(svgd, resolution)
+        assert result.rel_svgd == format_svgd_relative(svgd, resolution)
+        assert result.svgd == format_svgd_shortest(svgd, resolution)
+        assert result.cpts == get_cpts_from_svgd(svgd, resolution)
+
+    def test_only_requested(self):
+        """Outputs that were not requested are None."""
+        result = convert("M0 0L1 1", ["rel"])
+        assert result.rel_svgd == "m0 0 1 1"
+        assert (result.abs_svgd, result.svgd, result.cpts) == (None, None, None)
+
+    def test_arc_without_cpts(self):
+        """Arc paths convert as long as cpts are not requested."""
+        result = convert("M0 0A1 1 0 0 1 2 2", ["abs", "shortest"])
+        assert result.svgd == "M0 0A1 1 0 012 2"
+        with pytest.raises(ValueError, match="Arc commands"):
+            _ = convert("M0 0A1 1 0 0 1 2 2", ["cpts"])
+
+    def test_unknown_output(self):
+        """Raise a ValueError for an unknown output name."""
+        with pytest.raises(ValueError, match="Unknown convert outputs"):
+            _ = convert("M0 0L1 1", ["abs", "json"])  # pyright: ignore[reportArgumentType]
+
+
+class TestFormatResolutions:
+    """Format one path at several resolutions."""
+
+    @pytest.mark.parametrize(
+        "svgd",
+        [
+            potrace_output,
+            "M0 0L.4 .8L1 2M3 3h.004v1.0004Z",
+            "M0 0C1 1 2 2.01 3 3S5 4 6 3",  # S after a curve that straightens
+            "M1 1",
+            "",
+        ],
+    )
+    def test_matches_separate_calls(self, svgd: str):
+        """Each result is the same as formatting at that resolution alone."""
+        resolutions = (0, 1, 2, 4, None)
+        for mode, func in (
+            (RelativeOrAbsolute.SHORTEST, format_svgd_shortest),
+            (RelativeOrAbsolute.ABSOLUTE, format_svgd_absolute),
+            (RelativeOrAbsolute.RELATIVE, format_svgd_relative),
+        ):
+            result = format_svgd_resolutions(svgd, resolutions, mode)
+            assert list(result) == list(resolutions)
+            assert result == {r: func(svgd, r) for r in resolutions}
+
+    def test_snap_matches_format(self):
+        """Snapped values are equal exactly when formatted strings are equal."""
+        values = [i / 8 - 2 for i in range(33)] + [0.0049, -0.0051, 1e-7, -1e-7]
+        for resolution in (0, 1, 2):
+            node = PathCommand("M", [0, 0], resolution=resolution)
+            for a, b in ((a, b) for a in values for b in values):
+                same_str = node.format_number(a) == node.format_number(b)
+                assert same_str == (node.snap(a) == node.snap(b))
+
+
+class TestCompressed:
+    """Choose the string that is smallest after compression."""
+
+    @pytest.mark.parametrize("resolution", [None, 2])
+    def test_smallest_compressed(self, resolution: int | None):
+        """No fixed format is smaller after compression."""
+        result = format_svgd_compressed(potrace_output, resolution)
+        others = [
+            format_svgd_absolute(potrace_output, resolution),
+            format_svgd_relative(potrace_output, resolution),
+            format_svgd_shortest(potrace_output, resolution),
+        ]
+        assert get_cpts_from_svgd(result) == get_cpts_from_svgd(others[0])
+        size = len(zlib.compress(result.encode(), 9))
+        assert all(size <= len(zlib.compress(x.encode(), 9)) for x in others)
+
+    @pytest.mark.parametrize("resolution", [None, 2])
+    def test_smallest_on_benchmark(self, resolution: int | None):
+        """No fixed format is smaller for any path in the benchmark corpus."""
+        funcs = (format_svgd_absolute, format_svgd_relative, format_svgd_shortest)
+        for svgd in get_corpus():
+            result = format_svgd_compressed(svgd, resolution)
+            size = len(zlib.compress(result.encode(), 9))
+            for func in funcs:
+                other = func(svgd, resolution)
+                assert size <= len(zlib.compress(other.encode(), 9))
+
+    def test_not_always_shortest(self):
+        """A longer string can compress smaller."""
+        svgd = "".join(f"M{i * 7} {i * 3}c1 2 3 4 5 6s7 8 9 0" for i in range(40))
+        result = format_svgd_compressed(svgd)
+        assert len(result) > len(format_svgd_shortest(svgd))
+        assert get_cpts_from_svgd(result) == get_cpts_from_svgd(svgd)
+
+    def test_empty(self):
+        """Return an empty string for a path with no drawing commands."""
+        assert format_svgd_compressed("M1 1") == ""
+
+    def test_single_command(self):
+        """A single command cannot be formatted for compression."""
+        node = PathCommands.from_svgd("M0 0H10").tail
+        with pytest.raises(ValueError, match="compression"):
+            _ = node.get_svgd(RelativeOrAbsolute.COMPRESSED)
+        assert node.get_svgd(RelativeOrAbsolute.SHORTEST) == "H10"
+
+    def test_tie(self):
+        """Prefer the shorter string among ties."""
+        assert get_smallest_compressed("M0 0H10", "M0 0 10 0") == "M0 0H10"
+
+    def test_no_candidates(self):
+        """Raise a ValueError with no candidates."""
+        with pytest.raises(ValueError, match="candidate"):
+            _ = get_smallest_compressed()
+
+
+class TestEditCommands:
+    """Replace, insert, and delete segments of a PathCommands instance."""
+
+    @pytest.mark.parametrize("index", [0, 1, 50, -2, -1])
+    def test_replace(self, index: int):
+        """Match the path built from scratch from the edited control points."""
+        cpts = get_cpts_from_svgd(potrace_output)
+        cmds = PathCommands.from_svgd(potrace_output)
+        _ = cmds.svgd
+        start, *_, end = cpts[index]
+        new = [start, (start[0] + 3, start[1] - 5), end]
+        cmds.replace(index, new)
+        cpts[index] = new
+        assert cmds.svgd == get_svgd_from_cpts(cpts)
+        assert cmds.abs_svgd == PathCommands.from_cpts(cpts).abs_svgd
+
+    def test_replace_moves_next_start(self):
+        """The next segment starts where the new segment ends."""
+        cmds = PathCommands.from_svgd("M0 0L10 0L10 10L20 10")
+        cmds.replace(0, [(0, 0), (5, 6)])
+        assert cmds.abs_svgd == "M0 0 5 6 10 10H20"
+
+    def test_replace_disjoint(self):
+        """Insert a move if the new segment starts away from the current point."""
+        cmds = PathCommands.from_svgd("M0 0H10V10H20")
+        cmds.replace(1, [(10, 2), (10, 10)])
+        assert cmds.abs_svgd == "M0 0H10M10 2V10H20"
+        cmds.replace(1, [(10, 3), (10, 10)])
+        assert cmds.abs_svgd == "M0 0H10M10 3V10H20"
+
+    def test_close(self):
+        """A segment that ends at the subpath start closes the subpath."""
+        cmds = PathCommands.from_svgd("M0 0H10V10H5")
+        cmds.replace(2, [(10, 10), (0, 0)])
+        assert cmds.abs_svgd == "M0 0H10V10Z"
+        cmds.replace(2, [(10, 10), (0, 10)])
+        assert cmds.abs_svgd == "M0 0H10V10H0"
+
+    def test_merge(self):
+        """A new line collinear with the line before it is merged."""
+        cmds = PathCommands.from_svgd("M0 0H10L20 10")
+        cmds.replace(1, [(10, 0), (20, 0)])
+        assert cmds.abs_svgd == "M0 0H20"
+
+    def test_insert(self):
+        """Insert before a segment or at the end of the path."""
+        cmds = PathCommands.from_svgd("M0 0H10V10")
+        cmds.insert(1, [(10, 0), (15, 5), (10, 5)])
+        assert cmds.abs_svgd == "M0 0H10Q15 5 10 5V10"
+        cmds.insert(99, [(10, 10), (0, 10)])
+        assert cmds.abs_svgd == "M0 0H10Q15 5 10 5V10H0"
+        cmds.insert(-1, [(10, 10), (5, 20)])
+        assert cmds.abs_svgd == "M0 0H10Q15 5 10 5V10L5 20 0 10"
+
+    def test_insert_first(self):
+        """Insert a segment at the start of a path."""
+        cmds = PathCommands.from_svgd("M0 0H10")
+        cmds.insert(0, [(5, 5), (0, 0)])
+        assert cmds.abs_svgd == "M5 5 0 0H10"
+        assert cmds.head.abs_vals == [5, 5]
+
+    def test_delete(self):
+        """The next segment starts where the deleted segment started."""
+        cmds = PathCommands.from_svgd("M0 0H10V10H20")
+        cmds.delete(1)
+        assert cmds.abs_svgd == "M0 0H10L20 10"
+
+    def test_delete_subpath(self):
+        """Deleting the only segment of a subpath removes its move."""
+        cmds = PathCommands.from_svgd("M0 0H10M20 20H30M40 40H50")
+        cmds.delete(1)
+        assert cmds.abs_svgd == "M0 0H10M40 40H50"
+        cmds.delete(-1)
+        assert cmds.abs_svgd == "M0 0H10"
+        assert cmds.tail.abs_vals == [10, 0]
+
+    def test_arc(self):
+        """Edit a path with arcs."""
+        cmds = PathCommands.from_svgd("M0 0A5 5 0 0 1 10 0L20 0")
+        cmds.replace(1, [(10, 0), (20, 5)])
+        assert cmds.abs_svgd == "M0 0A5 5 0 0110 0L20 5"
+        cmds.delete(0)
+        assert cmds.abs_svgd == "M0 0 20 5"
+
+    def test_resolution(self):
+        """New segments are formatted at the resolution of the path."""
+        cmds = PathCommands.from_svgd("M0 0H10V10", resolution=1)
+        cmds.replace(1, [(10, 0), (10.123, 10.456)])
+        assert cmds.abs_svgd == "M0 0H10L10.1 10.5"
+
+    def test_reuse_commands(self):
+        """Commands away from the edit are not created again."""
+        cmds = PathCommands.from_svgd(potrace_output)
+        before = {id(x) for x in cmds}
+        keep = list(cmds)
+        cpts = cmds.cpts
+        cmds.replace(50, [cpts[50][0], (200, 200), cpts[50][-1]])
+        after = [id(x) for x in cmds]
+        assert sum(x not in before for x in after) <= 2
+        assert len(keep) == len(after)
+
+    def test_freed_without_gc(self):
+        """Free every command of an edited path by reference counting alone."""
+        cmds = PathCommands.from_svgd(potrace_output)
+        cmds.replace(3, [cmds.cpts[3][0], (0, 0)])
+        cmds.delete(10)
+        refs = [weakref.ref(x) for x in cmds]
+        gc.disable()
+        try:
+            del cmds
+            assert all(x() is None for x in refs)
+        finally:
+            gc.enable()
+
+    @pytest.mark.parametrize("svgd", ["M0 0H10M20 20H30V30M40 40H50", "M0 0M5 5H10V9"])
+    def test_negative_index(self, svgd: str):
+        """Count negative indices back from the tail."""
+        num_segments = len(get_cpts_from_svgd(svgd))
+        for index in range(-num_segments, 0):
+            from_tail = PathCommands.from_svgd(svgd)
+            from_tail.delete(index)
+            from_head = PathCommands.from_svgd(svgd)
+            from_head.delete(index + num_segments)
+            assert from_tail.abs_svgd == from_head.abs_svgd
+
+    def test_insert_before_first(self):
+        """A negative index before the first segment inserts at the start."""
+        cmds = PathCommands.from_svgd("M0 0H10")
+        cmds.insert(-99, [(5, 5), (0, 0)])
+        assert cmds.abs_svgd == "M5 5 0 0H10"
+
+    def test_bad_index(self):
+        """Raise an IndexError for a missing segment."""
+        cmds = PathCommands.from_svgd("M0 0H10")
+        with pytest.raises(IndexError):
+            cmds.replace(1, [(10, 0), (5, 5)])
+        with pytest.raises(IndexError):
+            cmds.delete(-2)
+
+    def test_bad_cpts(self):
+        """Raise a ValueError for a curve that is not a line, quadratic, or cubic."""
+        cmds = PathCommands.from_svgd("M0 0H10")
+        with pytest.raises(ValueError, match="control points"):
+            cmds.replace(0, [(0, 0)])
+
+
+class TestConcatSvgd:
+    """Join whole paths into one compound path without parsing them."""
+
+    def test_absolute(self):
+        """Join paths that start with M as they are."""
+        assert concat_svgd("M0 0H10", "M5 5l1 1Z") == "M0 0H10M5 5l1 1Z"
+
+    def test_leading_relative_move(self):
+        """Make a relative move absolute after another path."""
+        assert concat_svgd("M0 0H10", "m5 5h1") == "M0 0H10M5 5h1"
+
+    def test_implicit_relative_lines(self):
+        """Keep the numbers after a relative move as relative lines."""
+        assert concat_svgd("M0 0H10", "m5,5 1,1 2-2z") == "M0 0H10M5 5l1,1 2-2z"
+
+    def test_first_path_unchanged(self):
+        """Keep a relative move at the start of the joined path."""
+        assert concat_svgd("m1 2 3 4", "M0 0") == "m1 2 3 4M0 0"
+
+    def test_lone_relative_move(self):
+        """Join a relative move with no commands after it."""
+        assert concat_svgd("M0 0H1", "m1.5.5") == "M0 0H1M1.5.5"
+
+    def test_separators(self):
+        """Drop whitespace and commas at the junctions."""
+        assert concat_svgd(" M0 0H10 ,", "\n", "", " m-1-2h3 ") == "M0 0H10M-1-2h3"
+
+    def test_empty(self):
+        """Return an empty string for no paths."""
+        assert concat_svgd() == ""
+        assert concat_svgd("", " ") == ""
+
+    def test_no_leading_move(self):
+        """Raise a ValueError for a path that does not start with a move."""
+        with pytest.raises(ValueError, match="must start with a move"):
+            _ = concat_svgd("M0 0H10", "L5 5")
+
+    def test_bad_relative_move(self):
+        """Raise a ValueError for a relative move without a point."""
+        with pytest.raises(ValueError, match="two numbers"):
+            _ = concat_svgd("M0 0H10", "m5h1")
+
+    @pytest.mark.parametrize(
+        "format_svgd", [format_svgd_shortest, format_svgd_relative]
+    )
+    def test_same_curves(self, format_svgd: Callable[[str], str]):
+        """Draw every curve of every input path in order."""
+        svgds = [format_svgd("M" + x) for x in potrace_output.split("M") if x] * 3
+        expect = [c for x in svgds for c in get_cpts_from_svgd(x)]
+        assert get_cpts_from_svgd(concat_svgd(*svgds)) == expect
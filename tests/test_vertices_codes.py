@@ -0,0 +1,124 @@
+"""Test conversion between svg path data and matplotlib-style vertices and codes.
+
+:author: Shay Hill
+:created: 2026-10-19
+"""
+
+from array import array
+
+import pytest
+from test_svg_data import potrace_output
+
+from svg_path_data.svg_data import (
+    format_svgd_shortest,
+    get_cpts_from_svgd,
+    get_svgd_from_cpts,
+)
+from svg_path_data.vertices_codes import (
+    CLOSEPOLY,
+    CURVE3,
+    CURVE4,
+    LINETO,
+    MOVETO,
+    STOP,
+    get_svgd_from_vertices_codes,
+    get_vertices_codes_from_svgd,
+)
+
+# fmt: off
+_VERTICES = [
+    0.5, 0.5, 1 / 3, 0.0, 2.0, 0.0, 2.5, 0.5,
+    2 / 3, 2.0, 2.5, 2.5,
+    0.5, 2.5,
+    0.0, 0.0,
+]
+_CODES = [
+    MOVETO, CURVE4, CURVE4, CURVE4,
+    CURVE3, CURVE3,
+    LINETO,
+    CLOSEPOLY,
+]
+# fmt: on
+
+
+def test_to_svgd():
+    """Match the svgd created from the equivalent cpts."""
+    cpts = (
+        ((0.5, 0.5), (1 / 3, 0.0), (2.0, 0.0), (2.5, 0.5)),
+        ((2.5, 0.5), (2 / 3, 2.0), (2.5, 2.5)),
+        ((2.5, 2.5), (0.5, 2.5)),
+        ((0.5, 2.5), (0.5, 0.5)),
+    )
+    result = get_svgd_from_vertices_codes(_VERTICES, _CODES, 2)
+    assert result == get_svgd_from_cpts(cpts, 2)
+
+
+def test_pairs_and_array_input():
+    """Accept xy pairs and an array of floats."""
+    pairs = list(zip(_VERTICES[::2], _VERTICES[1::2], strict=True))
+    expect = get_svgd_from_vertices_codes(_VERTICES, _CODES)
+    assert get_svgd_from_vertices_codes(pairs, _CODES) == expect
+    assert get_svgd_from_vertices_codes(array("d", _VERTICES), _CODES) == expect
+
+
+def test_no_codes():
+    """Interpret codes=None as a polyline."""
+    result = get_svgd_from_vertices_codes([0, 0, 1, 0, 1, 1])
+    assert result == "M0 0H1V1"
+
+
+def test_stop():
+    """Ignore everything after a STOP code."""
+    result = get_svgd_from_vertices_codes([0, 0, 1, 1, 5, 5], [MOVETO, LINETO, STOP])
+    assert result == "M0 0 1 1"
+
+
+def test_round_trip():
+    """Describe the same curves after a round trip."""
+    vertices, codes = get_vertices_codes_from_svgd(potrace_output)
+    assert len(vertices) == 2 * len(codes)
+    svgd = get_svgd_from_vertices_codes(vertices, codes)
+    expect = format_svgd_shortest(potrace_output)
+    assert get_cpts_from_svgd(svgd) == get_cpts_from_svgd(expect)
+
+
+def test_from_svgd_codes():
+    """Repeat curve codes for each vertex and close with CLOSEPOLY."""
+    vertices, codes = get_vertices_codes_from_svgd("M0 0Q1 1 2 0L2 2ZM5 5C6 6 7 6 5 5")
+    assert list(codes) == [
+        *(MOVETO, CURVE3, CURVE3, LINETO, CLOSEPOLY),
+        *(MOVETO, CURVE4, CURVE4, CURVE4, CLOSEPOLY),
+    ]
+    assert list(vertices[:10]) == [0, 0, 1, 1, 2, 0, 2, 2, 0, 0]
+
+
+def test_empty():
+    """Return empty arrays for an empty path."""
+    vertices, codes = get_vertices_codes_from_svgd("")
+    assert (len(vertices), len(codes)) == (0, 0)
+    assert get_svgd_from_vertices_codes([], []) == ""
+
+
+@pytest.mark.parametrize(
+    ("codes", "message"),
+    [
+        ([LINETO, LINETO], "must start with MOVETO"),
+        ([MOVETO, 7], "Invalid path code 7"),
+        ([MOVETO, CURVE3], "Expected 2 consecutive 3 codes"),
+        ([MOVETO], "Expected one code per vertex"),
+    ],
+)
+def test_invalid_codes(codes: list[int], message: str):
+    """Raise a ValueError for invalid codes."""
+    with pytest.raises(ValueError) as excinfo:
+        _ = get_svgd_from_vertices_codes([0, 0, 1, 1], codes)
+    assert message in str(excinfo.value)
+
+
+def test_numpy():
+    """Accept numpy arrays like those in matplotlib.path.Path."""
+    np = pytest.importorskip("numpy")
+    vertices = np.array(_VERTICES).reshape(-1, 2)
+    codes = np.array(_CODES, dtype=np.uint8)
+    expect = get_svgd_from_vertices_codes(_VERTICES, _CODES)
+    assert get_svgd_from_vertices_codes(vertices, codes) == expect